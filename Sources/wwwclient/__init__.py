@@ -1,4 +1,4 @@
-from wwwclient.browse import Session, fix, quote, retry
+from wwwclient.browse import Session, SessionPool, fix, quote, retry
 from wwwclient.scrape import HTML, URL
 __version___ = "1.0.1"
 # EOF
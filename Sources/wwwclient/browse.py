@@ -16,8 +16,10 @@
 # TODO: Add   sessoin.status, session.headers, session.links(), session.scrape()
 # TODO: Add   session.select() to select a form before submit
 
-import urlparse, urllib, mimetypes, re, os, sys, time, json, random, hashlib, httplib, base64, socket
-from   wwwclient import client, defaultclient, scrape, agents
+import urllib, mimetypes, re, os, sys, time, json, random, hashlib, base64, socket
+import collections, tempfile, threading, contextlib, weakref
+from   wwwclient import client, defaultclient, scrape, agents, uri, cookiejar, hooks, retries, charsets
+from   wwwclient.form import FormTemplate
 
 HTTP               = "http"
 HTTPS              = "https"
@@ -47,27 +49,19 @@ def fix(s, charset='utf-8'):
 					given as unicode string.
 	"""
 	if isinstance(s, unicode): s = s.encode(charset, 'ignore')
-	scheme, netloc, path, qs, anchor = urlparse.urlsplit(s)
+	scheme, netloc, path, qs, anchor = uri.split(s)
 	path = urllib.quote(path, '/%')
-	qs = urllib.quote_plus(qs, ':&=')
-	return urlparse.urlunsplit((scheme, netloc, path, qs, anchor))
+	qs = qs and urllib.quote_plus(qs, ':&=')
+	return uri.unsplit((scheme, netloc, path, qs, anchor))
 
-def retry( function, times=5, wait=(0.1, 0.5, 1, 1.5, 2), exception=None):
+def retry( function, times=5, wait=(0.1, 0.5, 1, 1.5, 2), exception=Exception ):
 	"""Retries the given function at most `times`, waiting wait seconds. If
 	wait is an array, the `wait[0]` will be waited on the first try, 
-	`wait[1]` on the second, and so on."""
-	if times <= 0:
-		raise exception
-	if type(wait) in (tuple, list):
-		delay = wait[0]
-		wait  = wait[1:] if len(wait) > 1 else wait
-	else:
-		delay = wait
-	try:
-		return function()
-	except Exception, e:
-		time.sleep(delay)
-		return retry(function, times - 1, wait, e)
+	`wait[1]` on the second, and so on. Only the given `exception` (a class or
+	tuple of classes) is retried. See 'retries.Policy' for more options."""
+	if type(wait) not in (tuple, list): wait = (wait,)
+	policy = retries.Policy(retries=times - 1, delays=wait, jitter=0, exceptions=exception)
+	return policy.call(function)
 
 # -----------------------------------------------------------------------------
 #
@@ -79,54 +73,81 @@ class Pairs:
 	"""Pairs are list of pairs (name,values) quite similar to
 	dictionaries, excepted that there can be multiple values for a single key,
 	and that the order of the keys is preserved. They can be easily converted to
-	URL parameters, headers and cookies."""
+	URL parameters, headers and cookies.
+
+	Pairs maintain an index of the positions of each name (folded, that is
+	lowercased and stripped), so that lookups and insertions do not need to
+	scan the list of pairs. The 'pairs' list should then be considered as
+	read-only."""
 
 	def __init__( self, params=None ):
-		self.pairs = []
+		self.pairs  = []
+		self._index = {}
+		self._count = {}
 		self.merge(params)
 
+	@staticmethod
+	def fold( name ):
+		"""Returns the folded (case-insensitive) version of the given name."""
+		if type(name) in (str, unicode): return name.lower().strip()
+		return name
+
 	def set( self, name, value=None, replace=False ):
 		"""Sets the given name to hold the given value. Every previous value set
 		or added to the given name will be cleared."""
 		if replace:
-			i = 0
-			for hname, hvalue in self.pairs:
-				if name.lower() == hname.lower(): break
-				i += 1
-			if i == len(self.pairs):
+			positions = self._index.get(self.fold(name))
+			if not positions:
 				self.add(name,value)
 			else:
+				i = positions[0]
+				self._uncount(self.pairs[i])
 				self.pairs[i] = (name,value)
+				self._countPair(self.pairs[i])
 		else:
 			self.add(name, value)
 	
 	def get( self, name ):
 		"""Gets the pair with the given name (case-insensitive)"""
-		for key, value in self.pairs:
-			if name.lower().strip() == key.lower().strip():
-				return value
+		positions = self._index.get(self.fold(name))
+		if positions:
+			return self.pairs[positions[0]][1]
 		return None
 
+	def getAll( self, name ):
+		"""Gets all the values with the given name (case-insensitive), in
+		order."""
+		return list(self.pairs[i][1] for i in self._index.get(self.fold(name), ()))
+
 	def has( self, name ):
 		"""Tells if the pair has a field with the given name
 		(case-insensitive)"""
-		for key, value in self.pairs:
-			if name.lower().strip() == key.lower().strip():
-				return True
-		return False
+		return bool(self._index.get(self.fold(name)))
 
 	def add( self, name, value=None ):
 		"""Adds the given value to the given name. This does not destroy what
 		already existed. (if the pair already exists, it is not added twice."""
 		if type(name) == tuple and len(name) == 2:
-			if name not in self.pairs: self.pairs.append(name)
+			pair = name
 		else:
 			pair = (name,value)
-			if pair not in self.pairs: self.pairs.append((name, value))
+		if self._contains(pair): return
+		self._index.setdefault(self.fold(pair[0]), []).append(len(self.pairs))
+		self.pairs.append(pair)
+		self._countPair(pair)
 	
 	def clear( self, name ):
 		"""Clears all the (name,values) pairs which have the given name."""
-		self.pairs = filter(lambda x:x[0]!= name, self.pairs)
+		pairs = filter(lambda x:x[0]!= name, self.pairs)
+		if len(pairs) != len(self.pairs): self._reindex(pairs)
+
+	def copy( self ):
+		"""Returns a copy of these pairs."""
+		res = Pairs()
+		res.pairs  = list(self.pairs)
+		res._index = dict((k, list(v)) for k, v in self._index.items())
+		res._count = dict(self._count)
+		return res
 
 	def merge( self, parameters ):
 		"""Merges the given parameters into this parameters list."""
@@ -148,12 +169,46 @@ class Pairs:
 		elif type(parameters) in (str, unicode):
 			return self.merge(parameters.split("\n"))
 		elif isinstance(parameters, Pairs):
-			for name, value in parameters.pairs:
-				self.add(name, value)
+			for pair in parameters.pairs:
+				self.add(pair)
 		else:
 			raise Exception("Pair.merge: Unsupported type for merging %s" % (parameters))
 		return self
 
+	def _contains( self, pair ):
+		"""Tells if the given pair is already registered."""
+		try:
+			return pair in self._count
+		except TypeError:
+			# Unhashable values (lists, etc) are looked up using the index
+			for i in self._index.get(self.fold(pair[0]), ()):
+				if self.pairs[i] == pair: return True
+			return False
+
+	def _countPair( self, pair ):
+		try:
+			self._count[pair] = self._count.get(pair, 0) + 1
+		except TypeError:
+			pass
+
+	def _uncount( self, pair ):
+		try:
+			count = self._count.get(pair, 0) - 1
+		except TypeError:
+			return
+		if count > 0: self._count[pair] = count
+		else: self._count.pop(pair, None)
+
+	def _reindex( self, pairs ):
+		"""Replaces the pairs by the given list, rebuilding the index."""
+		self.pairs  = []
+		self._index = {}
+		self._count = {}
+		for pair in pairs:
+			self._index.setdefault(self.fold(pair[0]), []).append(len(self.pairs))
+			self.pairs.append(pair)
+			self._countPair(pair)
+
 	def asURL( self ):
 		"""Returns an URL-encoded version of this parameters list."""
 		return urllib.urlencode(self.pairs)
@@ -270,16 +325,16 @@ class Request:
 		if value == client:
 			return self._headers.get(name)
 		else:
-			self._headers.set(name, str(value), replace=False)
+			self._headers.set(name, str(value), replace=replace)
 
 	def headers( self ):
 		"""Returns the headers for this request as a Pairs instance."""
-		headers = Pairs(self._headers)
+		headers = self._headers.copy()
 		# Takes care of cookies
 		if self._cookies.pairs:
 			cookie_header = headers.get("Cookie")
 			if cookie_header:
-				headers.set("Cookie", cookie_header + "; " + self._cookies.asCookies())
+				headers.set("Cookie", cookie_header + "; " + self._cookies.asCookies(), replace=True)
 			else:
 				headers.set("Cookie", self._cookies.asCookies())
 		return headers
@@ -337,9 +392,25 @@ class Transaction:
 		self._request    = request
 		self._status     = None
 		self._cookies    = Pairs()
+		self._attempts   = 0
 		self._newCookies = None
+		self._setCookies = None
+		self._redirect   = None
 		self._done       = False
 		self._responses  = []
+		self._spilled    = None
+		self._released   = False
+		self._charset    = None
+		self._text       = None
+		self._tags       = None
+		self._tree       = None
+		self._links      = None
+		self._started    = None
+		self._ended      = None
+		self._previous   = None
+		self._timings    = None
+		self._validated  = None
+		self._unmodified = False
 
 	def session( self ):
 		"""Returns this transaction session"""
@@ -349,10 +420,19 @@ class Transaction:
 		"""Returns this transaction request"""
 		return self._request
 
+	def method( self ):
+		"""Returns the method of this transaction request"""
+		return self._request.method()
+
 	def status( self ):
 		"""Returns the session status"""
 		return self._status
 
+	def attempts( self ):
+		"""Returns the number of times this transaction was sent, which is more
+		than one when it was retried."""
+		return self._attempts
+
 	def cookies( self ):
 		"""Returns this transaction cookies (including the new cookies, if the
 		transaction is set to merge cookies)"""
@@ -368,71 +448,174 @@ class Transaction:
 		"""Returns the list of new cookies."""
 		return self._newCookies
 
+	def setCookies( self ):
+		"""Returns the list of 'Set-Cookie' header values received by the
+		response (with their attributes)."""
+		return self._setCookies
+
 	def forms( self, name=None ):
 		"""Returns a dictionary with the forms contained in the response. If a
 		'name' is given the form with the given name will be returned."""
 		assert self._done
-		forms = scrape.HTML.forms(self.data())
+		forms = scrape.HTML.forms(self.tags())
+		# Forms are submitted in the charset of their page
+		for form in forms.values(): form.encoding = self.charset()
 		if name is None:
 			return forms
 		else:
 			return forms.get(name)
 
 	def links( self ):
-		"""Returns a dictionary with the links contained in the response. This
-		makes use of the scraping module."""
+		"""Returns the list of '(tag name, url)' links contained in the
+		response. The links are read from the attributes of the response tags
+		(see 'tags()'), and are only looked for once."""
 		assert self._done
-		return scrape.HTML.links(self.data())
+		if self._links is None:
+			self._links = list(scrape.HTML.links(self.tags()))
+		return self._links
 
 	def body( self ):
 		"""Returns the response data (implies that the transaction was
-		previously done)"""
+		previously done). If the body was released by the session history,
+		it is read back from disk when it was spilled, or 'None' is returned
+		when it was dropped."""
+		if self._spilled:
+			with file(self._spilled, "rb") as f:
+				return f.read()
 		if self._responses:
 			return self._responses[-1][self.BODY]
 		else:
 			return None
 
+	def size( self ):
+		"""Returns the number of bytes held in memory by the response
+		bodies of this transaction."""
+		total = 0
+		for response in self._responses:
+			if response[self.BODY]: total += len(response[self.BODY])
+		return total
+
+	def release( self, path=None ):
+		"""Releases the response bodies held in memory by this transaction. If
+		a 'path' is given, the last body is written (spilled) to this file and
+		will be read back by 'body()', otherwise it is simply dropped."""
+		if self._released: return self
+		if path and self._responses:
+			with file(path, "wb") as f:
+				f.write(self._responses[-1][self.BODY] or "")
+			self._spilled = path
+		for response in self._responses:
+			response[self.BODY] = None
+		self._text     = None
+		self._tags     = None
+		self._tree     = None
+		self._links    = None
+		self._released = True
+		return self
+
+	def released( self ):
+		"""Tells if the response bodies were released (see 'release()')."""
+		return self._released
+
 	def data( self ):
 		"""Returns the response data (implies that the transaction was
 		previously done)"""
 		return self.body()
 	
+	def charset( self ):
+		"""Returns the charset of the response body, as detected by
+		'charsets.detect' from its BOM, its 'Content-Type' header or its
+		'<meta>' elements."""
+		if self._charset is None:
+			body          = self.body() or ""
+			headers       = self._responses and self.headers() or Pairs()
+			self._charset = charsets.detect(body, headers.get("Content-Type"))[0]
+		return self._charset
+
+	def text( self ):
+		"""Returns the response body decoded as unicode (see 'charset()').
+		The body is decoded once, the scraping methods ('tags()', 'asTree()',
+		'forms()' and 'query()') working on the decoded text."""
+		if self._text is None:
+			body = self.body()
+			if body is None: return None
+			self._text = charsets.decode(body, self.charset())
+		return self._text
+
 	def dataAsJSON( self ):
 		return json.loads(self.data())
 
 	def redirect( self ):
 		"""Returns the URL to which the response redirected, if any."""
-		return self._client.redirect()
+		return self._redirect
 
 	def url( self ):
 		"""Returns the requested URL."""
 		return self.request().url()
 
+	def started( self ):
+		"""Returns the time at which the request was sent, or 'None'."""
+		return self._started
+
+	def duration( self, redirects=False ):
+		"""Returns the time (in seconds) elapsed between the sending of the
+		request and the reception of the response, or 'None' if the
+		transaction was not done. When 'redirects' is true, the time spent in
+		the redirects that led to this transaction is included."""
+		if self._started is None or self._ended is None: return None
+		res = self._ended - self._started
+		if redirects and self._previous:
+			res += self._previous.duration(True) or 0
+		return res
+
+	def timings( self ):
+		"""Returns the 'client.Timings' of the request (DNS, connect, TLS,
+		time to first byte, transfer and parse times, and bytes sent and
+		received), or 'None' if the transaction was not done."""
+		return self._timings
+
+	def notModified( self ):
+		"""Tells if the server answered '304 Not Modified' to the conditional
+		request sent for this transaction, in which case the response (and its
+		parsed tree) is the one stored by the session 'Validators'."""
+		return self._unmodified
+
+	def previous( self ):
+		"""Returns the transaction that redirected to this one, if any."""
+		return self._previous
+
+	def redirectCount( self ):
+		"""Returns the number of redirects that were followed to get to this
+		transaction."""
+		count       = 0
+		transaction = self._previous
+		while transaction:
+			count      += 1
+			transaction = transaction._previous
+		return count
+
 	def do( self ):
 		"""Executes this transaction. This sends the request to the client which
 		actually sends the data to the transport layer."""
 		# We do not do a transaction twice
 		if self._done: return
-		# We prepare the headers
 		request  = self.request()
-		headers  = request.headers()
 		response = None
 		# if self._verbose >= 1:
 		# 	self._session._log(request.method(), request.url())
-		# We merge the session cookies into the request
-		request.cookies().merge(self.session().cookies())
-		# As well as this transaction cookies
-		request.cookies().merge(self.cookies())
+		headers  = self._prepare()
+		self._attempts += 1
+		if hooks.ACTIVE: hooks.fire(hooks.BEFORE_REQUEST, self)
 		# We send the request as a GET
 		if request.method() == GET:
 			responses = self._client.GET(
 				request.url(),
-				headers=request.headers().asHeaders()
+				headers=headers
 			)
 		elif request.method() == HEAD:
 			responses = self._client.HEAD(
 				request.url(),
-				headers=request.headers().asHeaders()
+				headers=headers
 			)
 		# Or as a POST
 		elif request.method() == POST:
@@ -441,16 +624,71 @@ class Transaction:
 				data=request.data(),
 				attach=request.attachments(),
 				fields=request.fields().asFields(),
-				headers=request.headers().asHeaders()
+				headers=headers
 			)
 		# The method may be unsupported
 		else:
 			raise Exception("Unsupported method:", request.method())
+		return self._absorb(responses)
+
+	def _prepare( self ):
+		"""Merges the cookies into the request and returns its headers, as
+		a list of strings ready to be given to the HTTP client."""
+		request = self.request()
+		# We merge the session cookies matching the request URL into the
+		# request
+		request.cookies().merge(self.session().cookies().forURL(request.url()))
+		# As well as this transaction cookies
+		request.cookies().merge(self.cookies())
+		self._started = time.time()
+		# We prepare the headers (once the cookies are merged)
+		headers    = request.headers()
+		validators = self._session._validators
+		self._validated = None
+		# The request is made conditional when the session has validators for
+		# its URL (unless it already is)
+		if validators is not None and request.method() == GET and not (headers.get("If-None-Match") or headers.get("If-Modified-Since")):
+			self._validated = validators.get(request.url())
+			if self._validated:
+				return headers.asHeaders() + self._validated.conditionalHeaders()
+		return headers.asHeaders()
+
+	def _reset( self ):
+		"""Clears the response of this transaction, so that it can be done
+		again when it is retried."""
+		self._status     = None
+		self._newCookies = None
+		self._setCookies = None
+		self._redirect   = None
+		self._done       = False
+		self._responses  = []
+		self._charset    = None
+		self._text       = None
+		self._tags       = None
+		self._tree       = None
+		self._links      = None
+		self._timings    = None
+		self._validated  = None
+		self._unmodified = False
+
+	def _absorb( self, responses ):
+		"""Updates this transaction with the given responses, and with the
+		state of the HTTP client that just received them."""
 		# We merge the new cookies if necessary
+		self._ended      = time.time()
 		self._status     = self._client.status()
 		self._newCookies = Pairs(self._client.newCookies())
+		self._setCookies = self._client.setCookies()
+		self._redirect   = self._client.redirect()
+		self._timings    = self._client.timings()
 		self._done       = True
 		self._responses += responses
+		validators       = self._session._validators
+		if self._validated and validators is not None and str(self._status) == "304":
+			validators.restore(self._validated, self)
+		elif validators is not None and self.request().method() == GET:
+			validators.store(self)
+		if hooks.ACTIVE: hooks.fire(hooks.AFTER_REQUEST, self)
 		return self
 
 	def done( self ):
@@ -458,8 +696,19 @@ class Transaction:
 		return self._done
 
 	# SCRAPING ________________________________________________________________
+	def tags( self ):
+		"""Returns the response text (see 'text()') as a 'scrape.TagList'. The
+		text is only tokenized once, the tag list being shared by 'forms()' and
+		'asTree()'."""
+		if self._tags is None:
+			self._tags = scrape.HTML.list(self.text() or u"")
+		return self._tags
+
 	def asTree( self ):
-		return scrape.HTML.tree(self.data())
+		if self._tree is None:
+			self._tree = self.tags().tagtree()
+			if hooks.ACTIVE: hooks.fire(hooks.AFTER_TREE, scrape.HTML, self._tree)
+		return self._tree
 
 	def unjson( self ):
 		return json.loads(self.data())
@@ -477,6 +726,363 @@ class Transaction:
 	def __str__( self ):
 		return self.data()
 
+# -----------------------------------------------------------------------------
+#
+# HISTORY
+#
+# -----------------------------------------------------------------------------
+
+class TransactionRecord:
+	"""A lightweight, metadata-only record of a transaction that was evicted
+	from the session history. It only keeps the method, URL, status, headers
+	and body size of the transaction, and the path of the body when it was
+	spilled to disk."""
+
+	def __init__( self, transaction ):
+		request       = transaction.request()
+		self._method  = request.method()
+		self._url     = request.url()
+		self._status  = transaction.status()
+		self._headers = Pairs()
+		self._spilled   = transaction._spilled
+		self._size      = 0
+		self._started   = transaction.started()
+		self._duration  = transaction.duration()
+		self._timings   = transaction.timings()
+		self._redirects = transaction.redirectCount()
+		if transaction._responses:
+			self._headers = transaction.headers()
+		if not self._spilled:
+			self._size = transaction.size()
+		elif os.path.exists(self._spilled):
+			self._size = os.path.getsize(self._spilled)
+
+	def method( self ):
+		return self._method
+
+	def url( self ):
+		return self._url
+
+	def status( self ):
+		return self._status
+
+	def headers( self ):
+		"""Returns the response headers, as a 'Pairs' instance."""
+		return self._headers
+
+	def size( self ):
+		"""Returns the size of the response body (in bytes)."""
+		return self._size
+
+	def started( self ):
+		return self._started
+
+	def duration( self ):
+		"""Returns the duration of the transaction (see
+		'Transaction.duration')."""
+		return self._duration
+
+	def redirectCount( self ):
+		return self._redirects
+
+	def timings( self ):
+		return self._timings
+
+	def body( self ):
+		"""Returns the response body if it was spilled to disk, 'None'
+		otherwise."""
+		if self._spilled and os.path.exists(self._spilled):
+			with file(self._spilled, "rb") as f:
+				return f.read()
+		return None
+
+	def discard( self ):
+		"""Removes the spilled body (if any) from the disk."""
+		if self._spilled and os.path.exists(self._spilled):
+			os.unlink(self._spilled)
+		self._spilled = None
+
+	def __repr__( self ):
+		return "<record:%s %s (%s)>" % (self._method, self._url, self._status)
+
+class History:
+	"""The history stores the transactions of a session, from the oldest to
+	the newest. It keeps at most 'maxTransactions' transactions, and can
+	keep the response bodies they hold below 'maxBytes': when the budget is
+	exceeded, the bodies of the oldest transactions are either dropped
+	('DROP'), or spilled to files in 'directory' ('SPILL'). The last 'keep'
+	transactions always keep their body in memory.
+
+	Transactions evicted from the history are turned into 'TransactionRecord'
+	instances, of which at most 'maxRecords' are kept (none by default)."""
+
+	DROP  = "drop"
+	SPILL = "spill"
+
+	def __init__( self, maxTransactions=10, maxBytes=None, policy=DROP,
+	directory=None, keep=1, maxRecords=0 ):
+		assert policy in (self.DROP, self.SPILL), "Unsupported policy: %s" % (policy)
+		self.maxTransactions = maxTransactions
+		self.maxBytes        = maxBytes
+		self.policy          = policy
+		self.directory       = directory
+		self.keep            = max(1, keep)
+		self._transactions   = collections.deque()
+		self._records        = collections.deque(maxlen=maxRecords or None)
+		self._maxRecords     = maxRecords
+		self._held           = collections.deque()
+		self._bytes          = 0
+		self._counter        = 0
+
+	def add( self, transaction ):
+		"""Adds the given transaction to the history, evicting and releasing
+		older transactions if necessary."""
+		# The previously last transaction is now complete, so that we can
+		# account for the size of its body
+		if len(self._transactions) >= self.keep:
+			previous = self._transactions[-self.keep]
+			if not previous.released():
+				self._held.append(previous)
+				self._bytes += previous.size()
+		self._transactions.append(transaction)
+		while len(self._transactions) > self.maxTransactions:
+			self._evict(self._transactions.popleft())
+		if self.maxBytes is not None:
+			while self._held and self._bytes > self.maxBytes:
+				self._release(self._held.popleft())
+		return transaction
+
+	def last( self ):
+		"""Returns the last transaction, or None."""
+		if not self._transactions: return None
+		return self._transactions[-1]
+
+	def transactions( self ):
+		"""Returns the list of transactions, from the oldest to the newest."""
+		return list(self._transactions)
+
+	def records( self ):
+		"""Returns the list of records for the evicted transactions."""
+		return list(self._records)
+
+	def bytes( self ):
+		"""Returns the number of bytes held by the bodies of the transactions
+		that are subject to the 'maxBytes' budget."""
+		return self._bytes
+
+	def clear( self ):
+		"""Removes all the transactions and records from this history."""
+		for transaction in self._transactions:
+			if transaction._spilled and os.path.exists(transaction._spilled):
+				os.unlink(transaction._spilled)
+		for record in self._records:
+			record.discard()
+		self._transactions.clear()
+		self._records.clear()
+		self._held.clear()
+		self._bytes = 0
+
+	def _release( self, transaction ):
+		self._bytes -= transaction.size()
+		if self.policy == self.SPILL:
+			if not self.directory: self.directory = tempfile.mkdtemp(prefix="wwwclient-")
+			self._counter += 1
+			transaction.release(os.path.join(self.directory, "%08d.body" % (self._counter)))
+		else:
+			transaction.release()
+
+	def _evict( self, transaction ):
+		if self._held and self._held[0] is transaction:
+			self._held.popleft()
+			self._bytes -= transaction.size()
+		if self._maxRecords:
+			if len(self._records) == self._maxRecords:
+				self._records[0].discard()
+			self._records.append(TransactionRecord(transaction))
+		elif transaction._spilled and os.path.exists(transaction._spilled):
+			os.unlink(transaction._spilled)
+
+	def __getitem__( self, index ):
+		return self._transactions[index]
+
+	def __iter__( self ):
+		return iter(self._transactions)
+
+	def __len__( self ):
+		return len(self._transactions)
+
+# -----------------------------------------------------------------------------
+#
+# VALIDATORS
+#
+# -----------------------------------------------------------------------------
+
+class Validators:
+	"""Remembers the validators ('ETag' and 'Last-Modified' headers) of the
+	responses to GET requests, along with their body, so that the next
+	requests to the same URLs are made conditional ('If-None-Match' and
+	'If-Modified-Since'). When the server answers '304 Not Modified', the
+	transaction gets the stored response instead, and reuses the text and
+	tree parsed for the previous transaction when it is still in the session
+	history. Only the status line, headers and body of the responses are kept
+	here, so that the entries do not outlive the limits of the history.
+	This is transparent to the callers of 'Transaction.data()' or
+	'Transaction.query()', while 'Transaction.notModified()' tells when it
+	happened.
+
+	At most 'maxEntries' URLs and 'maxBytes' bytes of bodies are kept, the
+	least recently used ones being dropped first. Validators are thread-safe,
+	and are shared by the clones of a session."""
+
+	def __init__( self, maxEntries=256, maxBytes=16 * 1024 * 1024 ):
+		self.maxEntries = maxEntries
+		self.maxBytes   = maxBytes
+		self.hits       = 0
+		self._entries   = collections.OrderedDict()
+		self._bytes     = 0
+		self._lock      = threading.Lock()
+
+	def get( self, url ):
+		"""Returns the 'Validated' entry stored for the given URL, or
+		'None'."""
+		self._lock.acquire()
+		try:
+			entry = self._entries.pop(url, None)
+			if entry: self._entries[url] = entry
+			return entry
+		finally:
+			self._lock.release()
+
+	def store( self, transaction ):
+		"""Stores the response of the given (done) transaction when it is a
+		'200 OK' with validators, or forgets its URL otherwise."""
+		url = transaction.url()
+		if str(transaction.status()) != "200": return self.remove(url)
+		headers = transaction.headers()
+		etag, modified = headers.get("ETag"), headers.get("Last-Modified")
+		body    = transaction.body()
+		cache   = (headers.get("Cache-Control") or "").lower()
+		if not (etag or modified) or body is None or "no-store" in cache: return self.remove(url)
+		if self.maxBytes and len(body) > self.maxBytes: return self.remove(url)
+		response = transaction._responses[-1]
+		entry    = Validated(url, etag, modified, response[Transaction.STATUS],
+		response[Transaction.HEADERS], body, transaction.status(), transaction)
+		self._lock.acquire()
+		try:
+			self._drop(url)
+			self._entries[url] = entry
+			self._bytes       += len(body)
+			while self._entries and (len(self._entries) > self.maxEntries or self.maxBytes and self._bytes > self.maxBytes):
+				self._drop(self._entries.keys()[0])
+		finally:
+			self._lock.release()
+		return entry
+
+	def restore( self, entry, transaction ):
+		"""Restores the given entry into the given '304' transaction (see
+		'Validated.restore'), and counts the hit."""
+		self._lock.acquire()
+		try:
+			entry.restore(transaction)
+			self.hits += 1
+		finally:
+			self._lock.release()
+
+	def remove( self, url ):
+		"""Forgets the validators of the given URL."""
+		self._lock.acquire()
+		try:
+			self._drop(url)
+		finally:
+			self._lock.release()
+
+	def clear( self ):
+		self._lock.acquire()
+		try:
+			self._entries.clear()
+			self._bytes = 0
+		finally:
+			self._lock.release()
+
+	def size( self ):
+		"""Returns the number of bytes of the stored bodies."""
+		return self._bytes
+
+	def _drop( self, url ):
+		entry = self._entries.pop(url, None)
+		if entry: self._bytes -= len(entry.body)
+
+	def __len__( self ):
+		return len(self._entries)
+
+class Validated:
+	"""A response stored by 'Validators'."""
+
+	# The headers of a '304' that describe its (empty) body rather than the
+	# stored one, or that must not be replayed, which are not merged
+	UNMERGED = ("content-length", "content-encoding", "transfer-encoding",
+	"content-range", "set-cookie")
+
+	def __init__( self, url, etag, modified, firstLine, headers, body, status, transaction ):
+		self.url         = url
+		self.etag        = etag
+		self.modified    = modified
+		self.firstLine   = firstLine
+		self.headers     = headers
+		self.body        = body
+		self.status      = status
+		# The last transaction that got this response, whose parsed text and
+		# tree are reused as long as it is alive and was not released. It is
+		# only weakly referenced, so that the entries do not keep the
+		# transactions (and their trees) the history dropped.
+		self.transaction = weakref.ref(transaction)
+
+	def conditionalHeaders( self ):
+		"""Returns the conditional request headers, as a list of strings."""
+		res = []
+		if self.etag:     res.append("If-None-Match: " + self.etag)
+		if self.modified: res.append("If-Modified-Since: " + self.modified)
+		return res
+
+	def update( self, headers ):
+		"""Merges the given headers of a '304' response (as a string) into the
+		stored ones: each header of the '304' (such as 'Date', 'Cache-Control'
+		or 'Expires') replaces the stored headers with the same name, except
+		for the 'UNMERGED' ones."""
+		updates = []
+		names   = set()
+		for line in (headers or "").split(client.CRLF):
+			name = line.split(":", 1)[0].strip().lower()
+			if ":" not in line or not name or name in self.UNMERGED: continue
+			updates.append(line)
+			names.add(name)
+		if not updates: return self.headers
+		kept = list(line for line in self.headers.split(client.CRLF)
+		if line and line.split(":", 1)[0].strip().lower() not in names)
+		self.headers = client.CRLF.join(kept + updates)
+		return self.headers
+
+	def restore( self, transaction ):
+		"""Replaces the '304' response of the given transaction with the
+		stored response, updating the validators and the other headers the
+		'304' gives (see 'update'). This is to be called through
+		'Validators.restore', as entries are shared."""
+		headers = transaction.headers()
+		self.etag     = headers.get("ETag") or self.etag
+		self.modified = headers.get("Last-Modified") or self.modified
+		self.update(transaction._responses[-1][Transaction.HEADERS])
+		transaction._responses[-1] = [self.firstLine, self.headers, self.body]
+		transaction._status        = self.status
+		transaction._unmodified    = True
+		previous = self.transaction()
+		if previous and previous is not transaction and not previous.released():
+			transaction._charset = previous._charset
+			transaction._text    = previous._text
+			transaction._tags    = previous._tags
+			transaction._tree    = previous._tree
+			transaction._links   = previous._links
+		self.transaction = weakref.ref(transaction)
+
 # -----------------------------------------------------------------------------
 #
 # SESSION
@@ -494,11 +1100,13 @@ class Session:
 
 	- 'host':            Session host (by name or IP)
 	- 'protocol':        Session protocol (either HTTP or HTTPS)
-	- 'transactions':    List of transactions
+	- 'transactions':    History of transactions
 	- 'maxTransactions': Maximum number of transactions in registered in
 	                     this session
+	- 'history':         'History' instance bounding the transactions (and
+	                     their bodies) kept by this session
 	- 'cache':           Cache contained last requests
-	- 'cookies':         List of cookies for this session
+	- 'cookies':         Cookie jar for this session (see 'cookiejar')
 	- 'userAgent':       String for this user session agent
 
 	"""
@@ -508,28 +1116,39 @@ class Session:
 	DEFAULT_RETRIES  = [0.25, 0.5, 1.0, 1.5, 2.0]
 	DEFAULT_DELAY    = 1
 
-	def __init__( self, url=None, verbose=0, personality="random", follow=True, do=True, delay=None, cache=None ):
+	def __init__( self, url=None, verbose=0, personality="random", follow=True, do=True, delay=None, cache=None, history=None, httpClient=None ):
 		"""Creates a new session at the given host, and for the given
 		protocol.
 		Keyword arguments::
-			'delay':  the range of delay between two requests e.g: (1.5, 3)"""
-		self._httpClient      = defaultclient.HTTPClient()
+			'delay':      the range of delay between two requests e.g: (1.5, 3)
+			'history':    a 'History' instance, to bound the memory used by the
+			              transactions (see 'History')
+			'httpClient': the 'client.HTTPClient' class used to send the
+			              requests, 'defaultclient.HTTPClient' by default (use
+			              'curlclient.HTTPClient' to send them with PyCurl)"""
+		self._httpClient      = (httpClient or defaultclient.HTTPClient)()
 		if cache: self._httpClient.setCache(cache)
 		self._host            = None
-		self._port            = 80
+		self._port            = None
 		self._protocol        = None
-		self._transactions    = []
-		self._cookies         = Pairs()
+		self._transactions    = history if history is not None else History(self.MAX_TRANSACTIONS)
+		self._cookies         = cookiejar.CookieJar()
 		self._userAgent       = "Mozilla/5.0 (X11; U; Linux i686; fr; rv:1.8.0.4) Gecko/20060608 Ubuntu/dapper-security"
-		self._maxTransactions = self.MAX_TRANSACTIONS
+		self._maxTransactions = self._transactions.maxTransactions
 		self._referer         = None
 		self._verbose         = None
 		self._onLog           = None
+		self._metrics         = None
+		self._retries         = retries.Policy(retries=len(self.DEFAULT_RETRIES), delays=self.DEFAULT_RETRIES, budget=retries.BUDGET)
 		self._follow          = follow
 		self._do              = do
 		self._delay           = delay
 		self._headers         = []
-		if type(personality) in (unicode,str): personality = Personality.Get(personality)
+		self._requests        = 0
+		self._prefetcher      = None
+		self._validators      = Validators()
+		# NOTE: Named personalities are only created when first needed (see
+		# 'personality()'), as picking a random agent loads the agents data
 		self._personality     = personality
 		self.MERGE_COOKIES    = True
 		self.verbose(verbose)
@@ -564,6 +1183,38 @@ class Session:
 		'verbose'"""
 		self._onLog = self._httpClient._onLog = callback
 
+	def setRetryPolicy( self, policy ):
+		"""Sets the 'retries.Policy' used when no 'retry' is given to the
+		requests."""
+		self._retries = policy
+		return policy
+
+	def retryPolicy( self, retry=None ):
+		"""Returns the 'retries.Policy' corresponding to the given 'retry'
+		argument of the requests: either a policy, a list of delays (which
+		becomes a policy with as many retries) or nothing, in which case this
+		session policy is returned. The session policy only retries idempotent
+		requests (not POST), while an explicit list of delays retries any
+		request."""
+		if isinstance(retry, retries.Policy):
+			return retry
+		elif retry:
+			policy = self._retries
+			return retries.Policy(retries=len(retry), delays=retry, jitter=0,
+			statuses=policy.statuses, exceptions=policy.exceptions,
+			budget=policy.budget, methods=None)
+		else:
+			return self._retries
+
+	def setMetrics( self, metrics ):
+		"""Sets the 'metrics.Metrics' fed by this session (or 'None' to stop
+		feeding them). The metrics are fed through the 'after_request' and
+		'on_retry' hooks (see 'Metrics.observe'), the timings of each request
+		being given by 'Transaction.timings'."""
+		self._metrics = metrics
+		if metrics is not None: metrics.observe()
+		return metrics
+
 	def asFireFox( self ):
 		"""Sets this session personality to be FireFox. This returns the
 		'FireFox' personaly instance that will be bound to this session, you can
@@ -576,16 +1227,100 @@ class Session:
 
 	def personality( self ):
 		"""Returns the personality bound to this session."""
+		if type(self._personality) in (unicode,str):
+			self._personality = Personality.Get(self._personality)
+		elif isinstance(self._personality, agents.Pool):
+			self._personality = PoolPersonality(self._personality)
 		return self._personality
 
 	def cookies( self ):
+		"""Returns the 'CookieJar' of this session."""
 		return self._cookies
 
+	def history( self ):
+		"""Returns the 'History' instance holding this session
+		transactions."""
+		return self._transactions
+
+	def requests( self ):
+		"""Returns the number of transactions created by this session (which,
+		unlike the history, is never bounded)."""
+		return self._requests
+
+	def close( self ):
+		"""Closes the persistent connections of this session HTTP client (and
+		stops its prefetcher, if any). The session can still be used
+		afterwards."""
+		if self._prefetcher: self._prefetcher.close()
+		self._prefetcher = None
+		self._httpClient.close()
+
+	def prefetch( self, urls, **options ):
+		"""Fetches the given URLs in the background (see 'Prefetcher'), so
+		that a later 'get' of one of them returns right away. Instead of a
+		list of URLs, a predicate can be given, which is called with the
+		(absolute) URL of each link of the last page, telling which ones to
+		prefetch. The options (given on the first call only) are given to the
+		'Prefetcher'. Returns the list of URLs that were queued."""
+		if callable(urls):
+			predicate = urls
+			last      = self.last()
+			urls      = []
+			if last and last.done():
+				base = last.url()
+				for tag, href in last.links():
+					if tag != "a" or not href or href[0] == "#": continue
+					url = uri.normalize(uri.resolve(base, href))
+					if uri.split(url)[0] in PROTOCOLS and predicate(url): urls.append(url)
+		if not self._prefetcher:
+			self._prefetcher = Prefetcher(self, **options)
+		return self._prefetcher.add(self.__processURL(url, store=False) for url in urls)
+
+	def setValidators( self, validators ):
+		"""Sets the 'Validators' used to make the GET requests conditional, or
+		'None' to send them as-is."""
+		self._validators = validators
+		return validators
+
+	def validators( self ):
+		"""Returns the 'Validators' of this session, or 'None'."""
+		return self._validators
+
+	def prefetcher( self ):
+		"""Returns the 'Prefetcher' of this session, or 'None'."""
+		return self._prefetcher
+
+	def clone( self ):
+		"""Returns a new session that starts from the state of this session
+		(location, cookies, headers, personality and options), but shares
+		nothing with it: the clone has its own HTTP client, cookie jar and
+		(empty) history, so that it can be used in another thread."""
+		history = self._transactions
+		res = Session(personality=self._personality, follow=self._follow,
+		do=self._do, delay=self._delay, history=History(history.maxTransactions,
+		history.maxBytes, history.policy, None, history.keep, history._maxRecords),
+		httpClient=self._httpClient.__class__)
+		res._httpClient.encoding = self._httpClient.encoding
+		res._httpClient.setCache(self._httpClient._cache)
+		res._host          = self._host
+		res._port          = self._port
+		res._protocol      = self._protocol
+		res._cookies       = self._cookies.copy()
+		res._userAgent     = self._userAgent
+		res._headers       = list(self._headers)
+		res._referer       = self.last() and self.last().url() or self._referer
+		res.MERGE_COOKIES  = self.MERGE_COOKIES
+		res.verbose(self._status)
+		if self._onLog: res.setLogger(self._onLog)
+		res._metrics       = self._metrics
+		res._retries       = self._retries
+		res._validators    = self._validators
+		return res
+
 	def last( self ):
 		"""Returns the last transaction of the session, or None if there is not
 		transaction in the session."""
-		if not self._transactions: return None
-		return self._transactions[-1]
+		return self._transactions.last()
 
 	def page( self ):
 		"""Returns the data of the last page. This is an alias for
@@ -683,6 +1418,9 @@ class Session:
 		if do is None: do = self._do
 		# TODO: Return data instead of session
 		url = self.__processURL(url)
+		if self._prefetcher and do and method == GET and not (params or headers or cookies):
+			transaction = self._prefetcher.take(url)
+			if transaction: return self.__adoptTransaction(transaction, follow)
 		request     = self._createRequest( url=url, params=params, headers=headers, cookies=cookies, method=method )
 		transaction = Transaction( self, request )
 		self.__addTransaction(transaction)
@@ -691,29 +1429,48 @@ class Session:
 			# We do the transaction
 			# set a delay to do the transaction if _delay is specified
 			if self._delay: time.sleep(random.uniform(*self._delay))
-			# ensure that transaction.do retries after a fail
-			retry = retry or self.DEFAULT_RETRIES
-			for i,r in enumerate(retry):
-				try:
-					transaction.do()
-					break
-				except httplib.IncompleteRead, e:
-					if i >= len(retry):
-						raise e
-					else:
-						time.sleep(r)
-			if self.MERGE_COOKIES: self._cookies.merge(transaction.newCookies())
+			self._perform(transaction, retry)
+			if self.MERGE_COOKIES: self._cookies.update(transaction.setCookies(), transaction.url())
 			visited   = [url]
 			iteration = 0
 			while transaction.redirect() and follow and iteration < self.REDIRECT_LIMIT:
 				redirect_url = self.__processURL(transaction.redirect(), store=False)
 				if not (redirect_url in visited):
 					visited.append(redirect_url)
-					transaction = self.get(redirect_url, headers=headers, cookies=cookies, do=True, method=method, follow=False)
+					if hooks.ACTIVE: hooks.fire(hooks.ON_REDIRECT, self, transaction, redirect_url)
+					redirected = self.get(redirect_url, headers=headers, cookies=cookies, do=True, method=method, follow=False)
+					redirected._previous = transaction
+					transaction = redirected
+					iteration  += 1
 				else:
 					break
 		return transaction
 
+	def getMany( self, urls, headers=None, cookies=None ):
+		"""Gets the given URLs, which are expected to be independent from each
+		other, sending them as a batch: the HTTP client keeps one persistent
+		connection per host and pipelines the requests when the server allows
+		it (falling back to sequential keep-alive requests otherwise).
+
+		Each URL results in its own `Transaction`, returned in the same order
+		as the URLs. As the requests are sent before the responses are
+		received, the cookies set by a response are not sent with the other
+		requests of the batch, but they are merged in the session in the
+		order of the responses. Redirects are not followed."""
+		transactions = []
+		batch        = []
+		for url in urls:
+			url         = self.__processURL(url)
+			request     = self._createRequest( url=url, headers=headers, cookies=cookies, method=GET )
+			transaction = Transaction( self, request )
+			transactions.append(transaction)
+			batch.append((request.url(), transaction._prepare()))
+		for index, responses in self._httpClient.GETMany(batch):
+			transaction = transactions[index]
+			transaction._absorb(responses)
+			self.__addTransaction(transaction)
+			if self.MERGE_COOKIES: self._cookies.update(transaction.setCookies(), transaction.url())
+		return transactions
 	
 	def post( self, url=None, params=None, data=None, mimetype=None,
 	fields=None, attach=None, headers=None, follow=None, do=None, cookies=None, retry=[]):
@@ -742,25 +1499,18 @@ class Session:
 			# We do the transaction
 			# set a delay to do the transaction if _delay is specified
 			if self._delay: time.sleep(random.uniform(*self._delay))
-			# ensure that transaction.do retries after a fail
-			retry = retry or self.DEFAULT_RETRIES
-			for i,r in enumerate(retry):
-				try:
-					transaction.do()
-					break
-				except httplib.IncompleteRead, e:
-					if i >= len(retry):
-						raise e
-					else:
-						time.sleep(r)
-			if self.MERGE_COOKIES: self._cookies.merge(transaction.newCookies())
+			self._perform(transaction, retry)
+			if self.MERGE_COOKIES: self._cookies.update(transaction.setCookies(), transaction.url())
 			# And follow the redirect if any
 			visited = [url]
 			while transaction.redirect() and follow:
 				redirect_url = self.__processURL(transaction.redirect(), store=False)
 				if not (redirect_url in visited):
 					visited.append(redirect_url)
-					transaction = self.post(redirect_url, data=data, mimetype=mimetype, fields=fields, attach=attach, headers=headers, cookies=cookies, do=True)
+					if hooks.ACTIVE: hooks.fire(hooks.ON_REDIRECT, self, transaction, redirect_url)
+					redirected  = self.post(redirect_url, data=data, mimetype=mimetype, fields=fields, attach=attach, headers=headers, cookies=cookies, do=True, follow=False)
+					redirected._previous = transaction
+					transaction = redirected
 				else:
 					break
 		return transaction
@@ -772,18 +1522,34 @@ class Session:
 		a POST or GET with the resulting values (POST by default).
 
 		The submit method is a convenience wrapper that processes the given form
-		and gives its values as parameters to the post method."""
+		and gives its values as parameters to the post method.
+
+		The form can also be a 'FormTemplate' (see 'Form.compile'), in which
+		case the values are the template variables, and the data is posted
+		as encoded by the template."""
 		if do is None: do = self._do
+		if isinstance(form, FormTemplate):
+			url = form.action or self.referer()
+			if isinstance(url, unicode): url = url.encode(form.encoding)
+			data, mimetype = form.encode(**values)
+			if method == POST:
+				assert not attach, "Attachments are incompatible with form templates"
+				return self.post( url, data=data, mimetype=mimetype, do=do, cookies=cookies )
+			elif method in (GET, HEAD) and not form.multipart:
+				if data: url += "?" + data
+				return self.get( url, do=do, cookies=cookies, method=method )
+			else:
+				raise SessionException("Unsupported method for form template: " + method)
 		# We fill the form values
 		# And we submit the form
 		if type(form) in (unicode, str):
-			forms = scrape.HTML.forms(self.last().data())
+			forms = self.last().forms()
 			if not forms.has_key(form):
 				raise SessionException("Form not available: " + form)
 			form = forms[form]
 		url    = form.action or self.referer()
 		fields = form.submit(action=action, strip=strip, **values)
-		# FIXME: Manage encodings consistently
+		if isinstance(url, unicode): url = url.encode(form.encoding)
 		if method == POST or attach:
 			return self.post( url, fields=fields, attach=attach, do=do, cookies=cookies )
 		elif method in (GET, HEAD):
@@ -800,15 +1566,45 @@ class Session:
 		
 		When finished, this function returns True if it suceeded, or False if
 		the retries failed."""
-		retry = retry or self.DEFAULT_RETRIES
+		if retry is None: retry = len(self.DEFAULT_RETRIES)
+		elif type(retry) in (tuple, list): retry = len(retry)
 		if delay == None: delay = self.DEFAULT_DELAY
-		res = expects(action(*args,**kwargs))
-		while not res and retry:
-			res = expects(action(*args,**kwargs))
+		retry = min(retry, 10)
+		res   = expects(action(*args,**kwargs))
+		while not res and retry > 0:
 			time.sleep(delay)
+			res    = expects(action(*args,**kwargs))
 			retry -= 1
 		return res
 
+	def _perform( self, transaction, retry=None ):
+		"""Does the given transaction, retrying it when it fails as told by
+		the policy corresponding to the given 'retry' (see 'retryPolicy'). A
+		response with a retryable status is returned as-is once the retries
+		are exhausted, while the last exception is raised."""
+		request  = transaction.request()
+		url      = request.url()
+		attempts = self.retryPolicy(retry).start(url, request.method())
+		while True:
+			try:
+				transaction.do()
+			except Exception, e:
+				error = sys.exc_info()
+				delay = attempts.failed(e)
+				if delay is None: raise error[0], error[1], error[2]
+				failure = e
+			else:
+				status = transaction.status()
+				if not attempts.policy.isRetryable(status=status):
+					attempts.succeeded()
+					return transaction
+				delay = attempts.failed(status=status, retryAfter=transaction.headers().get("Retry-After"))
+				if delay is None: return transaction
+				failure = status
+			if hooks.ACTIVE: hooks.fire(hooks.ON_RETRY, self, url, attempts.count, failure)
+			time.sleep(delay)
+			transaction._reset()
+
 	def save(self, path, transaction=None):
 		"""Saves the page from the given transaction (default it 'last()') to
 		the given file."""
@@ -821,65 +1617,429 @@ class Session:
 	def __processURL( self, url, store=True ):
 		"""Processes the given URL, by storing the host and protocol, and
 		returning a normalized, absolute URL"""
-		old_url = url
 		if url == None and not self._transactions: url = "/"
-		if url == None and self._transactions: url = self.last().request.url()
-		proto_rest = url.split("://",1)
-		if len(proto_rest) == 2 and proto_rest[0].find("/") == -1:
-			# If the URL was given with a protocol, then we might change server
-			protocol, host, path, parameters, query, fragment =  urlparse.urlparse(url)
-		else:
+		if url == None and self._transactions: url = self.last().url()
+		if not uri.isAbsolute(url):
 			# Otherwise we expect to be on the same server (and then just the
 			# path is given)
 			assert self._host, "No host was given to url: {0}".format(url)
-			protocol, host, path, parameters, query, fragment =  urlparse.urlparse(
-				"%s://%s:%s%s" % (
-					(self._protocol or HTTP),
-					self._host,
-					self._port or 80,
-					url[0] == "/" and url or ("/" + url)
-			))
+			if url[:1] != "/": url = "/" + url
+			url = uri.resolve(self.__baseURL(), url)
+		url = uri.normalize(url)
 		if store:
-			if   protocol == "http":  self._protocol = protocol = HTTP
-			elif protocol == "https": self._protocol = protocol = HTTPS
-		port = None
-		if host:
-			host = host.split(":")
-			if len(host) == 1:
-				host = host[0]
-			else:
-				port = host[1]
-				host = host[0]
-			if store:
+			protocol, host, port = uri.location(url)
+			if protocol in PROTOCOLS: self._protocol = protocol
+			if host:
 				self._host = host
 				self._port = port
-		# We recompose the url
-		if port:
-			url = "%s://%s:%s" % (protocol, host, port)
-		else:
-			url = "%s://%s" % (protocol, host)
-		if   path and path[0] == "/": url += path
-		elif path:      url += "/" + path
-		else:           url += "/"
-		if parameters:  url += ";" + parameters
-		if query:       url += "?" + query
-		if fragment:    url += "#" + fragment
 		return url
 
+	def __baseURL( self ):
+		"""Returns the root URL of the current host"""
+		if self._port:
+			return "%s://%s:%s/" % (self._protocol or HTTP, self._host, self._port)
+		else:
+			return "%s://%s/" % (self._protocol or HTTP, self._host)
+
 	def _createRequest( self, **kwargs ):
 		# We copyt the session headers (ie. authentication)
 		kwargs["headers"] = (kwargs.get("headers") or []) + self._headers
 		request = Request(**kwargs)
 		last    = self.last()
-		if self.referer(): request.header("Referer", self.referer())
-		if self._personality: self._personality.apply(request)
+		# NOTE: 'referer()' consumes the referer that was set, so it is only
+		# called once
+		referer = self.referer()
+		if referer: request.header("Referer", referer)
+		personality = self.personality()
+		if personality: personality.apply(request)
 		return request
 
 	def __addTransaction( self, transaction ):
 		"""Adds a transaction to this session."""
-		if len(self._transactions) > self._maxTransactions:
-			self._transactions = self._transactions[1:]
-		self._transactions.append(transaction)
+		self._requests += 1
+		self._transactions.add(transaction)
+
+	def __adoptTransaction( self, transaction, follow ):
+		"""Adds the given prefetched transaction (and the transactions of
+		its redirects) to this session, as if this session did them."""
+		chain = [transaction]
+		while chain[-1]._previous: chain.append(chain[-1]._previous)
+		# Redirects are only kept when they are to be followed
+		if not follow: chain = chain[-1:]
+		for transaction in reversed(chain):
+			transaction._session = self
+			transaction._client  = self._httpClient
+			self.__addTransaction(transaction)
+			if self.MERGE_COOKIES: self._cookies.update(transaction.setCookies(), transaction.url())
+		return transaction
+
+# -----------------------------------------------------------------------------
+#
+# SESSION POOL
+#
+# -----------------------------------------------------------------------------
+
+class SessionPool:
+	"""A thread-safe pool of sessions, for multithreaded crawlers. Sessions
+	are not thread-safe, so each thread checks a session out of the pool
+	('acquire' or 'session'), uses it alone and gives it back ('release').
+
+	The pooled sessions are clones of the 'seed' session (see
+	'Session.clone'): they start with its location, cookies, headers,
+	personality and options, but changes made to a pooled session (such as
+	the cookies it receives) are not seen by the seed nor by the other
+	sessions. The seed itself is never used by the pool. The pooled sessions
+	share what is already shared between sessions: the DNS cache (see
+	'resolver.RESOLVER'), the Curl handles (see 'curlclient.POOL'), the
+	retry budget, and the cache, validators and metrics of the seed.
+
+	NOTE: Connections are only shared with 'curlclient', through its handle
+	pool. With 'defaultclient', each pooled session keeps its own persistent
+	connections (which are reused as long as the session stays in the pool),
+	as 'httplib' connections can not be shared between threads.
+
+	At most 'maxSessions' sessions exist at any time ('acquire' waits for
+	one to be released beyond that). A session that has created
+	'maxRequests' transactions (if given) is recycled when released: it is
+	closed and replaced by a fresh clone of the seed, so that long crawls
+	do not carry their cookies and connections forever.
+
+	Example:
+
+	--
+		pool = SessionPool(Session("http://www.mysite.com"), maxSessions=64)
+		def fetch( session, url ):
+			return session.get(url).data()
+		pages = pool.map(fetch, urls, threads=64)
+	--
+	"""
+
+	def __init__( self, seed=None, maxSessions=16, maxRequests=None ):
+		self.seed        = seed or Session(personality=None)
+		self.maxSessions = maxSessions
+		self.maxRequests = maxRequests
+		self.created     = 0
+		self.recycled    = 0
+		self._idle       = []
+		self._busy       = 0
+		self._closed     = False
+		self._condition  = threading.Condition()
+
+	def acquire( self, timeout=None ):
+		"""Checks a session out of this pool, creating it if no session is
+		idle. When 'maxSessions' are in use, this waits for one of them to be
+		released, at most 'timeout' seconds (if given), after which a
+		'SessionException' is raised."""
+		condition = self._condition
+		deadline  = timeout is not None and time.time() + timeout or None
+		condition.acquire()
+		try:
+			while True:
+				if self._closed: raise SessionException("Session pool is closed")
+				if self._idle:
+					self._busy += 1
+					return self._idle.pop()
+				if self._busy < self.maxSessions:
+					self._busy   += 1
+					self.created += 1
+					# NOTE: The seed is cloned while holding the lock, as
+					# cloning reads its (otherwise unprotected) state
+					try:
+						return self.seed.clone()
+					except:
+						self._busy -= 1
+						raise
+				if deadline is None:
+					condition.wait()
+				else:
+					remaining = deadline - time.time()
+					if remaining <= 0: raise SessionException("No session available after %ss" % (timeout))
+					condition.wait(remaining)
+		finally:
+			condition.release()
+
+	def release( self, session, discard=False ):
+		"""Gives back the given session to this pool. The session is closed
+		instead when 'discard' is true (for instance after an error that left
+		it in an unknown state), when it reached 'maxRequests' or when the
+		pool is closed."""
+		condition = self._condition
+		condition.acquire()
+		try:
+			self._busy -= 1
+			if self.maxRequests and session.requests() >= self.maxRequests:
+				self.recycled += 1
+				discard = True
+			if not (discard or self._closed): self._idle.append(session)
+			condition.notify()
+		finally:
+			condition.release()
+		if discard or self._closed: session.close()
+
+	@contextlib.contextmanager
+	def session( self, timeout=None ):
+		"""Checks a session out for the duration of a 'with' block. The
+		session is discarded if the block raises an exception."""
+		session = self.acquire(timeout)
+		try:
+			yield session
+		except:
+			self.release(session, discard=True)
+			raise
+		else:
+			self.release(session)
+
+	def map( self, function, items, threads=None ):
+		"""Calls 'function(session, item)' for each of the given items in the
+		given number of threads ('maxSessions' by default), each call having a
+		session of its own. Returns the list of results, in the order of the
+		items. The first exception raised by a call is raised once all the
+		threads are done."""
+		items   = list(items)
+		results = [None] * len(items)
+		errors  = []
+		lock    = threading.Lock()
+		indexes = iter(xrange(len(items)))
+		def work():
+			while not errors:
+				lock.acquire()
+				try:
+					index = next(indexes, None)
+				finally:
+					lock.release()
+				if index is None: break
+				try:
+					with self.session() as session:
+						results[index] = function(session, items[index])
+				except:
+					errors.append(sys.exc_info())
+		workers = []
+		for i in range(min(threads or self.maxSessions, len(items))):
+			worker = threading.Thread(target=work)
+			worker.daemon = True
+			worker.start()
+			workers.append(worker)
+		for worker in workers: worker.join()
+		if errors: raise errors[0][0], errors[0][1], errors[0][2]
+		return results
+
+	def size( self ):
+		"""Returns the number of sessions of this pool (idle or in use)."""
+		return self._busy + len(self._idle)
+
+	def close( self ):
+		"""Closes the idle sessions of this pool. The sessions in use are
+		closed when they are released, and no session can be acquired any
+		more."""
+		condition = self._condition
+		condition.acquire()
+		try:
+			self._closed = True
+			idle, self._idle = self._idle, []
+			condition.notifyAll()
+		finally:
+			condition.release()
+		for session in idle: session.close()
+
+# -----------------------------------------------------------------------------
+#
+# PREFETCHER
+#
+# -----------------------------------------------------------------------------
+
+class Prefetcher:
+	"""Fetches the pages a session is likely to get next (the next pages of a
+	listing, for instance) in background threads, keeping the resulting
+	transactions until the session gets them (see 'Session.prefetch'). A
+	prefetched page is only used once, and only by a plain 'Session.get'
+	(without parameters, headers or cookies).
+
+	Each thread has its own clone of the session (see 'Session.clone'), which
+	sends the requests with the cookies the session had when the URLs were
+	given to 'add', and with the current page as referer. The cookies set by
+	the prefetched responses are merged into the session when they are used.
+
+	The options are:
+
+	- 'threads':    the number of threads (and of cloned sessions)
+	- 'perHost':    the maximum number of requests sent to the same host at
+	                the same time
+	- 'maxQueue':   the maximum number of URLs waiting to be fetched, the
+	                URLs given beyond that being ignored
+	- 'maxEntries': the maximum number of prefetched transactions kept, the
+	                oldest ones being dropped first
+	- 'maxAge':     the time (in seconds) after which a prefetched
+	                transaction is considered stale and dropped
+	"""
+
+	def __init__( self, session, threads=4, perHost=2, maxQueue=32, maxEntries=64, maxAge=60 ):
+		self.session    = session
+		self.perHost    = perHost
+		self.maxQueue   = maxQueue
+		self.maxEntries = maxEntries
+		self.maxAge     = maxAge
+		self.hits       = 0
+		self.misses     = 0
+		self._queue     = collections.deque()
+		self._entries   = collections.OrderedDict()
+		self._hosts     = {}
+		self._closed    = False
+		self._condition = threading.Condition()
+		self._workers   = []
+		for i in range(threads):
+			clone = session.clone()
+			# NOTE: The clones keep all their transactions (without any byte
+			# budget), so that the prefetched bodies are not released before
+			# they are taken: they are only budgeted by the history of the
+			# session that adopts them
+			clone._transactions    = History(session.REDIRECT_LIMIT + 1)
+			clone._maxTransactions = clone._transactions.maxTransactions
+			worker = threading.Thread(target=self._work, args=(clone,))
+			worker.daemon = True
+			worker.start()
+			self._workers.append(worker)
+
+	def add( self, urls ):
+		"""Queues the given (absolute) URLs for prefetching, skipping the ones
+		already queued or prefetched. Returns the list of queued URLs."""
+		session   = self.session
+		cookies   = session.cookies().copy()
+		referer   = session.last() and session.last().url() or None
+		added     = []
+		condition = self._condition
+		condition.acquire()
+		try:
+			self._expire()
+			for url in urls:
+				if len(self._queue) >= self.maxQueue: break
+				if self._entries.has_key(url): continue
+				entry = self._entries[url] = Prefetched(url, cookies, referer)
+				self._queue.append(entry)
+				added.append(url)
+			while len(self._entries) > self.maxEntries:
+				self._drop(self._entries.keys()[0])
+			condition.notifyAll()
+		finally:
+			condition.release()
+		return added
+
+	def take( self, url, timeout=None ):
+		"""Returns the transaction prefetched for the given URL, waiting for
+		it when it is being fetched, or 'None' when the URL was not
+		prefetched (or failed, or is still queued, in which case it is
+		cancelled)."""
+		condition = self._condition
+		condition.acquire()
+		try:
+			self._expire()
+			entry = self._entries.pop(url, None)
+			if entry and not entry.started:
+				self._queue.remove(entry)
+				entry = None
+		finally:
+			condition.release()
+		if entry is None:
+			self.misses += 1
+			return None
+		entry.done.wait(timeout)
+		if entry.transaction is None:
+			self.misses += 1
+			return None
+		self.hits += 1
+		return entry.transaction
+
+	def pending( self ):
+		"""Returns the list of URLs that are queued or being fetched."""
+		return list(url for url, entry in self._entries.items() if not entry.done.isSet())
+
+	def cancel( self ):
+		"""Removes the queued URLs and the prefetched transactions (the
+		requests being sent are completed, but their result is dropped)."""
+		condition = self._condition
+		condition.acquire()
+		try:
+			self._queue.clear()
+			self._entries.clear()
+		finally:
+			condition.release()
+
+	def close( self ):
+		"""Cancels the prefetching and stops the threads, once their current
+		request is done."""
+		condition = self._condition
+		condition.acquire()
+		try:
+			self._closed = True
+			self._queue.clear()
+			self._entries.clear()
+			condition.notifyAll()
+		finally:
+			condition.release()
+
+	def _next( self ):
+		"""Waits for the next queued entry whose host is below the 'perHost'
+		limit, marking it as started. Returns 'None' once closed."""
+		condition = self._condition
+		condition.acquire()
+		try:
+			while not self._closed:
+				for entry in self._queue:
+					if self._hosts.get(entry.host, 0) < self.perHost:
+						self._queue.remove(entry)
+						self._hosts[entry.host] = self._hosts.get(entry.host, 0) + 1
+						entry.started = time.time()
+						return entry
+				condition.wait()
+			return None
+		finally:
+			condition.release()
+
+	def _work( self, session ):
+		while True:
+			entry = self._next()
+			if entry is None: break
+			try:
+				session._cookies = entry.cookies.copy()
+				session.referer(entry.referer)
+				entry.transaction = session.get(entry.url)
+			except Exception, e:
+				entry.error = e
+			finally:
+				session.history().clear()
+				entry.done.set()
+				condition = self._condition
+				condition.acquire()
+				try:
+					self._hosts[entry.host] -= 1
+					condition.notifyAll()
+				finally:
+					condition.release()
+		session.close()
+
+	def _expire( self ):
+		"""Drops the stale entries (the lock being held)."""
+		if not self.maxAge: return
+		limit = time.time() - self.maxAge
+		for url, entry in self._entries.items():
+			if entry.created < limit: self._drop(url)
+
+	def _drop( self, url ):
+		entry = self._entries.pop(url)
+		if not entry.started: self._queue.remove(entry)
+
+class Prefetched:
+	"""The state of a prefetched URL."""
+
+	def __init__( self, url, cookies, referer ):
+		self.url         = url
+		self.host        = uri.location(url)[1]
+		self.cookies     = cookies
+		self.referer     = referer
+		self.created     = time.time()
+		self.started     = None
+		self.done        = threading.Event()
+		self.transaction = None
+		self.error       = None
 
 # -----------------------------------------------------------------------------
 #
@@ -906,7 +2066,16 @@ class Personality:
 			return self(agent)
 
 	def __init__( self, agent ):
-		self.agent = agents.pickLatest(agent)
+		self._agentName = agent
+
+	def __getattr__( self, name ):
+		# The '(agent, version, user agent)' triple is only looked up when
+		# first needed, so that creating a session does not load the agents
+		# data
+		if name == "agent":
+			self.agent = agents.pickLatest(self.__dict__.get("_agentName"))
+			return self.agent
+		raise AttributeError(name)
 	
 	def userAgent( self ):
 		return self.agent[-1]
@@ -914,6 +2083,31 @@ class Personality:
 	def apply( self, request ):
 		pass
 
+class PoolPersonality(Personality):
+	"""Takes its user agents from an 'agents.Pool'. Each instance gets a
+	session number from the pool, and sets the 'User-Agent' header to the
+	user agent picked for this number and the request host (see
+	'agents.Pool.pick')."""
+
+	def __init__( self, pool ):
+		self.pool    = pool
+		self.number  = pool.session()
+		self._agents = {}
+		self.agent   = self.agentFor(None)
+
+	def agentFor( self, host ):
+		"""Returns the '(agent, version, user agent)' triple for the given
+		host."""
+		if not self.pool.perHost: host = None
+		res = self._agents.get(host)
+		if res is None:
+			res = self._agents[host] = self.pool.pick(self.number, host)
+		return res
+
+	def apply( self, request ):
+		host = uri.location(request.url())[1]
+		request.header("User-Agent", self.agentFor(host)[-1], replace=True)
+
 class Firefox(Personality):
 	"""Simulates the way Firefox would behave."""
 
@@ -931,12 +2125,4 @@ class Firefox(Personality):
 		request.header( "Keep-Alive", "300")
 		request.header( "Connection", "keep-alive")
 
-# Events
-# - Redirect
-# - New cookie
-# - Success
-# - Error
-# - Timeout
-# - Exception
-
 # EOF - vim: tw=80 ts=4 sw=4 noet
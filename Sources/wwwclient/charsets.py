@@ -0,0 +1,136 @@
+#!/usr/bin/env python
+# Encoding: iso-8859-1
+# -----------------------------------------------------------------------------
+# Project   : WWWClient
+# -----------------------------------------------------------------------------
+# Author    : Sebastien Pierre                               <sebastien@ivy.fr>
+# -----------------------------------------------------------------------------
+# License   : GNU Lesser General Public License
+# Credits   : Xprima.com
+# -----------------------------------------------------------------------------
+# Creation  : 19-Oct-2026
+# Last mod  : 19-Oct-2026
+# -----------------------------------------------------------------------------
+
+import re, codecs
+
+__doc__ = """\
+The 'charsets' module detects the character encoding of response bodies, so
+that they can be decoded once (see 'browse.Transaction.text') rather than
+piece by piece. The charset is looked for, in order:
+
+ - in the byte order mark (BOM) starting the body, which browsers trust over
+   the headers
+ - in the 'charset' parameter of the 'Content-Type' header
+ - in the '<meta charset>' (or '<meta http-equiv="Content-Type">') element
+   within the first 'SNIFF_LENGTH' bytes of the body
+ - and otherwise falls back to 'DEFAULT_CHARSET'
+
+Example:
+
+--
+	from wwwclient import charsets
+	charset, source = charsets.detect(body, "text/html; charset=utf-8")
+	text = charsets.decode(body, charset)
+--
+"""
+
+DEFAULT_CHARSET = "utf-8"
+SNIFF_LENGTH    = 4096
+
+BOM             = "bom"
+HEADER          = "header"
+META            = "meta"
+DEFAULT         = "default"
+
+# The BOMs, the longest ones first, as the UTF-32LE one starts with the
+# UTF-16LE one
+BOMS            = (
+	(codecs.BOM_UTF32_LE, "utf-32-le"),
+	(codecs.BOM_UTF32_BE, "utf-32-be"),
+	(codecs.BOM_UTF8,     "utf-8"),
+	(codecs.BOM_UTF16_LE, "utf-16-le"),
+	(codecs.BOM_UTF16_BE, "utf-16-be"),
+)
+
+# Browsers decode these labels as 'windows-1252' (which only differs from
+# 'latin-1' in the 0x80-0x9F range, where 'latin-1' has control characters)
+ALIASES         = {
+	"iso8859-1"  : "cp1252",
+	"ascii"      : "cp1252",
+}
+
+RE_CHARSET      = re.compile("charset\s*=\s*[\"']?([\w.:-]+)", re.I)
+RE_META         = re.compile("<meta\s[^>]*?charset\s*=\s*[\"']?([\w.:-]+)", re.I)
+
+# -----------------------------------------------------------------------------
+#
+# DETECTION
+#
+# -----------------------------------------------------------------------------
+
+def fromBOM( data ):
+	"""Returns the charset given by the BOM starting the given data, or
+	'None'."""
+	if data:
+		for bom, charset in BOMS:
+			if data.startswith(bom): return charset
+	return None
+
+def fromContentType( value ):
+	"""Returns the (normalized) charset given by the 'charset' parameter of
+	the given 'Content-Type' header value, or 'None'."""
+	if not value: return None
+	match = RE_CHARSET.search(value)
+	return match and normalize(match.group(1)) or None
+
+def fromMeta( data, length=SNIFF_LENGTH ):
+	"""Returns the (normalized) charset declared by a '<meta>' element within
+	the first 'length' bytes of the given HTML data, or 'None'."""
+	if not data: return None
+	match = RE_META.search(data, 0, length)
+	return match and normalize(match.group(1)) or None
+
+def detect( data, contentType=None, default=DEFAULT_CHARSET ):
+	"""Returns the '(charset, source)' couple for the given body and
+	'Content-Type' header value, where the source is one of 'BOM', 'HEADER',
+	'META' and 'DEFAULT'. The meta elements are only looked for in HTML (or
+	untyped) bodies."""
+	charset = fromBOM(data)
+	if charset: return charset, BOM
+	charset = fromContentType(contentType)
+	if charset: return charset, HEADER
+	if not contentType or "html" in contentType.lower():
+		charset = fromMeta(data)
+		if charset: return charset, META
+	return default, DEFAULT
+
+def normalize( charset ):
+	"""Returns the Python codec name for the given charset label, or 'None'
+	if Python has no codec for it."""
+	try:
+		name = codecs.lookup(charset.strip()).name
+	except (LookupError, UnicodeError):
+		return None
+	return ALIASES.get(name, name)
+
+# -----------------------------------------------------------------------------
+#
+# DECODING
+#
+# -----------------------------------------------------------------------------
+
+def decode( data, charset=None, errors="replace" ):
+	"""Decodes the given data with the given charset (detected when not
+	given), skipping its BOM. Undecodable bytes are replaced unless 'errors'
+	tells otherwise."""
+	if data is None: return None
+	if isinstance(data, unicode): return data
+	if charset is None: charset = detect(data)[0]
+	for bom, bom_charset in BOMS:
+		if data.startswith(bom):
+			if normalize(bom_charset) == normalize(charset): data = data[len(bom):]
+			break
+	return data.decode(charset, errors)
+
+# EOF - vim: tw=80 ts=4 sw=4 noet
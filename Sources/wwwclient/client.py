@@ -12,7 +12,8 @@
 # Last mod  : 27-Sep-2006
 # -----------------------------------------------------------------------------
 
-import re, mimetypes, urllib, zlib
+import re, os, mimetypes, urllib, zlib, time, hooks
+import uri
 
 __doc__ = """\
 This modules defines an abstract class for HTTP clients, that creates a simple,
@@ -46,6 +47,184 @@ BOUNDARY           = '----------fbb6cc131b52e5a980ac702bedde498032a88158$'
 DEFAULT_MIMETYPE   = 'text/plain'
 DEFAULT_ATTACH_MIMETYPE = 'application/octet-stream'
 
+# -----------------------------------------------------------------------------
+#
+# MULTIPART ENCODER
+#
+# -----------------------------------------------------------------------------
+
+class MultipartEncoder:
+	"""Encodes fields and attachments as 'multipart/form-data' without
+	loading the attached files in memory. The size of the body is computed
+	upfront (using the size of the files), so that the 'Content-Length' can be
+	sent before the body, which is then read in chunks using 'read()' (this
+	works both as a body for 'httplib' and as a Curl 'READFUNCTION').
+
+	Fields are given as (name, value) pairs, and attachments as (name, value,
+	type) triples, as described in 'HTTPClient.POST'."""
+
+	CHUNK_SIZE = 64 * 1024
+
+	def __init__( self, fields=(), attach=(), encoding="latin-1", boundary=BOUNDARY ):
+		self.boundary = boundary
+		self.encoding = encoding
+		self._parts   = []
+		self._size    = 0
+		self._index   = 0
+		self._offset  = 0
+		self._file    = None
+		for name, value in fields or ():
+			self._add('Content-Disposition: form-data; name="%s"' % name)
+			self._add(self._valueToString(value))
+			self._add(CRLF)
+		for name, filename, atype in attach or ():
+			if atype == FILE_ATTACHMENT:
+				mime_type = mimetypes.guess_type(filename)[0] or DEFAULT_ATTACH_MIMETYPE
+				value     = None
+			elif atype == CONTENT_ATTACHMENT:
+				filename, mime_type, value = filename
+			else:
+				raise Exception("Unknown attachment type: %s" % (atype))
+			self._add(CRLF.join((
+				'Content-Disposition: form-data; name="%s"; filename="%s"' % (name, filename),
+				'Content-Type: %s' % (mime_type),
+				'Content-Transfer-Encoding: binary'
+			)))
+			if value is None:
+				self._parts.append((filename, os.path.getsize(filename)))
+				self._size += self._parts[-1][1]
+			else:
+				self._add(self._valueToString(value))
+			self._add(CRLF)
+		self._add("--" + self.boundary + "--" + CRLF)
+
+	def _add( self, text ):
+		"""Adds the given text to the parts. Part headers are prefixed with the
+		boundary and followed by an empty line."""
+		if text.startswith("Content-Disposition:"):
+			text = "--" + self.boundary + CRLF + text + CRLF + CRLF
+		self._parts.append(text)
+		self._size += len(text)
+
+	def _valueToString( self, value ):
+		if   type(value) == unicode: value = value.encode(self.encoding)
+		elif value == None: value = ""
+		else: value = str(value)
+		return value
+
+	def contentType( self ):
+		"""Returns the value of the 'Content-Type' header for this body."""
+		return 'multipart/form-data; boundary=%s' % self.boundary
+
+	def size( self ):
+		"""Returns the size (in bytes) of the encoded body."""
+		return self._size
+
+	def read( self, size=-1 ):
+		"""Reads at most 'size' bytes from the encoded body (or the rest of
+		the body when 'size' is negative). An empty string is returned once
+		the body was entirely read."""
+		res = []
+		if size is None or size < 0: size = self._size
+		while size > 0 and self._index < len(self._parts):
+			part = self._parts[self._index]
+			if type(part) is tuple:
+				if self._file is None: self._file = open(part[0], "rb")
+				data = self._file.read(min(size, self.CHUNK_SIZE))
+				if not data:
+					self._file.close()
+					self._file   = None
+					self._index += 1
+					continue
+			else:
+				data = part[self._offset:self._offset + size]
+				self._offset += len(data)
+				if self._offset >= len(part):
+					self._offset = 0
+					self._index += 1
+			size -= len(data)
+			res.append(data)
+		return "".join(res)
+
+	def chunks( self, size=CHUNK_SIZE ):
+		"""Iterates on the encoded body, by chunks of the given size."""
+		while True:
+			data = self.read(size)
+			if not data: break
+			yield data
+
+	def write( self, stream, size=CHUNK_SIZE ):
+		"""Writes the encoded body to the given stream (or socket, anything
+		that has a 'sendall' or 'write' method)."""
+		send = getattr(stream, "sendall", None) or stream.write
+		for chunk in self.chunks(size):
+			send(chunk)
+
+	def rewind( self ):
+		"""Rewinds the encoder, so that the body can be read again."""
+		if self._file: self._file.close()
+		self._file   = None
+		self._index  = 0
+		self._offset = 0
+
+	def getvalue( self ):
+		"""Returns the whole encoded body as a string (which loads the attached
+		files in memory)."""
+		self.rewind()
+		res = self.read()
+		self.rewind()
+		return res
+
+# -----------------------------------------------------------------------------
+#
+# TIMINGS
+#
+# -----------------------------------------------------------------------------
+
+class Timings:
+	"""The timings (in seconds) of the phases of a request, along with the
+	number of bytes sent and received:
+
+	- 'dns':      resolution of the host name
+	- 'connect':  TCP connection
+	- 'tls':      TLS handshake (HTTPS only)
+	- 'ttfb':     time to first byte, from the request being sent to the
+	              response headers being received
+	- 'transfer': reception of the response body
+	- 'parse':    parsing of the response by the client
+
+	Phases that did not happen (for instance when a connection is reused) are
+	zero, and 'cached' tells if the response was taken from the cache."""
+
+	PHASES = ("dns", "connect", "tls", "ttfb", "transfer", "parse")
+
+	def __init__( self ):
+		self.started  = time.time()
+		self.dns      = 0.0
+		self.connect  = 0.0
+		self.tls      = 0.0
+		self.ttfb     = 0.0
+		self.transfer = 0.0
+		self.parse    = 0.0
+		self.bytesIn  = 0
+		self.bytesOut = 0
+		self.cached   = False
+
+	def total( self ):
+		"""Returns the sum of the phases."""
+		return self.dns + self.connect + self.tls + self.ttfb + self.transfer + self.parse
+
+	def asDict( self ):
+		res = dict((phase, getattr(self, phase)) for phase in self.PHASES)
+		res["total"]    = self.total()
+		res["bytesIn"]  = self.bytesIn
+		res["bytesOut"] = self.bytesOut
+		res["cached"]   = self.cached
+		return res
+
+	def __repr__( self ):
+		return "<timings:%s in=%d out=%d>" % (" ".join("%s=%0.4f" % (p, getattr(self, p)) for p in self.PHASES), self.bytesIn, self.bytesOut)
+
 # NOTE: A useful reference for understanding HTTP is the following website
 # <http://www.jmarshall.com/easy/http>
 class HTTPClient:
@@ -65,13 +244,13 @@ class HTTPClient:
 		self._status     = None
 		self._redirect   = None
 		self._newCookies = None
+		self._setCookies = None
 		self._responses  = None
+		self._timings    = None
 		self._onLog      = None
 		self._cache      = None
 		self.verbose     = 0
 		self.encoding    = encoding
-		self.retryDelay  = 0.100
-		self.retryCount  = 5
 
 	def _log( self, *args ):
 		"""Logs data to stdout or forwards it to self._onLog"""
@@ -80,6 +259,10 @@ class HTTPClient:
 		else:
 			print " ".join(map(str,args))
 
+	def close( self ):
+		"""Closes the persistent connections opened by this client (if
+		any)."""
+
 	def setCache( self, cache ):
 		"""Set a cache"""
 		self._cache = cache
@@ -105,17 +288,19 @@ class HTTPClient:
 		return self._status
 	
 	def redirect( self ):
-		"""Returns the redirection URL (if any)."""
-		if self._redirect == None or self._redirect.find("://") != -1:
-			return self._redirect
-		if self._redirect[0] == "/":
-			return "%s://%s%s" % (self.protocol(), self.host(), self._redirect)
-		else:
-			return "%s://%s/%s" % (self.protocol(), self.host(), self._redirect)
+		"""Returns the redirection URL (if any), resolved against the last
+		requested URL."""
+		if self._redirect == None: return None
+		return self._absoluteURL(self._redirect)
 	
 	def newCookies( self ):
 		"""Returns the cookies added by the last response."""
 		return self._newCookies
+
+	def setCookies( self ):
+		"""Returns the list of 'Set-Cookie' header values (including their
+		attributes) received with the last response."""
+		return self._setCookies
 	
 	def responses( self ):
 		"""Returns the list of responses to the last request. The list is
@@ -132,12 +317,16 @@ class HTTPClient:
 			return "".join(r[-1] for r in self._responses)
 
 	def dataSize( self ):
-		"""Returns the total size of the responses."""
+		"""Returns the total size of the response bodies."""
 		total = 0
-		for r in self._responses:
-			total += len(r)
+		for r in self._responses or ():
+			total += len(r[-1])
 		return total
 
+	def timings( self ):
+		"""Returns the 'Timings' of the last request."""
+		return self._timings
+
 	def info( self, level=1 ):
 		return "%s %s (%s)" % (self.method(), self.url(), self.status())
 		# return "\n".join((
@@ -152,42 +341,34 @@ class HTTPClient:
 		"""Encodes the given fields and attachments (as given to POST) and
 		returns the request body and content type for sending the encoded
 		data.  This method can be used to bypass Curl own form encoding
-		techniques."""
-		content = []
+		techniques. Use 'encoder()' to avoid loading the whole body in
+		memory."""
 		if not fields and not attach: return "", DEFAULT_MIMETYPE
-		if fields:
-			for name, value in fields:
-				content.append("--" + BOUNDARY)
-				content.append('Content-Disposition: form-data; name="%s"' % name)
-				content.append('')
-				content.append(self._valueToString(value))
-		if attach:
-			attach = self._ensureAttachment(attach)
-			for name, filename, atype in attach:
-				content.append("--" + BOUNDARY)
-				if atype == FILE_ATTACHMENT:
-					f     = file(filename, 'r')
-					value = f.read()
-					f.close()
-					mime_type = mimetypes.guess_type(filename)[0] or DEFAULT_ATTACH_MIMETYPE
-				elif atype == CONTENT_ATTACHMENT:
-					filename, mime_type, value = filename
-				content.append('Content-Disposition: form-data; name="%s"; filename="%s"' % (name, filename))
-				content.append('Content-Type: %s' % (mime_type))
-				content.append('Content-Transfer-Encoding: binary')
-				content.append('')
-				content.append(self._valueToString(value))
-		content.append('--' + BOUNDARY + '--')
-		content.append('')
-		body         = CRLF.join(content)
-		content_type = 'multipart/form-data; boundary=%s' % BOUNDARY
-		return body, content_type
+		encoder = self.encoder(fields, attach)
+		return encoder.getvalue(), encoder.contentType()
+
+	def encoder( self, fields=(), attach=() ):
+		"""Returns a 'MultipartEncoder' for the given fields and attachments
+		(as given to POST), which streams the request body."""
+		return MultipartEncoder(fields, self._ensureAttachment(attach), self.encoding)
 
 	def GET( self, url, headers=None ):
 		"""Gets the given URL, setting the given headers (as a list of
 		strings)."""
 		raise Exception("GET method must be implemented by HTTPClient subclasses.")
 
+	def GETMany( self, requests ):
+		"""Gets the given list of '(url, headers)' requests, yielding an
+		'(index, responses)' couple after each response is received, where
+		'index' is the position of the request in the list. The client state
+		('status()', 'newCookies()', etc) corresponds to the yielded response.
+
+		This default implementation sends the requests one after the other,
+		subclasses may pipeline them."""
+		for index, request in enumerate(requests):
+			url, headers = request
+			yield index, self.GET(url, headers=headers)
+
 	def POST( self, url, data=None, mimetype=None, fields=None, attach=None, headers=None ):
 		"""Posts the given data (as urlencoded string), or fields as list of
 		(name, value) pairs and/or attachments as list of (name, value, type)
@@ -240,23 +421,31 @@ class HTTPClient:
 			return value.asURL()
 
 	def _absoluteURL( self, url ):
-		"""Returns the absolute URL for the given url"""
-		if self.host() == None or url == None or url.find("://") != -1:
-			res = url
-		elif url[0] == "/":
-			res = "%s://%s%s" % (self.protocol(), self.host(), url)
+		"""Returns the absolute URL for the given url, resolved against the last
+		requested URL (or the current host)."""
+		if url == None: return None
+		if self._url:
+			res = uri.resolve(self._url, url)
+		elif self.host() != None:
+			res = uri.resolve("%s://%s/" % (self.protocol(), self.host()), url)
 		else:
-			res = "%s://%s/%s" % (self.protocol(), self.host(), url)
+			res = url
 		return str(res)
 
-	def _parseResponse( self, message):
+	def _parseResponse( self, message, timings=None ):
 		"""Parse the message, and return a list of responses and headers. This
 		might occur when there is a provisional response in between, or when
 		location are followed. The result is a list of (firstline, headers,
-		body), all as unparsed stings."""
+		body), all as unparsed stings.
+
+		The given 'timings' (a new 'Timings' if not given) are updated with the
+		time spent parsing, and become the timings of the client."""
+		if timings is None: timings = Timings()
+		started = time.time()
 		res     = []
 		off     = 0
 		self._newCookies = []
+		self._setCookies = []
 		# FIXME: I don't get why we need to iterate here
 		# (it's probably when you have multiple responses)
 		while off < len(message):
@@ -269,40 +458,34 @@ class HTTPClient:
 			headers          = message[eol+2:eoh]
 			# FIXME: This is not very efficient, we should parse all headers
 			# into a structure, rahter than searching
-			charset          = RE_CHARSET.search(headers)
-			is_chunked       = RE_CHUNKED.search(headers)
-			content_length   = RE_CONTENT_LENGTH.search(headers)
-			content_encoding = RE_CONTENT_ENCODING.search(headers)
-			content_type     = RE_CONTENT_TYPE.search(headers)
+			# NOTE: The regexes expect each header to end with a CRLF, which is
+			# not the case of the last one
+			# NOTE: The body is kept as bytes, the charset being detected
+			# when it is decoded (see 'charsets' and 'Transaction.text')
+			searched         = headers + CRLF
+			is_chunked       = RE_CHUNKED.search(searched)
+			content_length   = RE_CONTENT_LENGTH.search(searched)
+			content_encoding = RE_CONTENT_ENCODING.search(searched)
 			if content_encoding:
 				content_encoding = content_encoding.group(1)
-			if content_type:
-				content_type     = content_type.group(1)
-			if charset:
-				encoding   = charset.group(1)
-			else:
-				encoding   = self.encoding
 			# If there is a content-length specified, we use it
 			if content_length:
 				content_length = int(content_length.group(1))
 				off        = eoh + 4 + content_length
-				body       = self._decodeBody(message[eoh+4:off], content_encoding, encoding)
+				body       = self._decodeBody(message[eoh+4:off], content_encoding)
 			# Otherwise, the transfer type may be chunks
 			elif is_chunked:
 				# FIXME: For the moment, chunks are supposed to be separated by
 				# CRLF + CRLF only (this is what google.com returns)
 				off        = message.find(CRLF + CRLF, eoh + 4)
 				if off == -1: off = len(message) 
-				body       = self._decodeBody(message[eoh+4:off], content_encoding, encoding)
+				body       = self._decodeBody(message[eoh+4:off], content_encoding)
 			# Otherwise the body is simply what's left after the headers
 			else:
 				if len(message) > eoh+4:
-					body = self._decodeBody(message[eoh+4:], content_encoding, encoding)
+					body = self._decodeBody(message[eoh+4:], content_encoding)
 				off = len(message)
-			location, cookies = self._parseStatefulHeaders(headers)
-			# WTF: 
-			self._redirect    = location
-			self._newCookies.extend(self._parseCookies(cookies))
+			self._absorbHeaders(headers)
 			# FIXME: I don't know if it works properly, but at least it handles
 			# responses from <http://www.contactor.se/~dast/postit.cgi> properly.
 			if first_line and first_line.startswith("HTTP"):
@@ -316,48 +499,81 @@ class HTTPClient:
 				if body: res[-1][-1] = res[-1][-1] + body 
 		# TODO: It would be good to communicate headers and first_line back
 		self._responses = res
+		timings.parse   = time.time() - started
+		self._timings   = timings
+		if hooks.ACTIVE: hooks.fire(hooks.AFTER_PARSE, self, res)
 		return res
 
-	def _decodeBody( self, body, contentEncoding=None, encoding=None ):
+	def _parseResponses( self, responses, timings=None ):
+		"""Same as '_parseResponse', for a list of '(firstline, headers, body)'
+		responses that the transport already split (as Curl does), which
+		spares copying the body into a message only to slice it again. The
+		bodies are decoded, and the result is the list of responses."""
+		if timings is None: timings = Timings()
+		started = time.time()
+		res     = []
+		self._newCookies = []
+		self._setCookies = []
+		for first_line, headers, body in responses:
+			if body:
+				content_encoding = RE_CONTENT_ENCODING.search(headers + CRLF)
+				if content_encoding: body = self._decodeBody(body, content_encoding.group(1))
+			self._absorbHeaders(headers)
+			res.append([first_line, headers, body])
+		self._responses = res
+		timings.parse   = time.time() - started
+		self._timings   = timings
+		if hooks.ACTIVE: hooks.fire(hooks.AFTER_PARSE, self, res)
+		return res
+
+	def _absorbHeaders( self, headers ):
+		"""Updates the redirect and the cookies of this client with the
+		given response headers."""
+		location, cookies = self._parseStatefulHeaders(headers)
+		# WTF: 
+		self._redirect    = location
+		self._setCookies.extend(cookies)
+		self._newCookies.extend(self._parseCookies(cookies))
+
+	def _decodeBody( self, body, contentEncoding=None ):
+		"""Returns the given body without its content encoding. The result is
+		still a byte string."""
 		if contentEncoding:
 			if contentEncoding.lower().strip() == "gzip":
-				body = zlib.decompress(body)
-				#if encoding: return body.decode(encoding)
-				#else: return body
-				return body
+				# NOTE: The window bits tell zlib to expect a gzip header
+				return zlib.decompress(body, 16 + zlib.MAX_WBITS)
 			else:
 				raise Exception("Unsupported content encoding: " + contentEncoding)
 		else:
-			# FIXME: Should not force encoding, only if it's a string
-			#if encoding: return body.decode(encoding)
 			return body
 
 	def _parseStatefulHeaders( self, headers ):
-		"""Return the Location and Set-Cookie headers from the given header
-		string."""
+		"""Return the Location header and the list of Set-Cookie header values
+		from the given header string."""
 		# We add an extra carriage, because some regexes will expect a carriage
 		# return at the end
 		headers += "\r\n"
 		location    = RE_LOCATION.search(headers)
 		if location: location = location.group(1).strip()
-		cookies    = RE_SET_COOKIE.findall(headers)
-		set_cookie = ";".join(cookies)
-		return location, set_cookie
+		cookies    = list(c.strip() for c in RE_SET_COOKIE.findall(headers))
+		return location, cookies
 	
 	def _parseCookies( self, cookies ):
-		"""Returns a pair (name, value) for the given cookies, given as text."""
+		"""Returns a list of (name, value) pairs for the given list of
+		Set-Cookie header values. Cookie attributes (Path, Domain, Expires,
+		etc) are ignored, see the 'cookiejar' module to process them."""
 		_cookies   = {}
 		res        = []
 		if not cookies: return res
-		for cookie in cookies.split(";"):
-			equal = cookie.find("=")
+		for cookie in cookies:
+			cookie = cookie.split(";", 1)[0]
+			equal  = cookie.find("=")
 			if equal > 0:
-				key           = cookie[:equal].strip()
-				value         = cookie[equal+1:].strip()
+				key   = cookie[:equal].strip()
+				value = cookie[equal+1:].strip()
+				if not _cookies.has_key(key): res.append(key)
 				_cookies[key] = value
-		for key, value in _cookies.items():
-			res.append((key, value))
-		return res
+		return list((key, _cookies[key]) for key in res)
 
 	def _parseHeaders( self, headers ):
 		"""Parses all headers and returns a list of (key, value) representing
@@ -366,7 +582,7 @@ class HTTPClient:
 		for header in headers.split("\n"):
 			colon = header.find(":")
 			name  = header[:colon].strip()
-			value = header[colon+1:-1]
+			value = header[colon+1:].strip()
 			if not name: continue
 			res.append((name,value))
 		return res
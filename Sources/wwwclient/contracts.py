@@ -9,15 +9,34 @@
 # Credits   : Xprima.com
 # -----------------------------------------------------------------------------
 # Creation  : 18-Jul-2006
-# Last mod  : 18-Jul-2006
+# Last mod  : 19-Oct-2026
 # -----------------------------------------------------------------------------
 
+import copy, time, threading, Queue, json, math, re
 import browse, scrape
 
 __doc__ = """\
 The contract module allows to express simple test case that allow to check
 particular responses. This enables easy verification of an API, as well as
 detection of modfications of an existing website API.
+
+Contracts can be run one by one (using 'Contract.run'), or many at once using
+a 'Runner', which runs the tests that do not depend on each other concurrently.
+
+The duration of each request done by a test is sampled, so that tests can
+also check performance (see 'expectLatency', 'expectSize' and
+'expectRedirectCount'), and the results of the tests, along with the latency
+percentiles, are available as a JSON report (see 'Contract.report' and
+'Runner.report').
+
+Example:
+
+--
+	runner = Runner(workers=16)
+	for contract in (SiteA(), SiteB(), SiteC()): runner.add(contract)
+	runner.run()
+	runner.report()
+--
 """
 
 # -----------------------------------------------------------------------------
@@ -48,11 +67,25 @@ def depends(*names):
 		return f
 	return _
 
+def percentile( values, p ):
+	"""Returns the 'p'th percentile (between 0 and 100) of the given values,
+	using the nearest-rank method, or 'None' when there is no value."""
+	if not values: return None
+	values = sorted(values)
+	rank   = int(math.ceil(p / 100.0 * len(values)))
+	return values[max(0, rank - 1)]
+
 class ContractError(Exception): pass
 class Contract:
 	"""A contract is like a unit test case, but for a website. Each contract has
 	its own browsing session and scraping tools, which can be used by the
-	various test methods."""
+	various test methods.
+
+	The requests done by the tests are sampled in 'samples' (at most
+	'MAX_SAMPLES' requests are sampled per test), as dictionaries with the
+	test name, method, URL, status, duration, size and redirect count."""
+
+	MAX_SAMPLES = 1000
 
 	def __init__( self ):
 		self.session   = None
@@ -60,12 +93,20 @@ class Contract:
 		self.errors    = None
 		self.provided  = None
 		self.completed = None
+		self.results   = None
+		self.samples   = None
+		self._sampledUntil = None
 
 	def setup( self,  ):
 		"""This method creates the @session and @HTML attribute.
 		It is called just before the contract is run."""
-		self.session   = browse.Session()
+		self.session   = browse.Session(history=browse.History(
+			browse.Session.MAX_TRANSACTIONS, maxRecords=self.MAX_SAMPLES
+		))
 		self.HTML      = scrape.HTMLTools()
+		self.results   = []
+		self.samples   = []
+		self._sampledUntil = None
 		self.errors    = []
 		self.warnings  = []
 		self.provided  = []
@@ -110,10 +151,16 @@ class Contract:
 			test  = self._nextTest()
 			if test == None: break
 			name  = test.__name__[4:]
+			result = TestResult(self, name, TestResult.OK, start=time.time())
 			try:
 				test()
 			except ContractError, e:
 				error = e
+				result.status = TestResult.FAILED
+				result.error  = e
+			result.end = time.time()
+			self.results.append(result)
+			self._sample(name)
 			if error:
 				print "%-20s [FAILED] (%s)" % (name, error)
 			else:
@@ -125,11 +172,16 @@ class Contract:
 		print "Completed            %3d%%" % (percent)
 
 	def error( self, reason):
-		self.errors.append((self.session.url(), reason))
-		raise ContractError(self.session.url(), reason)
+		self.errors.append((self._url(), reason))
+		raise ContractError(self._url(), reason)
 	
 	def warning( self, reason ):
-		self.warnings.append((self.session.url(), reason))
+		self.warnings.append((self._url(), reason))
+
+	def _url( self ):
+		"""Returns the current URL, if any."""
+		if self.session.last(): return self.session.url()
+		return None
 
 	def expect( self, value, message ):
 		if not value: self.error(message)
@@ -162,6 +214,38 @@ class Contract:
 					repr(url)
 			))
 
+	def expectLatency( self, p50=None, p95=None, p99=None, max=None, like=None ):
+		"""Expects the durations (in seconds) of the requests sampled so far
+		(or only of the ones with an URL matching the 'like' regexp) to have
+		percentiles below the given values, for instance
+		'expectLatency(p95=0.5)'."""
+		durations = self.durations(like)
+		if not durations:
+			self.error("No request sampled")
+		for name, p, limit in (("p50", 50, p50), ("p95", 95, p95), ("p99", 99, p99), ("max", 100, max)):
+			if limit is None: continue
+			value = percentile(durations, p)
+			if value > limit:
+				self.error("Latency %s is %0.3fs, expected < %0.3fs (%d requests)" % (name, value, limit, len(durations)))
+
+	def expectSize( self, min=None, max=None ):
+		"""Expects the size (in bytes) of the current transaction data to be
+		within the given bounds."""
+		size = len(self.session.last().data() or "")
+		if min is not None and size < min:
+			self.error("Response too small: %d bytes, expected >= %d" % (size, min))
+		if max is not None and size > max:
+			self.error("Response too large: %d bytes, expected <= %d" % (size, max))
+
+	def expectRedirectCount( self, count=None, max=None ):
+		"""Expects the number of redirects followed to get to the current
+		transaction to be exactly 'count', or at most 'max'."""
+		redirects = self.session.last().redirectCount()
+		if count is not None and redirects != count:
+			self.error("Unexpected redirect count: got %d, expected %d" % (redirects, count))
+		if max is not None and redirects > max:
+			self.error("Too many redirects: got %d, expected <= %d" % (redirects, max))
+
 	def expectText( self, contains=() ):
 		"""Expects various criteria on the current transaction data, once
 		stripped out of HTML data."""
@@ -171,4 +255,338 @@ class Contract:
 			if text.find(c) == -1:
 				self.error("String not found: %s" % (repr(c)))
 
+	# TIMINGS
+	# ========================================================================
+
+	def durations( self, like=None ):
+		"""Returns the durations of the requests sampled so far, optionally
+		only the ones with an URL matching the given regexp."""
+		self._sample()
+		if like is None: return list(s["duration"] for s in self.samples)
+		if type(like) in (str, unicode): like = re.compile(like)
+		return list(s["duration"] for s in self.samples if like.search(s["url"]))
+
+	def latency( self, like=None ):
+		"""Returns a dictionary with the count, mean, p50, p95, p99 and max
+		durations of the sampled requests."""
+		durations = self.durations(like)
+		res = {"count":len(durations), "mean":None}
+		if durations: res["mean"] = sum(durations) / len(durations)
+		for name, p in (("p50", 50), ("p95", 95), ("p99", 99), ("max", 100)):
+			res[name] = percentile(durations, p)
+		return res
+
+	def report( self ):
+		"""Returns a (JSON-serializable) dictionary with the results of the
+		tests, the latency summary and the samples of this contract."""
+		results = self.results or []
+		passed  = filter(lambda r:r.status == TestResult.OK, results)
+		return {
+			"contract" : self.__class__.__name__,
+			"completed": int(100.0 * len(passed) / max(1, len(self.tests or ()))),
+			"tests"    : list(r.asDict() for r in results),
+			"latency"  : self.latency(),
+			"samples"  : list(self.samples or ()),
+		}
+
+	def _sample( self, test=None ):
+		"""Samples the requests done by the session since the last sampling
+		(from the session history), attributing them to the given test."""
+		if self.session is None: return
+		history = self.session.history()
+		last    = self._sampledUntil
+		count   = 0
+		for transaction in history.records() + history.transactions():
+			started = transaction.started()
+			if started is None or transaction.duration() is None: continue
+			if last is not None and started <= last: continue
+			if count < self.MAX_SAMPLES:
+				self.samples.append({
+					"test"     : test,
+					"method"   : transaction.method(),
+					"url"      : transaction.url(),
+					"status"   : transaction.status(),
+					"duration" : transaction.duration(),
+					"size"     : transaction.size(),
+					"redirects": transaction.redirectCount(),
+				})
+				count += 1
+			self._sampledUntil = max(started, self._sampledUntil)
+
+# -----------------------------------------------------------------------------
+#
+# RUNNER
+#
+# -----------------------------------------------------------------------------
+
+class TestResult:
+	"""The result of running a contract test with a 'Runner'. The 'status' is
+	one of 'OK', 'FAILED' (the test raised a 'ContractError'), 'ERROR' (the test
+	raised another exception) or 'SKIPPED' (its dependencies were not met)."""
+
+	OK      = "OK"
+	FAILED  = "FAILED"
+	ERROR   = "ERROR"
+	SKIPPED = "SKIPPED"
+
+	def __init__( self, contract, name, status=None, error=None, start=None, end=None ):
+		self.contract = contract
+		self.name     = name
+		self.status   = status
+		self.error    = error
+		self.start    = start
+		self.end      = end
+		self.session  = None
+
+	def duration( self ):
+		"""Returns the time (in seconds) the test took to run."""
+		if self.start is None or self.end is None: return 0.0
+		return self.end - self.start
+
+	def asDict( self ):
+		return {
+			"name"    : self.name,
+			"status"  : self.status,
+			"error"   : self.error and str(self.error) or None,
+			"duration": self.duration(),
+		}
+
+	def __repr__( self ):
+		return "<test:%s.%s %s %0.3fs>" % (self.contract.__class__.__name__, self.name, self.status, self.duration())
+
+class Runner:
+	"""Runs the tests of many contracts concurrently, using a pool of
+	'workers' threads. The '@provides' and '@depends' decorators of the tests
+	of each contract make a graph: a test is scheduled as soon as each of the
+	resources it depends on is provided by a test that succeeded, and is
+	skipped when all the tests that provide one of them failed.
+
+	Each test runs with its own session, cloned from the session of the test
+	that provided its first dependency (or from the contract session when it
+	has no dependency), the cookies of the other providers being merged in. This
+	way a test that logs in can provide the logged-in state to the tests that
+	depend on it."""
+
+	def __init__( self, contracts=(), workers=8, verbose=True ):
+		self.workers   = workers
+		self.verbose   = verbose
+		self.contracts = []
+		self.results   = []
+		self._lock     = threading.Lock()
+		for contract in contracts: self.add(contract)
+
+	def add( self, contract ):
+		"""Adds the given contract to this runner."""
+		self.contracts.append(contract)
+		return contract
+
+	def run( self ):
+		"""Runs the tests of all the contracts, returning the list of
+		'TestResult'. The contracts are set up in the workers too."""
+		self.results = []
+		tasks        = Queue.Queue()
+		done         = Queue.Queue()
+		threads      = []
+		graphs       = {}
+		pending      = 0
+		for contract in self.contracts:
+			tasks.put((contract, None))
+			pending += 1
+		for i in range(min(self.workers, max(1, pending))):
+			thread = threading.Thread(target=self._work, args=(tasks, done))
+			thread.daemon = True
+			thread.start()
+			threads.append(thread)
+		while pending:
+			contract, result = done.get()
+			pending -= 1
+			if result is None:
+				# The contract is set up, we build its graph and start the tests
+				# that have no dependency
+				graph = graphs[contract] = _Graph(contract)
+				ready = graph.ready()
+			elif isinstance(result, Exception):
+				# The contract could not be set up
+				result = TestResult(contract, "setup", TestResult.ERROR, result)
+				self._record(result)
+				continue
+			else:
+				self._record(result)
+				ready = graphs[contract].complete(result)
+			for test, session in ready:
+				if session is None:
+					# NOTE: The test is skipped
+					skipped = TestResult(contract, test.__name__[4:], TestResult.SKIPPED)
+					self._record(skipped)
+				else:
+					tasks.put((contract, (test, session)))
+					pending += 1
+		# Tests that depend on each other in a cycle are never run
+		for graph in graphs.values():
+			for test in graph.remaining():
+				skipped = TestResult(graph.contract, test.__name__[4:], TestResult.SKIPPED)
+				self._record(skipped)
+		for thread in threads: tasks.put(None)
+		for thread in threads: thread.join()
+		return self.results
+
+	def _work( self, tasks, done ):
+		"""The worker thread main loop."""
+		while True:
+			task = tasks.get()
+			if task is None: break
+			contract, test = task
+			if test is None:
+				try:
+					contract.setup()
+					done.put((contract, None))
+				except Exception, e:
+					done.put((contract, e))
+			else:
+				done.put((contract, self._runTest(contract, *test)))
+
+	def _runTest( self, contract, test, session ):
+		"""Runs the given test of the given contract with the given session,
+		and returns a 'TestResult'. The test is bound to a shallow copy of the
+		contract, so that tests running concurrently do not share their
+		session and scraping tools."""
+		instance          = copy.copy(contract)
+		instance.session  = session
+		instance.HTML     = scrape.HTMLTools()
+		instance._sampledUntil = None
+		result            = TestResult(contract, test.__name__[4:], start=time.time())
+		result.session    = session
+		try:
+			getattr(instance, test.__name__)()
+			result.status = TestResult.OK
+		except ContractError, e:
+			result.status = TestResult.FAILED
+			result.error  = e
+		except Exception, e:
+			result.status = TestResult.ERROR
+			result.error  = e
+		result.end = time.time()
+		instance._sample(result.name)
+		return result
+
+	def _record( self, result ):
+		"""Records the given result, both in this runner and in its
+		contract."""
+		self._log(result)
+		self.results.append(result)
+		if result.contract.results is not None:
+			result.contract.results.append(result)
+
+	def _log( self, result ):
+		if not self.verbose: return
+		with self._lock:
+			name = "%s.%s" % (result.contract.__class__.__name__, result.name)
+			if result.error:
+				print "%-40s [%s] %0.3fs (%s)" % (name, result.status, result.duration(), result.error)
+			else:
+				print "%-40s [%s] %0.3fs" % (name, result.status, result.duration())
+
+	def report( self, path=None ):
+		"""Prints the completion rate and the total test time of each
+		contract. When a 'path' is given, the reports of the contracts (see
+		'Contract.report') are also saved to this file, as JSON."""
+		if path:
+			with file(path, "wb") as f:
+				json.dump(list(c.report() for c in self.contracts), f, indent=1)
+		for contract in self.contracts:
+			results = filter(lambda r:r.contract is contract, self.results)
+			passed  = filter(lambda r:r.status == TestResult.OK, results)
+			total   = sum(r.duration() for r in results)
+			percent = int(100.0 * len(passed) / max(1, len(results)))
+			print "%-40s %3d%% (%d/%d) %0.3fs" % (contract.__class__.__name__, percent, len(passed), len(results), total)
+
+class _Graph:
+	"""The dependency graph of the tests of a contract, as used by the
+	'Runner'."""
+
+	def __init__( self, contract ):
+		self.contract  = contract
+		self.waiting   = {}
+		self.needs     = {}
+		self.providers = {}
+		self.provided  = {}
+		for test in contract.tests:
+			for resource in getattr(test, "_provides", ()):
+				self.providers[resource] = self.providers.get(resource, 0) + 1
+		for test in contract.tests:
+			needs = self.needs[test.__name__] = set(getattr(test, "_depends", ()))
+			for resource in needs:
+				self.waiting.setdefault(resource, []).append(test)
+		self.tests = dict((test.__name__, test) for test in contract.tests)
+
+	def ready( self ):
+		"""Returns the tests that can be run right away (those without
+		dependencies), and the ones that will never run because a resource
+		they need is not provided by any test."""
+		res = []
+		for test in self.contract.tests:
+			needs = self.needs[test.__name__]
+			# The tests skipped by an earlier test of the loop are done
+			if needs is None: continue
+			if not needs:
+				res.append((test, self.contract.session.clone()))
+			elif filter(lambda r:not self.providers.get(r), needs):
+				res.extend(self._skip(test))
+		return res
+
+	def complete( self, result ):
+		"""Updates the graph with the given result, and returns the list of
+		'(test, session)' couples for the tests that can now be run, the
+		session being 'None' for the tests that are skipped."""
+		res  = []
+		test = self.tests["test" + result.name]
+		if result.status == TestResult.OK:
+			self.contract._provide(test)
+			self.contract.completed.append(test)
+		for resource in getattr(test, "_provides", ()):
+			self.providers[resource] -= 1
+			if result.status == TestResult.OK:
+				if self.provided.has_key(resource): continue
+				self.provided[resource] = result.session
+				for waiting in self.waiting.get(resource, ()):
+					needs = self.needs[waiting.__name__]
+					if needs is None: continue
+					needs.discard(resource)
+					if not needs: res.append((waiting, self._session(waiting)))
+			elif not self.providers[resource] and not self.provided.has_key(resource):
+				for waiting in self.waiting.get(resource, ()):
+					res.extend(self._skip(waiting))
+		return res
+
+	def remaining( self ):
+		"""Returns the tests that are still waiting for their
+		dependencies."""
+		return filter(lambda t:self.needs[t.__name__], self.contract.tests)
+
+	def _skip( self, test ):
+		"""Marks the given test as skipped, as well as the tests that can not
+		run anymore because of it."""
+		if self.needs.get(test.__name__) is None: return []
+		self.needs[test.__name__] = None
+		res = [(test, None)]
+		for resource in getattr(test, "_provides", ()):
+			self.providers[resource] -= 1
+			if not self.providers[resource] and not self.provided.has_key(resource):
+				for waiting in self.waiting.get(resource, ()):
+					res.extend(self._skip(waiting))
+		return res
+
+	def _session( self, test ):
+		"""Returns the session for the given test, cloned from the session of
+		the provider of its first dependency."""
+		resources = getattr(test, "_depends")
+		session   = self.provided[resources[0]].clone()
+		for resource in resources[1:]:
+			provider = self.provided[resource]
+			if provider is self.provided[resources[0]]: continue
+			for cookie in provider.cookies().copy():
+				session.cookies().add(cookie)
+		self.needs[test.__name__] = None
+		return session
+
 # EOF - vim: tw=80 ts=4 sw=4 noet
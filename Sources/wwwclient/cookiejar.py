@@ -0,0 +1,416 @@
+#!/usr/bin/env python
+# Encoding: iso-8859-1
+# -----------------------------------------------------------------------------
+# Project   : WWWClient
+# -----------------------------------------------------------------------------
+# Author    : Sebastien Pierre                               <sebastien@ivy.fr>
+# -----------------------------------------------------------------------------
+# License   : GNU Lesser General Public License
+# Credits   : Xprima.com
+# -----------------------------------------------------------------------------
+# Creation  : 19-Oct-2026
+# Last mod  : 19-Oct-2026
+# -----------------------------------------------------------------------------
+
+import time, json, email.utils
+import uri
+
+__doc__ = """\
+The 'cookiejar' module implements cookie storage as described in RFC 6265. The
+'CookieJar' parses 'Set-Cookie' headers (with their 'Domain', 'Path',
+'Expires', 'Max-Age', 'Secure' and 'HttpOnly' attributes), and returns only
+the cookies that match a given URL.
+
+Cookies are indexed by domain, and then by path in a trie of path segments, so
+that finding the cookies for a request only looks at the domains the request
+host belongs to, and at the paths that are prefixes of the request path.
+
+Jars can be saved to and loaded from JSON files, so that a (persistent)
+session can be restored later.
+"""
+
+MAX_PER_DOMAIN  = 50
+MAX_COOKIE_SIZE = 4096
+
+# Common public suffixes with more than one label (single labels, such as
+# 'com', are always public suffixes). This is not the full Public Suffix List,
+# only the registries that are most often met.
+PUBLIC_SUFFIXES = set((
+	"co.uk", "org.uk", "ac.uk", "gov.uk", "me.uk", "ltd.uk", "plc.uk",
+	"com.au", "net.au", "org.au", "edu.au", "gov.au",
+	"co.nz", "org.nz", "co.jp", "ne.jp", "or.jp", "ac.jp", "co.kr", "or.kr",
+	"com.br", "net.br", "org.br", "com.cn", "net.cn", "org.cn", "com.mx",
+	"com.ar", "com.tr", "com.tw", "com.hk", "com.sg", "co.in", "co.za",
+	"co.il", "com.ua", "com.pl", "co.id", "com.my", "com.ph", "com.vn",
+))
+
+# -----------------------------------------------------------------------------
+#
+# COOKIE
+#
+# -----------------------------------------------------------------------------
+
+class Cookie:
+	"""Represents a single cookie, as set by a 'Set-Cookie' header."""
+
+	FIELDS = ("name", "value", "domain", "path", "expires", "secure",
+	"httpOnly", "hostOnly", "created")
+
+	def __init__( self, name, value, domain="", path="/", expires=None,
+	secure=False, httpOnly=False, hostOnly=True, created=None ):
+		self.name     = name
+		self.value    = value
+		self.domain   = domain
+		self.path     = path or "/"
+		self.expires  = expires
+		self.secure   = secure
+		self.httpOnly = httpOnly
+		self.hostOnly = hostOnly
+		self.created  = created or time.time()
+
+	def isExpired( self, now=None ):
+		"""Tells if this cookie is expired. Session cookies (without expiry
+		date) never expire."""
+		if self.expires is None: return False
+		return self.expires <= (now or time.time())
+
+	def isSession( self ):
+		"""Tells if this is a session cookie (no expiry date)."""
+		return self.expires is None
+
+	def matchesPath( self, path ):
+		"""Tells if the given request path matches this cookie path (RFC 6265,
+		section 5.1.4)."""
+		if path == self.path: return True
+		if path.startswith(self.path):
+			return self.path[-1] == "/" or path[len(self.path)] == "/"
+		return False
+
+	def asDict( self ):
+		return dict((k, getattr(self, k)) for k in self.FIELDS)
+
+	def __repr__( self ):
+		return "<cookie:%s=%s domain=%s path=%s>" % (self.name, self.value, self.domain, self.path)
+
+def parseSetCookie( header, url, now=None ):
+	"""Parses the given 'Set-Cookie' header value as received from the given
+	URL, and returns a 'Cookie', or 'None' if the cookie should be ignored
+	(RFC 6265, section 5.2)."""
+	if not header or len(header) > MAX_COOKIE_SIZE: return None
+	now = now or time.time()
+	_, host, _   = uri.location(url)
+	request_path = uri.split(url)[2]
+	parts        = header.split(";")
+	equal        = parts[0].find("=")
+	if equal == -1: return None
+	name   = parts[0][:equal].strip()
+	value  = parts[0][equal+1:].strip()
+	if not name: return None
+	cookie = Cookie(name, value, domain=host, path=_defaultPath(request_path), created=now)
+	max_age = None
+	for attribute in parts[1:]:
+		equal = attribute.find("=")
+		if equal == -1:
+			key, attr_value = attribute.strip().lower(), ""
+		else:
+			key, attr_value = attribute[:equal].strip().lower(), attribute[equal+1:].strip()
+		if key == "expires":
+			date = email.utils.parsedate_tz(attr_value)
+			if date: cookie.expires = email.utils.mktime_tz(date)
+		elif key == "max-age":
+			try:
+				max_age = int(attr_value)
+			except ValueError:
+				pass
+		elif key == "domain":
+			domain = attr_value.lstrip(".").lower()
+			if not domain: continue
+			if not domainMatch(host, domain): return None
+			# A public suffix (such as 'com') would send the cookie to every
+			# host under it, the attribute is then ignored and the cookie only
+			# sent to the host that set it
+			if isPublicSuffix(domain): continue
+			cookie.domain   = domain
+			cookie.hostOnly = False
+		elif key == "path":
+			if attr_value and attr_value[0] == "/": cookie.path = attr_value
+		elif key == "secure":
+			cookie.secure   = True
+		elif key == "httponly":
+			cookie.httpOnly = True
+	# Max-Age has precedence over Expires
+	if max_age is not None:
+		cookie.expires = now + max_age
+	return cookie
+
+def domainMatch( host, domain ):
+	"""Tells if the given host domain-matches the given domain (RFC 6265,
+	section 5.1.3)."""
+	if host == domain: return True
+	return host.endswith("." + domain) and not host.replace(".", "").isdigit()
+
+def isPublicSuffix( domain ):
+	"""Tells if the given domain is a public suffix, under which anyone can
+	register a domain (see 'PUBLIC_SUFFIXES')."""
+	return domain.find(".") == -1 or domain in PUBLIC_SUFFIXES
+
+def _defaultPath( path ):
+	"""Returns the default cookie path for the given request path."""
+	if not path or path[0] != "/": return "/"
+	i = path.rfind("/")
+	if i == 0: return "/"
+	return path[:i]
+
+# -----------------------------------------------------------------------------
+#
+# COOKIE JAR
+#
+# -----------------------------------------------------------------------------
+
+class PathNode:
+	"""A node of the path trie of a domain. Each node holds the cookies set
+	for its path, indexed by '(name, path)', as paths that only differ by
+	their trailing slash ('/foo' and '/foo/') share the same node but set
+	distinct cookies."""
+
+	def __init__( self ):
+		self.children = {}
+		self.cookies  = {}
+
+class CookieJar:
+	"""Stores cookies by domain and path, and returns the cookies matching
+	a given URL. Each domain holds at most 'maxPerDomain' cookies, the ones
+	expiring first (or created first) being evicted."""
+
+	def __init__( self, maxPerDomain=MAX_PER_DOMAIN ):
+		self.maxPerDomain = maxPerDomain
+		self._domains     = {}
+		self._counts      = {}
+
+	# COOKIE MANAGEMENT
+	# ========================================================================
+
+	def add( self, cookie ):
+		"""Adds the given cookie to this jar, replacing the cookie with the
+		same name, domain and path. An expired cookie removes the existing
+		one."""
+		node     = self._node(cookie.domain, cookie.path, create=True)
+		key      = (cookie.name, cookie.path)
+		existing = node.cookies.get(key)
+		if existing:
+			cookie.created = existing.created
+			del node.cookies[key]
+			self._counts[cookie.domain] -= 1
+		if cookie.isExpired(): return None
+		node.cookies[key] = cookie
+		self._counts[cookie.domain] = self._counts.get(cookie.domain, 0) + 1
+		if self._counts[cookie.domain] > self.maxPerDomain:
+			self._evict(cookie.domain)
+		return cookie
+
+	def set( self, name, value, domain, path="/", expires=None, secure=False ):
+		"""Sets a cookie with the given name and value for the given domain."""
+		return self.add(Cookie(name, value, domain=domain.lower(), path=path,
+		expires=expires, secure=secure, hostOnly=False))
+
+	def update( self, headers, url ):
+		"""Updates this jar with the given list of 'Set-Cookie' header values,
+		received from the given URL. Returns the list of added cookies."""
+		res = []
+		if not headers: return res
+		now = time.time()
+		for header in headers:
+			cookie = parseSetCookie(header, url, now)
+			if cookie and self.add(cookie): res.append(cookie)
+		return res
+
+	def remove( self, name, domain, path="/" ):
+		"""Removes the cookie with the given name, domain and path."""
+		node = self._node(domain, path)
+		if node and node.cookies.has_key((name, path)):
+			del node.cookies[(name, path)]
+			self._counts[domain] -= 1
+			return True
+		return False
+
+	def clear( self, domain=None ):
+		"""Removes all the cookies (or only the cookies for the given
+		domain)."""
+		if domain is None:
+			self._domains = {}
+			self._counts  = {}
+		else:
+			self._domains.pop(domain, None)
+			self._counts.pop(domain, None)
+
+	def clearSession( self ):
+		"""Removes the session cookies (as a browser does when it quits)."""
+		for cookie in self.cookies():
+			if cookie.isSession(): self.remove(cookie.name, cookie.domain, cookie.path)
+
+	def expire( self, now=None ):
+		"""Removes the expired cookies from this jar."""
+		now = now or time.time()
+		for cookie in self.cookies():
+			if cookie.isExpired(now): self.remove(cookie.name, cookie.domain, cookie.path)
+
+	# LOOKUP
+	# ========================================================================
+
+	def match( self, url, now=None ):
+		"""Returns the list of cookies that should be sent to the given URL,
+		longer paths first (RFC 6265, section 5.4)."""
+		scheme, host, _ = uri.location(url)
+		path   = uri.split(url)[2] or "/"
+		secure = scheme == "https"
+		now    = now or time.time()
+		res    = []
+		if not self._domains: return res
+		segments = path.split("/")[1:]
+		for domain in self._candidates(host):
+			node = self._domains.get(domain)
+			if node is None: continue
+			expired = []
+			depth   = 0
+			while node is not None:
+				for cookie in node.cookies.itervalues():
+					if cookie.hostOnly and domain != host: continue
+					if cookie.secure and not secure: continue
+					if cookie.isExpired(now):
+						expired.append(cookie)
+					elif cookie.matchesPath(path):
+						res.append(cookie)
+				if depth >= len(segments): break
+				node   = node.children.get(segments[depth])
+				depth += 1
+			for cookie in expired: self.remove(cookie.name, cookie.domain, cookie.path)
+		res.sort(key=lambda c:(-len(c.path), c.created))
+		return res
+
+	def forURL( self, url ):
+		"""Returns the cookies for the given URL as a list of (name, value)
+		pairs."""
+		return list((c.name, c.value) for c in self.match(url))
+
+	def header( self, url ):
+		"""Returns the value of the 'Cookie' header for the given URL."""
+		return "; ".join("%s=%s" % (c.name, c.value) for c in self.match(url))
+
+	def get( self, name, domain=None ):
+		"""Returns the value of the first cookie with the given name (and
+		domain, if given)."""
+		for cookie in self.cookies():
+			if cookie.name == name and (domain is None or cookie.domain == domain):
+				return cookie.value
+		return None
+
+	def has( self, name, domain=None ):
+		for cookie in self.cookies():
+			if cookie.name == name and (domain is None or cookie.domain == domain):
+				return True
+		return False
+
+	def cookies( self, domain=None ):
+		"""Returns the list of the cookies in this jar (for the given
+		domain)."""
+		res = []
+		if domain is None: domains = self._domains.values()
+		else: domains = filter(None, (self._domains.get(domain),))
+		for node in domains:
+			nodes = [node]
+			while nodes:
+				node = nodes.pop()
+				res.extend(node.cookies.values())
+				nodes.extend(node.children.values())
+		return res
+
+	def domains( self ):
+		return self._domains.keys()
+
+	def copy( self ):
+		"""Returns a new jar holding copies of the cookies of this jar."""
+		res = CookieJar(self.maxPerDomain)
+		for cookie in self.cookies():
+			res.add(Cookie(**cookie.asDict()))
+		return res
+
+	# PERSISTENCE
+	# ========================================================================
+
+	def save( self, path, session=False ):
+		"""Saves the cookies of this jar to the given file (as JSON). Session
+		cookies are not saved unless 'session' is true."""
+		cookies = list(c.asDict() for c in self.cookies() if session or not c.isSession())
+		with file(path, "wb") as f:
+			json.dump(cookies, f, indent=1)
+		return len(cookies)
+
+	def load( self, path ):
+		"""Loads the cookies saved in the given file in this jar. Expired
+		cookies are ignored.
+
+		NOTE: 'json' gives unicode strings, which are encoded back to byte
+		strings (as 'json.dump' decoded them from UTF-8), as the cookies
+		parsed from the headers are byte strings, and unicode ones would end up
+		mixed with the bytes of the request headers."""
+		with file(path, "rb") as f:
+			cookies = json.load(f)
+		count = 0
+		for data in cookies:
+			data   = dict((str(k), _bytes(v)) for k, v in data.items() if k in Cookie.FIELDS)
+			cookie = Cookie(**data)
+			if not cookie.isExpired() and self.add(cookie): count += 1
+		return count
+
+	# HELPERS
+	# ========================================================================
+
+	def _candidates( self, host ):
+		"""Returns the domains that the given host may match: the host itself
+		and its parent domains."""
+		res = [host]
+		if host.replace(".", "").isdigit(): return res
+		i = host.find(".")
+		while i != -1:
+			res.append(host[i+1:])
+			i = host.find(".", i + 1)
+		return res
+
+	def _node( self, domain, path, create=False ):
+		node = self._domains.get(domain)
+		if node is None:
+			if not create: return None
+			node = self._domains[domain] = PathNode()
+		path = path.rstrip("/")
+		if not path: return node
+		for segment in path.split("/")[1:]:
+			child = node.children.get(segment)
+			if child is None:
+				if not create: return None
+				child = node.children[segment] = PathNode()
+			node = child
+		return node
+
+	def _evict( self, domain ):
+		"""Evicts cookies from the given domain until the limit is met, removing
+		expired cookies first, then the oldest ones."""
+		now     = time.time()
+		cookies = self.cookies(domain)
+		cookies.sort(key=lambda c:(not c.isExpired(now), c.created))
+		for cookie in cookies[:max(0, len(cookies) - self.maxPerDomain)]:
+			self.remove(cookie.name, cookie.domain, cookie.path)
+
+	def __iter__( self ):
+		return iter(self.cookies())
+
+	def __len__( self ):
+		return sum(self._counts.values())
+
+	def __repr__( self ):
+		return repr(self.cookies())
+
+def _bytes( value ):
+	if isinstance(value, unicode): return value.encode("utf-8")
+	return value
+
+# EOF - vim: tw=80 ts=4 sw=4 noet
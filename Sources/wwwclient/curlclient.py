@@ -12,7 +12,7 @@
 # Last mod  : 04-Jul-2006
 # -----------------------------------------------------------------------------
 
-import StringIO, urlparse, time, client, pycurl
+import time, errno, socket, threading, client, uri, resolver, hooks, pycurl
 
 # TODO: Find more use cases for chunked mode
 # TODO: Add cookie encode/decode functions
@@ -32,6 +32,7 @@ It features:
  - Custom headers support
  - Custom request modification callback
  - Custom form/data encoding function (when there are troubles with Curl)
+ - Pooled Curl handles, sharing their DNS cache and TLS sessions
 
 The basic usage is to instanciate a HTTClient class, and then call GET and POST
 methods on the instance.
@@ -59,24 +60,166 @@ POST).
 
 """
 
+# Curl errors that denote a transport failure, which are raised as the
+# corresponding 'socket' errors so that the 'retries' policies recognize them
+TIMEOUT_ERRORS = (28,)               # OPERATION_TIMEDOUT
+RESET_ERRORS   = (18, 52, 55, 56)    # PARTIAL_FILE, GOT_NOTHING, SEND_ERROR, RECV_ERROR
+
+# -----------------------------------------------------------------------------
+#
+# HANDLES
+#
+# -----------------------------------------------------------------------------
+
+def createShare():
+	"""Returns a 'pycurl.CurlShare' that shares the DNS cache and the TLS
+	sessions (and the connection cache, when Curl supports it) of the handles
+	it is given to. PyCurl does the locking, so that a share can be used by
+	handles in different threads. Cookies are not shared, as they are kept by
+	the session cookie jars."""
+	share = pycurl.CurlShare()
+	share.setopt(pycurl.SH_SHARE, pycurl.LOCK_DATA_DNS)
+	# NOTE: These are only available with recent versions of Curl
+	for name in ("LOCK_DATA_SSL_SESSION", "LOCK_DATA_CONNECT"):
+		if hasattr(pycurl, name):
+			try:
+				share.setopt(pycurl.SH_SHARE, getattr(pycurl, name))
+			except pycurl.error:
+				pass
+	return share
+
+class HandlePool:
+	"""A thread-safe pool of Curl handles. Handles are reset when they are
+	given back, and then reused, which keeps their connections (and their
+	TLS sessions) alive across requests. At most 'maxHandles' idle handles are
+	kept, the others being closed."""
+
+	def __init__( self, maxHandles=16, share=None ):
+		self.maxHandles = maxHandles
+		self.share      = share or createShare()
+		self._handles   = []
+		self._lock      = threading.Lock()
+
+	def acquire( self ):
+		"""Returns an idle handle (or a new one), linked to the share."""
+		self._lock.acquire()
+		try:
+			handle = self._handles and self._handles.pop() or None
+		finally:
+			self._lock.release()
+		if handle is None:
+			handle = pycurl.Curl()
+			handle.setopt(pycurl.SHARE, self.share)
+		return handle
+
+	def release( self, handle ):
+		"""Gives back the given handle, which is reset (or closed if there are
+		already enough idle handles)."""
+		# NOTE: Resetting a handle clears its options, but keeps its share and
+		# its connections
+		handle.reset()
+		self._lock.acquire()
+		try:
+			if len(self._handles) < self.maxHandles:
+				self._handles.append(handle)
+				handle = None
+		finally:
+			self._lock.release()
+		if handle: handle.close()
+
+	def close( self ):
+		"""Closes the idle handles."""
+		self._lock.acquire()
+		try:
+			handles, self._handles = self._handles, []
+		finally:
+			self._lock.release()
+		for handle in handles: handle.close()
+
+# The pool shared by the HTTP clients (unless they are given their own)
+POOL = HandlePool()
+
+class Receiver:
+	"""Receives the responses to a request from Curl. The header lines (given
+	to 'header') are kept apart from the body, whose chunks (given to 'write')
+	are only joined once the transfer is done. The body is then copied once,
+	instead of being copied into a buffer, out of it with the headers, and
+	then sliced out of the message again.
+
+	The 'after_headers' hook is fired (with the given client) as soon as the
+	header block of each response is received, and 'after_body' once the
+	transfer is done (see 'done').
+
+	NOTE: The chunks are joined into a string rather than kept in a
+	'bytearray', as the parser and scraper work on strings, which would
+	require the same copy."""
+
+	def __init__( self, httpClient=None ):
+		self._client   = httpClient
+		self._headers  = []
+		self._chunks   = []
+		self._received = 0
+
+	def header( self, line ):
+		line = line.rstrip("\r\n")
+		# Each response (including provisional ones) starts with a status
+		# line, and ends with an empty line
+		if line.startswith("HTTP/"):
+			self._headers.append((line, []))
+		elif line and self._headers:
+			self._headers[-1][1].append(line)
+		elif not line and self._received < len(self._headers):
+			self._received = len(self._headers)
+			if hooks.ACTIVE:
+				first, lines = self._headers[-1]
+				hooks.fire(hooks.AFTER_HEADERS, self._client, first, client.CRLF.join(lines))
+
+	def write( self, data ):
+		self._chunks.append(data)
+
+	def done( self ):
+		"""Tells that the transfer is done, joining the chunks of the
+		body."""
+		self._chunks = ["".join(self._chunks)]
+		if hooks.ACTIVE and self._headers:
+			first, lines = self._headers[-1]
+			hooks.fire(hooks.AFTER_BODY, self._client, first, client.CRLF.join(lines), self._chunks[0])
+
+	def responses( self ):
+		"""Returns the list of '[firstline, headers, body]' responses, the body
+		belonging to the last (final) response."""
+		res = list([first, client.CRLF.join(lines), ""] for first, lines in self._headers)
+		if res: res[-1][2] = "".join(self._chunks)
+		self._chunks = []
+		return res
+
+# -----------------------------------------------------------------------------
+#
+# CLIENT
+#
+# -----------------------------------------------------------------------------
+
 # NOTE: A useful reference for understanding HTTP is the following website
 # <http://www.jmarshall.com/easy/http>
 class HTTPClient(client.HTTPClient):
 	"""Sends and manages HTTP requests using the PyCURL library. Each instance
 	should be used in a single thread (no sharing), because the same Curl
-	instance is kept by all methods."""
+	instance is kept by all methods. The Curl handles are taken from the given
+	'HandlePool' (the shared 'POOL' by default), which can be shared by
+	clients in different threads."""
 
-	def __init__( self, encoding="latin-1" ):
+	def __init__( self, encoding="latin-1", pool=None ):
 		client.HTTPClient.__init__(self, encoding)
 		self._curl       = None
-		self._buffer     = None
+		self._receiver   = None
+		self._pool       = pool or POOL
 
 	def GET( self, url, headers=None ):
 		"""Gets the given URL, setting the given headers (as a list of strings),
 		and optionnaly following redirects (false by default)."""
 		r, s = self._prepareRequest( url, headers )
 		self._performRequest()
-		return self.data()
+		return self.responses()
 
 	def POST( self, url, data=None, mimetype=None, fields=None, attach=None,
 	headers=None, curlEncode=False ):
@@ -109,59 +252,96 @@ class HTTPClient(client.HTTPClient):
 			r, s = self._prepareRequest( url, headers )
 			r.setopt(pycurl.POST, 1)
 			r.setopt(pycurl.HTTPPOST, post_data)
+		# Otherwise the body is streamed from our own multipart encoder, which
+		# Curl reads from as it sends the request
 		else:
 			assert mimetype == None, "Mimetype is ignored when no data is given."
-			data, mime_type = self.encode(fields, attach)
+			encoder = self.encoder(fields, attach)
 			if not headers: headers = []
 			headers = list(headers)
-			headers.append("Content-Type: " + mime_type)
+			headers.append("Content-Type: " + encoder.contentType())
 			r, s = self._prepareRequest( url, headers )
 			r.setopt(pycurl.POST, 1)
-			r.setopt(pycurl.POSTFIELDS, data)
+			r.setopt(pycurl.POSTFIELDSIZE_LARGE, encoder.size())
+			r.setopt(pycurl.READFUNCTION, encoder.read)
 		# PyCurl offers three ways to do a POST
 		# If there is data, we attach it
 		# Now we can perform the request
 		self._performRequest()
-		return self.data()
+		return self.responses()
 	
 	def _prepareRequest( self, url, headers = None ):
-		"""Returns a pair (request, stringio) corresponding to an HTTP request
+		"""Returns a pair (request, receiver) corresponding to an HTTP request
 		to the given url with the given headers (as a list of strings)"""
 		assert self._curl == None, "Only one request is allowed per instance"
-		c = self._curl = pycurl.Curl()
-		s = self._buffer = StringIO.StringIO()
-		c.setopt(c.URL, self._absoluteURL(url))
+		c = self._curl = self._pool.acquire()
+		s = self._receiver = Receiver(self)
+		url = self._absoluteURL(url)
+		c.setopt(c.URL, url)
+		# NOTE: Curl resolves the hosts itself, its handles sharing their DNS
+		# cache, which expires as 'resolver.RESOLVER' entries do
+		c.setopt(pycurl.DNS_CACHE_TIMEOUT, resolver.RESOLVER.ttl)
 		c.setopt(pycurl.FOLLOWLOCATION, 0)
-		c.setopt(pycurl.HEADER, 1)
+		c.setopt(pycurl.HEADERFUNCTION, s.header)
 		c.setopt(pycurl.WRITEFUNCTION, s.write)
 		if headers:
 			if type(headers) == tuple: headers = list(headers)
 			c.setopt(c.HTTPHEADER, headers)
 		return (c, s)
 
-	def _performRequest( self, counter=0 ):
-		"""Performs the current HTTP request."""
+	def _performRequest( self ):
+		"""Performs the current HTTP request. Failed requests are not retried
+		here, see the 'retries' module: Curl timeouts are raised as
+		'socket.timeout', and the connections closed or reset as a
+		'socket.error' with 'ECONNRESET'."""
 		r = self._curl
 		if self.verbose >= 2: self._curl.setopt(self._curl.VERBOSE, 1)
-		r.perform()
 		try:
-			#r.perform()
-			pass
-		except Exception, e:
-			if counter == self.retryCount:
-				raise e
-			else:
-				time.sleep(self.retryDelay)
-				self._performRequest( counter + 1)
-				return
-		self._status = r.getinfo(pycurl.HTTP_CODE)
-		self._url    = r.getinfo(pycurl.EFFECTIVE_URL)
-		self._protocol, self._host, _, _, _, _ = urlparse.urlparse(self._url)
-		self._parseResponse(self._buffer.getvalue())
-		self._curl.close()
-		self._curl = None
+			try:
+				r.perform()
+			except pycurl.error, e:
+				code = e.args and e.args[0]
+				if code in TIMEOUT_ERRORS: raise socket.timeout(*e.args[1:])
+				if code in RESET_ERRORS:   raise socket.error(errno.ECONNRESET, *e.args[1:])
+				raise
+			self._receiver.done()
+			self._status = r.getinfo(pycurl.HTTP_CODE)
+			self._url    = r.getinfo(pycurl.EFFECTIVE_URL)
+			timings      = self._getTimings(r)
+		finally:
+			# The handle is released even if the request failed, so that the
+			# client can send the next one
+			self._pool.release(self._curl)
+			self._curl = None
+		self._protocol, self._host, _, _, _ = uri.split(self._url)
+		receiver, self._receiver = self._receiver, None
+		self._parseResponses(receiver.responses(), timings)
 		if self.verbose >= 1: print self.info(), "\n"
 
+	def _getTimings( self, curl ):
+		"""Returns the 'client.Timings' of the request performed by the given
+		Curl handle. Curl gives times that are relative to the start of the
+		request, from which the duration of each phase is computed."""
+		timings     = client.Timings()
+		namelookup  = curl.getinfo(pycurl.NAMELOOKUP_TIME)
+		connect     = curl.getinfo(pycurl.CONNECT_TIME)
+		appconnect  = 0
+		# NOTE: APPCONNECT_TIME is only available with recent versions of Curl
+		if hasattr(pycurl, "APPCONNECT_TIME"):
+			appconnect = curl.getinfo(pycurl.APPCONNECT_TIME)
+		pretransfer = curl.getinfo(pycurl.PRETRANSFER_TIME)
+		start       = curl.getinfo(pycurl.STARTTRANSFER_TIME)
+		total       = curl.getinfo(pycurl.TOTAL_TIME)
+		timings.started  = time.time() - total
+		timings.dns      = namelookup
+		timings.connect  = max(0, connect - namelookup)
+		if appconnect: timings.tls = max(0, appconnect - connect)
+		timings.ttfb     = max(0, start - pretransfer)
+		timings.transfer = max(0, total - start)
+		timings.bytesIn  = int(curl.getinfo(pycurl.HEADER_SIZE) + curl.getinfo(pycurl.SIZE_DOWNLOAD))
+		timings.bytesOut = int(curl.getinfo(pycurl.REQUEST_SIZE) + curl.getinfo(pycurl.SIZE_UPLOAD))
+		return timings
+
 	def curlEncode(self, fields=(), attach=()):
 		"""This is an alternative implementation of the encoder using the Curl
 		back-end. This returns nothing, but modifies the current curl request
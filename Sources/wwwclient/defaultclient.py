@@ -12,18 +12,19 @@
 # Last mod  : 09-Jul-2012
 # -----------------------------------------------------------------------------
 
-import httplib, urlparse, client
+import httplib, socket, time, client, uri, resolver, hooks
 
-# TODO: Add retry support
 class HTTPClient(client.HTTPClient):
-	"""Sends and manages HTTP requests using the 'httplib' and 'urlparse'
+	"""Sends and manages HTTP requests using the 'httplib' and 'uri'
 	modules. Using the 'curlclient' may be more efficient than using this one."""
 
-	TIMEOUT = 10
+	TIMEOUT        = 10
+	PIPELINE_DEPTH = 8
 
 	def __init__( self, encoding="latin-1" ):
 		client.HTTPClient.__init__(self, encoding)
-		self._http = None
+		self._http        = None
+		self._connections = {}
 
 	def GET  ( self, url, headers=None ):
 		return self._request(url, headers, "GET")
@@ -34,6 +35,36 @@ class HTTPClient(client.HTTPClient):
 	def INFO ( self, url, headers=None ):
 		return self._request(url, headers, "INFO")
 
+	def GETMany( self, requests ):
+		"""Gets the given list of '(url, headers)' requests over one persistent
+		connection per host. Requests are pipelined (at most 'PIPELINE_DEPTH'
+		at once) when the server keeps the connection alive, and are otherwise
+		sent one after the other. See 'client.HTTPClient.GETMany'."""
+		groups = {}
+		order  = []
+		for index, request in enumerate(requests):
+			url, headers = request
+			url = self._absoluteURL(url)
+			protocol, host, path, query, _ = uri.split(url)
+			if protocol not in ("http", "https"):
+				raise Exception("Protocol not supported: "  + str(protocol))
+			key = (protocol, host)
+			if not groups.has_key(key):
+				groups[key] = []
+				order.append(key)
+			groups[key].append((index, url, self._requestPath(path, query), headers))
+		for key in order:
+			for index, url, response in self._pipeline(key[0], key[1], groups[key]):
+				result = self._finaliseRequest(response[0], url, "GET", response[1])
+				if self.verbose >= 1: self._log(self.info())
+				yield index, result
+
+	def close( self ):
+		"""Closes the persistent connections opened by this client."""
+		for connection in self._connections.values():
+			connection.close()
+		self._connections = {}
+
 	def POST ( self, url, data=None, mimetype=None, fields=None, attach=None, headers=None):
 		return self._submit(url,data,mimetype,fields,attach,headers,"POST")
 
@@ -46,20 +77,19 @@ class HTTPClient(client.HTTPClient):
 		# We prepare the request
 		response   = None
 		if headers == None: headers = ()
-		cache_key  = None
-		was_cached = False
-		if self._cache:
-			response  = self._cache.get(url)
-			was_cache = True
-		if not response:
+		if self._cache: response = self._cache.get(url)
+		timings    = None
+		if response:
+			timings = client.Timings()
+			timings.cached = True
+		else:
 			self._prepareRequest(method=method, url=url, headers=headers)
 			# And get the response
-			response = self._performRequest()
+			response, timings = self._performRequest()
 			if self._cache:
 				self._cache.set(url, response)
-		return self._finaliseRequest(response, url, method)
-		result   = self._finaliseRequest(response, url, method)
-		if self.verbose >= 1 and not was_cached: self._log(self.info())
+		result   = self._finaliseRequest(response, url, method, timings)
+		if self.verbose >= 1 and timings: self._log(self.info())
 		return result
 
 	def _submit( self, url, data=None, mimetype=None, fields=None, attach=None, headers=None, method="POST" ):
@@ -69,43 +99,51 @@ class HTTPClient(client.HTTPClient):
 			assert not fields, "Fields must be empty when data is provided"
 			assert not attach, "No attachment is allowed when data is provided"
 			data = self._valueToPostData(data)
-		# Otherwise we encode the data as multipart
+		# Otherwise we encode the data as multipart, the body being streamed
+		# from the encoder
 		if data == None:
 			assert mimetype == None, "Mimetype is ignored when no data is given."
-			attach = self._ensureAttachment(attach)
-			data, mimetype = self.encode(fields, attach)
+			if fields or attach:
+				data     = self.encoder(fields, attach)
+				mimetype = data.contentType()
+				length   = data.size()
+			else:
+				data, mimetype = self.encode(fields, attach)
+				length   = len(data)
+		else:
+			length = len(data)
+		if headers == None: headers = []
+		headers = list(headers)
 		# In case we have a mimetype, we update the list of headers
 		# appropriately
 		if mimetype:
-			if headers == None: headers = []
-			headers = list(filter(lambda x: client.RE_CONTENT_TYPE.match(x) == None, headers))
+			# NOTE: The headers are given without their CRLF, which
+			# 'RE_CONTENT_TYPE' expects
+			headers = list(filter(lambda x: x.split(":", 1)[0].strip().lower() != "content-type", headers))
 			headers.append("Content-Type: " + mimetype)
 		# We add the Content-Length header to the headers list
-		headers.append("Content-Length: " + self._valueToString(len(data)))
+		headers.append("Content-Length: " + self._valueToString(length))
 		# We prepare the request
 		self._prepareRequest(method=method, url=url, headers=headers, body=data)
 		# And get the response
-		response = self._performRequest()
-		result   = self._finaliseRequest(response, url, method)
+		response, timings = self._performRequest()
+		result   = self._finaliseRequest(response, url, method, timings)
 		if self.verbose >= 1: self._log(self.info())
 		return result
 
 	def _prepareRequest( self, url, headers=(), body=None, method="GET" ):
 		assert self._http == None, "Only one request is allowed per instance"
-		url_parsed = urlparse.urlparse(url)
-		host       = url_parsed[1] or self.host()
+		url        = self._absoluteURL(url)
+		protocol, host, path, query, _ = uri.split(url)
 		if not host:
 			raise Exception("No host defined for request: %s" % (url))
-		i = url.find(host)
-		if i == -1:
-			raise Exception("URL does not correspond to current host (%s): %s " % (host, url))
-		url_path = url[i+len(host):]
-		if url_parsed[0] == "http":
-			self._http = httplib.HTTPConnection(host, timeout=self.TIMEOUT)
-		elif url_parsed[0] == "https":
-			self._http = httplib.HTTPSConnection(host, timeout=self.TIMEOUT)
+		url_path = self._requestPath(path, query)
+		if protocol == "http":
+			self._http = HTTPConnection(host, timeout=self.TIMEOUT)
+		elif protocol == "https":
+			self._http = HTTPSConnection(host, timeout=self.TIMEOUT)
 		else:
-			raise Exception("Protocol not supported: "  + str(url_parsed[0]))
+			raise Exception("Protocol not supported: "  + str(protocol))
 		http_headers = {}
 		for header in headers:
 			colon = header.find(":")
@@ -116,32 +154,264 @@ class HTTPClient(client.HTTPClient):
 		#print headers
 		#print body
 		#print "=---------------------------------------"
-		request  = self._http.request(method, url_path, body, http_headers)
+		try:
+			request = self._http.request(method, url_path, body, http_headers)
+		except:
+			# The connection is released, so that the request can be sent again
+			self._http.close()
+			self._http = None
+			raise
 		return request
 
 	def _performRequest( self, counter=0 ):
+		"""Receives the response to the current request, and returns it as a
+		string along with the request 'client.Timings'."""
 		try:
+			timings  = self._http.timings
 			response = self._http.getresponse()
-			if response.version == 10: res = "HTTP/1.0 "
-			else: res = "HTTP/1.1 "
-			res += str(response.status) + " "
-			res += str(response.reason) + client.CRLF
-			res += str(response.msg) + client.CRLF
-			res += response.read()
+			received = time.time()
+			res      = self._responseAsString(response)
+			timings.ttfb     = received - self._http.sent
+			timings.transfer = time.time() - received
+			timings.bytesIn  = len(res)
 			if self._http: self._http.close()
 			self._http = None
-			return res
+			return res, timings
 		except Exception, e:
 			if self._http: self._http.close()
 			self._http = None
 			raise e
 
-	def _finaliseRequest( self, response, url, method ):
+	def _requestPath( self, path, query ):
+		"""Returns the path (and query) to be sent in the request line. The
+		fragment is never sent to the server."""
+		url_path = path or "/"
+		if query is not None: url_path += "?" + query
+		return url_path
+
+	def _responseAsString( self, response ):
+		"""Reads the given 'httplib.HTTPResponse' and returns it as a string,
+		as expected by '_parseResponse'. As 'httplib' already decodes chunked
+		bodies, the 'Transfer-Encoding' header is removed.
+
+		The response headers were received by 'begin', so the 'after_headers'
+		hook is fired before reading the body, and 'after_body' once it is
+		read."""
+		if response.version == 10: first_line = "HTTP/1.0 "
+		else: first_line = "HTTP/1.1 "
+		first_line += str(response.status) + " " + str(response.reason)
+		headers = "".join(h for h in response.msg.headers if not h.lower().startswith("transfer-encoding"))
+		if hooks.ACTIVE: hooks.fire(hooks.AFTER_HEADERS, self, first_line, headers.rstrip(client.CRLF))
+		body    = response.read()
+		if hooks.ACTIVE: hooks.fire(hooks.AFTER_BODY, self, first_line, headers.rstrip(client.CRLF), body)
+		return first_line + client.CRLF + headers + client.CRLF + body
+
+	# PIPELINING
+	# ========================================================================
+
+	def _pipeline( self, protocol, host, items ):
+		"""Sends the given '(index, url, path, headers)' GET requests to the
+		given host, yielding '(index, url, response)' as responses are
+		received. The first request is sent alone: requests are pipelined
+		only once the server has shown that it keeps the connection alive
+		(HTTP/1.1 without 'Connection: close'). If the connection is closed
+		or fails, the unanswered requests are sent again sequentially, and if
+		a connection kept from a previous call fails before any response (as
+		the server may close idle connections), they are sent again on a
+		fresh connection."""
+		pending    = list(items)
+		pipelining = True
+		while pending:
+			reused     = self._connections.has_key((protocol, host))
+			connection = self._connection(protocol, host)
+			reader     = _Reader(connection.sock.makefile("rb"))
+			sent       = []
+			progress   = False
+			depth      = 1
+			# The first response accounts for the connection establishment
+			opened     = connection.timings
+			try:
+				while pending or sent:
+					while pending and len(sent) < depth:
+						item    = pending[0]
+						message = self._requestMessage(host, item[2], item[3])
+						connection.sock.sendall(message)
+						sent.append(pending.pop(0) + (time.time(), len(message)))
+					response = httplib.HTTPResponse(reader, method="GET")
+					waiting  = max(sent[0][-2], connection.sent)
+					response.begin()
+					received = time.time()
+					message  = self._responseAsString(response)
+					item     = sent.pop(0)
+					progress = True
+					timings  = client.Timings()
+					if opened:
+						timings.dns, timings.connect, timings.tls = opened.dns, opened.connect, opened.tls
+						opened = None
+					timings.ttfb     = received - waiting
+					timings.transfer = time.time() - received
+					timings.bytesIn  = len(message)
+					timings.bytesOut = item[-1]
+					connection.sent  = time.time()
+					yield item[0], item[1], (message, timings)
+					if response.will_close:
+						self._closeConnection(protocol, host)
+						pending = sent + pending
+						break
+					if pipelining: depth = self.PIPELINE_DEPTH
+			except (socket.error, httplib.HTTPException), e:
+				self._closeConnection(protocol, host)
+				pending = sent + pending
+				# A kept connection that fails right away was most likely
+				# closed by the server while idle, so we open a new one
+				if not progress and reused: continue
+				# A fresh connection that fails right away is an actual error
+				if not progress: raise e
+				# Otherwise the server may not support pipelining, so we
+				# resend the unanswered requests one after the other
+				pipelining = False
+
+	def _connection( self, protocol, host ):
+		"""Returns the persistent connection to the given host, opening it if
+		necessary."""
+		key        = (protocol, host)
+		connection = self._connections.get(key)
+		if connection is None:
+			if protocol == "https":
+				connection = HTTPSConnection(host, timeout=self.TIMEOUT)
+			else:
+				connection = HTTPConnection(host, timeout=self.TIMEOUT)
+			connection.connect()
+			self._connections[key] = connection
+		return connection
+
+	def _closeConnection( self, protocol, host ):
+		connection = self._connections.pop((protocol, host), None)
+		if connection: connection.close()
+
+	def _requestMessage( self, host, path, headers, method="GET" ):
+		"""Returns the HTTP request message for the given path and list of
+		headers (as strings)."""
+		lines = ["%s %s HTTP/1.1" % (method, path)]
+		names = []
+		for header in headers or ():
+			colon = header.find(":")
+			names.append(header[:colon].strip().lower())
+			lines.append("%s:%s" % (header[:colon].strip(), header[colon+1:].rstrip()))
+		if "host" not in names: lines.insert(1, "Host: " + host)
+		if "accept-encoding" not in names: lines.append("Accept-Encoding: identity")
+		return client.CRLF.join(lines) + client.CRLF + client.CRLF
+
+	def _finaliseRequest( self, response, url, method, timings=None ):
 		self._url    = self._absoluteURL(url)
 		self._method = method
 		self._status = response.split()[1]
-		res          = self._parseResponse(response)
-		self._protocol, self._host, _, _, _, _ = urlparse.urlparse(self._url)
+		res          = self._parseResponse(response, timings)
+		self._protocol, self._host, _, _, _ = uri.split(self._url)
 		return res
-			
+
+# -----------------------------------------------------------------------------
+#
+# CONNECTIONS
+#
+# -----------------------------------------------------------------------------
+
+class HTTPConnection(httplib.HTTPConnection):
+	"""An 'httplib.HTTPConnection' that measures the resolution of the host
+	name and the connection (in its 'timings'), counts the bytes it sends and
+	records when the request was last sent (as 'sent')."""
+
+	def __init__( self, *args, **kwargs ):
+		httplib.HTTPConnection.__init__(self, *args, **kwargs)
+		self.timings = client.Timings()
+		self.sent    = 0
+
+	def connect( self ):
+		_connect(self)
+
+	def send( self, data ):
+		_send(self, httplib.HTTPConnection, data)
+
+class HTTPSConnection(httplib.HTTPSConnection):
+	"""Same as 'HTTPConnection', also measuring the TLS handshake."""
+
+	def __init__( self, *args, **kwargs ):
+		httplib.HTTPSConnection.__init__(self, *args, **kwargs)
+		self.timings = client.Timings()
+		self.sent    = 0
+
+	def connect( self ):
+		_connect(self)
+		if self._tunnel_host: server_hostname = self._tunnel_host
+		else:                 server_hostname = self.host
+		started   = time.time()
+		self.sock = self._context.wrap_socket(self.sock, server_hostname=server_hostname)
+		self.timings.tls = time.time() - started
+
+	def send( self, data ):
+		_send(self, httplib.HTTPSConnection, data)
+
+def _connect( connection ):
+	"""Resolves the host (through the shared 'resolver.RESOLVER') and opens
+	the socket of the given connection, as 'httplib.HTTPConnection.connect'
+	does, measuring both phases. Each address of the host is tried in turn."""
+	started   = time.time()
+	addresses = resolver.resolve(connection.host, connection.port)
+	resolved  = time.time()
+	error     = None
+	for address in addresses:
+		try:
+			connection.sock = socket.create_connection(address[4][:2], connection.timeout, connection.source_address)
+			break
+		except socket.error, e:
+			error = e
+	else:
+		# The cached addresses may be stale, so the host is resolved again
+		# next time
+		resolver.RESOLVER.invalidate(connection.host)
+		raise error
+	connection.timings.dns     = resolved - started
+	connection.timings.connect = time.time() - resolved
+	if connection._tunnel_host: connection._tunnel()
+
+def _send( connection, connectionClass, data ):
+	if hasattr(data, "read"): data = _CountingReader(data, connection.timings)
+	else: connection.timings.bytesOut += len(data)
+	connectionClass.send(connection, data)
+	connection.sent = time.time()
+
+class _CountingReader:
+	"""Wraps a request body that is read by chunks, counting the bytes that
+	are read."""
+
+	def __init__( self, fp, timings ):
+		self._fp      = fp
+		self._timings = timings
+
+	def read( self, *args ):
+		data = self._fp.read(*args)
+		self._timings.bytesOut += len(data)
+		return data
+
+class _Reader:
+	"""Wraps the buffered file of a persistent connection, so that it can
+	be given as a socket to successive 'httplib.HTTPResponse' instances.
+	Responses close their file once read, which would otherwise discard the
+	data already buffered for the next responses."""
+
+	def __init__( self, fp ):
+		self._fp = fp
+
+	def makefile( self, *args ):
+		return self
+
+	def read( self, *args ):
+		return self._fp.read(*args)
+
+	def readline( self, *args ):
+		return self._fp.readline(*args)
+
+	def close( self ):
+		pass
+
 # EOF - vim: tw=80 ts=4 sw=4 noet
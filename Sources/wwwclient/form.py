@@ -12,9 +12,13 @@
 # Last mod  : 26-Jul-2008
 # -----------------------------------------------------------------------------
 
-import re
+import re, urllib
+import client
 
-RE_FORMDATA  = re.compile("<(form|input|select|option|textarea)", re.I)
+FORM_TAGS    = ("form", "input", "select", "option", "textarea", "button")
+ACTION_TYPES = ("submit", "image")
+BUTTON_TYPES = ("reset", "button")
+CHECK_TYPES  = ("checkbox", "radio")
 
 # -----------------------------------------------------------------------------
 #
@@ -33,35 +37,56 @@ class Form:
 	- a _single action_
 	- a _list of inputs_ which are dicts of equivalent HTML element attributes.
 	  For elements such as `select` or `textarea`, the input `type` property is
-	  set to the actual element type.
+	  set to the actual element type. Select inputs have an `options` list of
+	  (value, label, selected) triples, and `button` elements are inputs of
+	  their button type (`submit` by default).
 	- a _list of values_ which will be associated with values when filling the
 	  form.
 	
 	Form values are cleanly separated from their inputs, so that you can simply
 	clear the values to resubmit the form.
+
+	Unicode values are encoded with the form 'encoding' when submitted, which
+	is the charset of the page the form was found in (when scraped from a
+	'browse.Transaction'), as browsers do.
 	"""
 
 # TODO: Add STRICT mode for form that checks possible values/action/field names
 
-	def __init__( self, name, action=None ):
-		self.name    = name
-		self.action  = action
-		self.inputs  = []
-		self.values  = {}
-		self._fields = {}
+	def __init__( self, name, action=None, encoding="latin-1" ):
+		self.name     = name
+		self.action   = action
+		self.encoding = encoding
+		self.inputs   = []
+		self.values   = {}
+		self._fields  = {}
+		self._lower   = {}
+		self._groups  = {}
 
 	def _addInput( self, inputDict ):
 		"""Private function used by the `parseForms` function to add an input to
-		this form. The input will be added to the `inputs` list and to the
-		`_fields` dict."""
+		this form. The input will be added to the `inputs` list and indexed by
+		name (the first input of a given name being the one returned by
+		`field()`, all of them being in the group returned by `group()`)."""
 		self.inputs.append(inputDict)
-		if inputDict.get("name"):
-			self._fields[inputDict["name"]] = inputDict
+		name = inputDict.get("name")
+		if name:
+			if not self._fields.has_key(name):
+				self._fields[name] = inputDict
+				self._groups[name] = []
+			self._lower.setdefault(name.lower(), inputDict)
+			self._groups[name].append(inputDict)
+
+	@staticmethod
+	def inputType( inputDict ):
+		"""Returns the (lowercase) type of the given input, 'text' being the
+		default."""
+		return (inputDict.get("type") or "text").lower()
 
 	def fields( self, namelike=None, namesOnly=False ):
 		"""Returns that list of inputs (or input names if namesOnly is True) that
 		can be assigned a value (checkboxes, inputs, text areas, etc)."""
-		res = filter(lambda f:f.get("type") != "submit", self.inputs)
+		res = filter(lambda f:self.inputType(f) not in ACTION_TYPES + BUTTON_TYPES, self.inputs)
 		if namelike:
 			namelike = re.compile(namelike)
 			res = filter(lambda f:namelike.match(f.get("name")), res)
@@ -76,19 +101,18 @@ class Form:
 	def field( self, name, caseSenstitive=True ):
 		"""Returns the field with the given name, or None if it does not
 		exist."""
-		if not caseSenstitive: name = name.lower()
-		for field in self.inputs:
-			field_name = field.get("name")
-			if field_name is None: continue
-			if not caseSenstitive: field_name = field_name.lower()
-			if field_name == name:
-				return field
-		return None
+		if caseSenstitive: return self._fields.get(name)
+		else: return self._lower.get(name.lower())
+
+	def group( self, name ):
+		"""Returns the list of inputs with the given name (for instance, the
+		radio buttons of a group)."""
+		return self._groups.get(name, [])
 	
 	def actions( self, namelike=None, namesOnly=False ):
 		"""Returns the list of inputs (or input names if namesOnly is True) that
 		correspond to form action buttons."""
-		res = filter(lambda f:f.get("type")=="submit", self.inputs)
+		res = filter(lambda f:self.inputType(f) in ACTION_TYPES, self.inputs)
 		if namelike:
 			if namelike in (str,unicode): namelike = re.compile(namelike)
 			res = filter(lambda f:namelike.match(f.get("name")), res)
@@ -147,7 +171,7 @@ class Form:
 				res.append((key, value))
 		return res
 
-	def submit( self, action=None, encoding="latin-1", strip=True, **values ):
+	def submit( self, action=None, encoding=None, strip=True, **values ):
 		"""Submits this form with the given action and given values. This
 		basically takes all the default values set within this form, replacing
 		them with the set or given values (given as keywords), and returns a list of
@@ -161,36 +185,96 @@ class Form:
 		a list of parameters suitable for creating the body of a post request.
 		"""
 		self.fill(**values)
+		encoding    = encoding or self.encoding
 		parameters  = []
 		# We get the field and action names
 		field_names  = []
 		# We fill values that were initialized
 		for field in self.fields():
 			key = field.get("name")
+			if key in field_names: continue
 			field_names.append(key)
+			# Unchecked checkboxes and radio buttons are not submitted
+			if self.inputType(field) in CHECK_TYPES and not self.values.has_key(key): continue
 			value = self.values.get(key) or field.get("value") or ""
+			# Multiple values (from a multiple select) are submitted separately
+			if type(value) in (tuple, list):
+				for v in value:
+					parameters.append((key, v))
+				continue
 			if strip and not value: continue
-			if type(value) == unicode: value = unicode(value).encode(encoding)
 			parameters.append((key, value))
 		# And add values that do not correspond to any field
 		for key, value in values.items():
 			if key not in field_names:
 				if strip and not value: continue
-				if type(value) == unicode: value = unicode(value).encode(encoding)
 				parameters.append((key, value))
 		if action:
 			if action not in self.actions(namesOnly=True):
 				raise FormException("Action not available: %s, in form %s: choose from %s" %
 				(action, self.name, self.actions(namesOnly=True)))
-			parameters.append((action, self.values.get(action)))
-		return parameters
+			parameters.append((action, self.values.get(action) or self._fields[action].get("value")))
+		# Names and values are unicode when the form was scraped from decoded
+		# HTML, and are then encoded as well
+		return list((self._encode(key, encoding), self._encode(value, encoding))
+		for key, value in parameters)
+
+	@staticmethod
+	def _encode( value, encoding ):
+		if type(value) == unicode: return value.encode(encoding, "xmlcharrefreplace")
+		return value
+
+	def compile( self, variables=(), action=None, multipart=False,
+	encoding=None, strip=True ):
+		"""Compiles this form into a 'FormTemplate', where all the values but
+		the given 'variables' (a list of names) are encoded once and for all.
+		This is useful when the same form is submitted many times with only a
+		few changing values. The template is urlencoded, unless 'multipart' is
+		true.
+		
+		The current values of the form are used for the static fields, and as
+		the default values of the variables."""
+		slots      = []
+		defaults   = {}
+		encoding   = encoding or self.encoding
+		parameters = self.submit(action=action, encoding=encoding, strip=False)
+		# The action is submitted last, after the extra values
+		if action: parameters, action = parameters[:-1], parameters[-1]
+		for key, value in parameters:
+			if key in variables:
+				if not defaults.has_key(key): slots.append(key)
+				defaults.setdefault(key, []).append(value)
+			elif not (strip and not value):
+				slots.append((key, value))
+		for key in variables:
+			if not defaults.has_key(key):
+				slots.append(key)
+				defaults[key] = []
+		if action: slots.append(action)
+		# Single values are not given as lists
+		for key, value in defaults.items():
+			if len(value) == 1: defaults[key] = value[0]
+		return FormTemplate(self.name, self.action, slots, defaults,
+		multipart=multipart, encoding=encoding, strip=strip)
 
 	def _prefill( self ):
-		"""Sets the default values for this form."""
+		"""Sets the default values for this form. Checkboxes and radio buttons
+		only have a default value when they are checked."""
 		for inp in self.inputs:
 			name  = inp.get("name")
 			value = inp.get("value")
-			if name and value: self.values[name] = value
+			if not name: continue
+			if self.inputType(inp) in CHECK_TYPES:
+				if not inp.has_key("checked"): continue
+				if value is None: value = "on"
+				# Several checkboxes may share the same name
+				if self.values.has_key(name) and self.inputType(inp) == "checkbox":
+					previous = self.values[name]
+					if type(previous) is not list: previous = [previous]
+					value = previous + [value]
+				self.values[name] = value
+			elif value:
+				self.values[name] = value
 	
 	def asText( self ):
 		"""Returns a pretty-printed text representation of this form. This
@@ -232,36 +316,146 @@ class Form:
 	def __repr__( self ):
 		return "<form:name='%s' action='%s' fields=%s>" % (self.name, self.action, repr(self.inputs))
 
+# -----------------------------------------------------------------------------
+#
+# FORM TEMPLATE
+#
+# -----------------------------------------------------------------------------
+
+class FormTemplate:
+	"""A form template is a compiled form (see 'Form.compile') that is ready to
+	be submitted many times. Static values are encoded when the template is
+	created, so that encoding the body of a submission only encodes the
+	variables, the result being the same as when encoding the values
+	returned by 'Form.submit'.
+	
+	Templates are given to 'browse.Session.submit' as forms, or encoded
+	directly with 'encode()', which returns the '(data, mimetype)' couple
+	expected by 'browse.Session.post'."""
+
+	def __init__( self, name, action, slots, defaults, multipart=False,
+	encoding="latin-1", strip=True, boundary=client.BOUNDARY ):
+		"""Creates a new template, where 'slots' is a list of (name, value)
+		static parameters and of variable names, in submission order."""
+		self.name      = name
+		self.action    = action
+		self.multipart = multipart
+		self.encoding  = encoding
+		self.strip     = strip
+		self.boundary  = boundary
+		self.defaults  = defaults
+		self._chunks   = []
+		for slot in slots:
+			if type(slot) is tuple:
+				chunk = self._encode(slot[0], slot[1])
+				# Consecutive static values are merged in a single chunk
+				if self._chunks and type(self._chunks[-1]) is str:
+					self._chunks[-1] = self._join((self._chunks[-1], chunk))
+				else:
+					self._chunks.append(chunk)
+			else:
+				self._chunks.append((slot, self._prefix(slot)))
+		if multipart: self._end = "--" + boundary + "--" + client.CRLF
+		else:         self._end = ""
+
+	def variables( self ):
+		"""Returns the names of the variables of this template."""
+		return tuple(c[0] for c in self._chunks if type(c) is tuple)
+
+	def mimetype( self ):
+		"""Returns the mimetype of the encoded data."""
+		if self.multipart: return 'multipart/form-data; boundary=%s' % self.boundary
+		else:              return 'application/x-www-form-urlencoded'
+
+	def encode( self, **values ):
+		"""Encodes the template with the given variable values (the default
+		ones being used for the missing variables), and returns a '(data,
+		mimetype)' couple. Lists of values are submitted as multiple values."""
+		res = []
+		for chunk in self._chunks:
+			if type(chunk) is str:
+				res.append(chunk)
+				continue
+			name, prefix = chunk
+			value = values.get(name, self.defaults.get(name))
+			if type(value) not in (tuple, list): value = (value,)
+			for v in value:
+				if self.strip and not v: continue
+				v = self._valueToString(v)
+				if self.multipart: res.append(prefix + v + client.CRLF)
+				else:              res.append(prefix + urllib.quote_plus(v))
+		for name in values:
+			if not self.defaults.has_key(name):
+				raise FormException("Value is not a variable of form %s: %s" % (self.name, name))
+		return self._join(res) + self._end, self.mimetype()
+
+	def _encode( self, name, value ):
+		"""Encodes the given static value"""
+		value = self._valueToString(value)
+		if self.multipart: return self._prefix(name) + value + client.CRLF
+		else:              return self._prefix(name) + urllib.quote_plus(value)
+
+	def _prefix( self, name ):
+		"""Returns the encoded data that precedes the value of the given
+		field."""
+		name = self._valueToString(name)
+		if self.multipart:
+			return "--" + self.boundary + client.CRLF + \
+			'Content-Disposition: form-data; name="%s"' % (name) + client.CRLF + client.CRLF
+		else:
+			return urllib.quote_plus(name) + "="
+
+	def _join( self, chunks ):
+		if self.multipart: return "".join(chunks)
+		else:              return "&".join(chunks)
+
+	def _valueToString( self, value ):
+		if   type(value) == unicode: value = value.encode(self.encoding)
+		elif value == None: value = ""
+		else: value = str(value)
+		return value
+
+	def __repr__( self ):
+		return "<formtemplate:name='%s' action='%s' variables=%s>" % (self.name, self.action, repr(self.variables()))
+
 def parseForms( scraper, html ):
 	"""Will extract the forms from the HTML document in a way that tolerates
-	inputs outside of forms (this happens sometime). This function is very
-	fast, because it only uses regexes to search for tags within the
-	document, so there is no need to parse the HTML.
+	inputs outside of forms (this happens sometime). The document is given
+	either as a string or as a 'TagList' (which avoids tokenizing the
+	document again when it was already done), and its tags are processed in
+	a single pass.
 	
-	Currently form inputs, select and option are supported.
+	Currently form, input, select (with its options), textarea and button
+	elements are supported.
 	"""
 	if not html: raise Exception("No data")
-	i       = 0
-	end     = len(html)
-	matches = []
-	# We get all the form data
-	while i < end:
-		match = RE_FORMDATA.search(html, i)
-		if not match: break
-		matches.append(match)
-		i = match.end()
-	# And we create the forms tree
+	tags           = scraper.list(html)
 	current_form   = None
 	current_select = None
+	current_option = None
+	skip_until     = -1
 	forms          = {}
 	default_count  = 0
-	for match in matches:
-		# We get the end of the tag, which may be with or without a trailing
-		# /
-		tag_end    = html.find(">", match.end())
-		if html[tag_end-1] == "/": tag_end -=1
-		name       = match.group(1).lower()
-		attributes = scraper.parseAttributes(html[match.end():tag_end].strip())
+	for tag in tags.content:
+		# We skip the content of textareas
+		if tag.start < skip_until: continue
+		if not tag.isElement():
+			# The text of an option is its default value
+			if current_option is not None:
+				current_option[1] += tag.html()
+			continue
+		name = tag.name().lower()
+		if current_option is not None and (name != "option" or tag.type != tag.CLOSE):
+			_addOption(current_select, current_option)
+			current_option = None
+		if name not in FORM_TAGS: continue
+		if tag.type == tag.CLOSE:
+			if   name == "select": current_select = None
+			elif name == "option" and current_option is not None:
+				_addOption(current_select, current_option)
+				current_option = None
+			continue
+		attributes = dict(tag.attributes())
 		if name == "form":
 			form_name = attributes.get("name")
 			if not form_name:
@@ -277,46 +471,55 @@ def parseForms( scraper, html ):
 					action= scraper.expand(attributes.get("action"))
 				current_form = Form(form_name, action)
 				forms[current_form.name] = current_form
-		elif name == "input":
-			#assert current_form
-			# TODO: Make this nicer
-			# js = filter(lambda s:s[0].startswith("on"), attributes.items())
-			# FIXME: Adda a warnings interface
-			#if js:
-			#	print "Warning: Form may contain JavaScript: ", current_form.name, "input", attributes.get("name"), js
-			if not current_form:
-				# Found an INPUT type without FORM.. maybe JavaScript tricks
-				current_form= Form("no_form")
-				forms[current_form.name] = current_form
+			continue
+		if not current_form:
+			# Found an INPUT type without FORM.. maybe JavaScript tricks
+			current_form = Form("no_form")
+			forms[current_form.name] = current_form
+		if name == "input":
+			current_form._addInput(attributes)
+		elif name == "button":
+			attributes["type"] = (attributes.get("type") or "submit").lower()
 			current_form._addInput(attributes)
 		elif name == "select":
-			assert current_form
 			current_select = attributes
-			current_select["type"] = "select"
+			current_select["type"]    = "select"
+			current_select["options"] = []
 			current_form._addInput(current_select)
 		elif name == "option":
-			assert current_form
-			assert current_select
-			selected = attributes.get("selected") or ""
 			if current_select == None:
 			#	print "Warning: Option outside of select: ", current_form.name
 				continue
-			if selected.lower() == "selected":
-				current_select["value"] = attributes["value"]
-			else:
-				# TODO: We ignore them for now
-				pass
+			current_option = [attributes, ""]
 		elif name == "textarea":
-			text_end = html.find("</textarea", match.end())
-			text = html[tag_end+1:text_end]
-			attributes["type"] = "textarea"
-			attributes["value"] = text
+			html     = tag.source()
+			text_end = html.find("</textarea", tag.end)
+			if text_end == -1: text_end = len(html)
+			attributes["type"]  = "textarea"
+			attributes["value"] = html[tag.end:text_end]
 			current_form._addInput(attributes)
-		else:
-			raise Exception("Unexpected tag: " + name)
+			skip_until = text_end
+	if current_option is not None:
+		_addOption(current_select, current_option)
 	# Prefills the forms
 	for form in forms.values():
 		form._prefill()
 	return forms
 
+def _addOption( select, option ):
+	"""Adds the given '[attributes, text]' option to the given select input,
+	updating its value when the option is selected."""
+	attributes, text = option
+	value    = attributes.get("value")
+	label    = text.strip()
+	if value is None: value = label
+	selected = attributes.has_key("selected")
+	select["options"].append((value, label, selected))
+	if select.has_key("multiple"):
+		if selected: select["value"] = select.get("value", []) + [value]
+		elif not select.has_key("value"): select["value"] = []
+	elif selected or not select.has_key("value"):
+		# The first option is selected by default
+		select["value"] = value
+
 # EOF - vim: tw=80 ts=4 sw=4 noet
@@ -0,0 +1,165 @@
+#!/usr/bin/env python
+# Encoding: iso-8859-1
+# -----------------------------------------------------------------------------
+# Project   : WWWClient
+# -----------------------------------------------------------------------------
+# Author    : Sebastien Pierre                               <sebastien@ivy.fr>
+# -----------------------------------------------------------------------------
+# License   : GNU Lesser General Public License
+# Credits   : Xprima.com
+# -----------------------------------------------------------------------------
+# Creation  : 19-Oct-2026
+# Last mod  : 19-Oct-2026
+# -----------------------------------------------------------------------------
+
+import time, threading
+
+__doc__ = """\
+The 'hooks' module is a registry of callbacks that are fired at specific
+phases of the requests and of the scraping, so that profilers (or custom
+timers) can be attached without patching the code.
+
+The events and the arguments given to their callbacks are:
+
+ - 'before_request'  (transaction)                   'Transaction.do'
+ - 'after_request'   (transaction)                   'Transaction.do'
+ - 'after_headers'   (client, firstLine, headers)    transports (see below)
+ - 'after_body'      (client, firstLine, headers, body)
+ - 'after_parse'     (client, responses)             'HTTPClient._parseResponse(s)'
+ - 'on_redirect'     (session, transaction, url)     'Session.get/post'
+ - 'on_retry'        (session, url, attempt, error)  'Session.get/post'
+ - 'before_tokenize' (scraper, html)                 'HTMLTools.list/tree'
+ - 'after_tokenize'  (scraper, tagList)              'HTMLTools.list'
+ - 'after_tree'      (scraper, tree)                 'HTMLTools.tree'
+
+The 'after_headers' and 'after_body' events are fired by the transports while
+the response is received: 'after_headers' once the header block of a response
+is received (by the Curl header callback, or by 'httplib' before the body is
+read), and 'after_body' once the body is, that body being given as received
+(not yet content-decoded). The time between the two is then the body transfer,
+and the time between 'after_body' and 'after_parse' the parsing.
+
+Callers only check the 'ACTIVE' flag before firing an event, so that hooks cost
+next to nothing when none is registered.
+
+Example:
+
+--
+	from wwwclient import hooks
+	timer = hooks.Timer(hooks.BEFORE_TOKENIZE, hooks.AFTER_TREE)
+	...
+	print sum(timer.durations)
+	timer.detach()
+--
+"""
+
+BEFORE_REQUEST  = "before_request"
+AFTER_REQUEST   = "after_request"
+AFTER_HEADERS   = "after_headers"
+AFTER_BODY      = "after_body"
+AFTER_PARSE     = "after_parse"
+ON_REDIRECT     = "on_redirect"
+ON_RETRY        = "on_retry"
+BEFORE_TOKENIZE = "before_tokenize"
+AFTER_TOKENIZE  = "after_tokenize"
+AFTER_TREE      = "after_tree"
+EVENTS          = (BEFORE_REQUEST, AFTER_REQUEST, AFTER_HEADERS, AFTER_BODY,
+AFTER_PARSE, ON_REDIRECT, ON_RETRY, BEFORE_TOKENIZE, AFTER_TOKENIZE, AFTER_TREE)
+
+# Tells if at least one hook is registered
+ACTIVE          = False
+
+_HOOKS          = {}
+_LOCK           = threading.Lock()
+
+# -----------------------------------------------------------------------------
+#
+# REGISTRY
+#
+# -----------------------------------------------------------------------------
+
+def register( event, callback ):
+	"""Registers the given callback for the given event, returning the
+	callback."""
+	if event not in EVENTS: raise Exception("Unknown event: %s" % (event))
+	_LOCK.acquire()
+	try:
+		# NOTE: The lists are replaced rather than modified, so that 'fire'
+		# can iterate on them without locking
+		_HOOKS[event] = _HOOKS.get(event, []) + [callback]
+		_update()
+	finally:
+		_LOCK.release()
+	return callback
+
+def unregister( event, callback ):
+	"""Unregisters the given callback from the given event (if it was
+	registered)."""
+	_LOCK.acquire()
+	try:
+		_HOOKS[event] = list(c for c in _HOOKS.get(event, ()) if c != callback)
+		_update()
+	finally:
+		_LOCK.release()
+
+def clear( event=None ):
+	"""Unregisters all the callbacks of the given event, or of all events when
+	none is given."""
+	_LOCK.acquire()
+	try:
+		if event is None: _HOOKS.clear()
+		else:             _HOOKS.pop(event, None)
+		_update()
+	finally:
+		_LOCK.release()
+
+def callbacks( event ):
+	"""Returns the list of callbacks registered for the given event."""
+	return list(_HOOKS.get(event, ()))
+
+def fire( event, *args ):
+	"""Calls the callbacks registered for the given event with the given
+	arguments. Callers are expected to check 'ACTIVE' first."""
+	for callback in _HOOKS.get(event, ()):
+		callback(*args)
+
+def _update():
+	global ACTIVE
+	ACTIVE = bool(filter(None, _HOOKS.values()))
+
+# -----------------------------------------------------------------------------
+#
+# TIMER
+#
+# -----------------------------------------------------------------------------
+
+class Timer:
+	"""Measures the time between a 'start' and an 'end' event, appending each
+	duration (in seconds) to 'durations'. Events are paired by thread, and
+	nested pairs are supported."""
+
+	def __init__( self, start, end ):
+		self.durations = []
+		self._start    = start
+		self._end      = end
+		self._local    = threading.local()
+		register(start, self._onStart)
+		register(end,   self._onEnd)
+
+	def _onStart( self, *args ):
+		if not hasattr(self._local, "stack"): self._local.stack = []
+		self._local.stack.append(time.time())
+
+	def _onEnd( self, *args ):
+		stack = getattr(self._local, "stack", None)
+		if stack: self.durations.append(time.time() - stack.pop())
+
+	def total( self ):
+		return sum(self.durations)
+
+	def detach( self ):
+		"""Unregisters this timer from its events."""
+		unregister(self._start, self._onStart)
+		unregister(self._end,   self._onEnd)
+
+# EOF - vim: tw=80 ts=4 sw=4 noet
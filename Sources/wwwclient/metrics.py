@@ -0,0 +1,373 @@
+#!/usr/bin/env python
+# Encoding: iso-8859-1
+# -----------------------------------------------------------------------------
+# Project   : WWWClient
+# -----------------------------------------------------------------------------
+# Author    : Sebastien Pierre                               <sebastien@ivy.fr>
+# -----------------------------------------------------------------------------
+# License   : GNU Lesser General Public License
+# Credits   : Xprima.com
+# -----------------------------------------------------------------------------
+# Creation  : 19-Oct-2026
+# Last mod  : 19-Oct-2026
+# -----------------------------------------------------------------------------
+
+import time, json, bisect, threading
+import uri, hooks
+
+__doc__ = """\
+The 'metrics' module aggregates in-process metrics about sessions: requests
+(by host, method and status), latency histograms per host, bytes transferred,
+retries, cache hits and HTML parsing times.
+
+Metrics are kept in a 'Registry' of counters and histograms, which can be
+exported as a Prometheus text file or as a JSON snapshot. The 'Metrics' class
+declares the WWWClient metrics, and is fed through the 'hooks' by the sessions
+it is attached to.
+
+Example:
+
+--
+	from wwwclient import browse, metrics
+	m = metrics.Metrics()
+	session = browse.Session()
+	session.setMetrics(m)
+	session.get("http://www.google.com")
+	m.registry.save("wwwclient.prom")
+	print m.snapshot()
+--
+"""
+
+# These are the default buckets of the Prometheus client libraries
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# -----------------------------------------------------------------------------
+#
+# METRICS
+#
+# -----------------------------------------------------------------------------
+
+class Metric:
+	"""The base class for metrics, which are identified by a name, and hold
+	one value per combination of label values."""
+
+	TYPE = None
+
+	def __init__( self, name, help="", labels=() ):
+		self.name    = name
+		self.help    = help
+		self.labels  = tuple(labels)
+		self._values = {}
+		self._lock   = threading.Lock()
+
+	def _key( self, labels ):
+		return tuple(str(labels.get(label, "")) for label in self.labels)
+
+	def _labels( self, key, extra=None ):
+		"""Returns the Prometheus representation of the given key labels."""
+		pairs = list(zip(self.labels, key))
+		if extra: pairs.append(extra)
+		if not pairs: return ""
+		return "{%s}" % (",".join('%s="%s"' % (n, _escape(v)) for n, v in pairs))
+
+	def clear( self ):
+		with self._lock:
+			self._values = {}
+
+class Counter(Metric):
+	"""A counter, which only goes up."""
+
+	TYPE = "counter"
+
+	def inc( self, value=1, **labels ):
+		key = self._key(labels)
+		with self._lock:
+			self._values[key] = self._values.get(key, 0) + value
+
+	def get( self, **labels ):
+		return self._values.get(self._key(labels), 0)
+
+	def total( self ):
+		return sum(self._values.values())
+
+	def asPrometheus( self ):
+		return list("%s%s %s" % (self.name, self._labels(key), _number(value))
+		for key, value in sorted(self._values.items()))
+
+	def asDict( self ):
+		return list((dict(zip(self.labels, key)), value) for key, value in sorted(self._values.items()))
+
+class Histogram(Metric):
+	"""A histogram, which counts observations in cumulative buckets and keeps
+	their sum and count."""
+
+	TYPE = "histogram"
+
+	def __init__( self, name, help="", labels=(), buckets=DEFAULT_BUCKETS ):
+		Metric.__init__(self, name, help, labels)
+		self.buckets = tuple(sorted(buckets))
+
+	def observe( self, value, **labels ):
+		key   = self._key(labels)
+		index = bisect.bisect_left(self.buckets, value)
+		with self._lock:
+			data = self._values.get(key)
+			if data is None:
+				data = self._values[key] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+			data[0][index] += 1
+			data[1]        += value
+			data[2]        += 1
+
+	def count( self, **labels ):
+		data = self._values.get(self._key(labels))
+		return data and data[2] or 0
+
+	def sum( self, **labels ):
+		data = self._values.get(self._key(labels))
+		return data and data[1] or 0.0
+
+	def asPrometheus( self ):
+		res = []
+		for key, (counts, total, count) in sorted(self._values.items()):
+			cumulative = 0
+			for bound, bucket_count in zip(self.buckets + ("+Inf",), counts):
+				cumulative += bucket_count
+				res.append("%s_bucket%s %d" % (self.name, self._labels(key, ("le", _number(bound))), cumulative))
+			res.append("%s_sum%s %s" % (self.name, self._labels(key), _number(total)))
+			res.append("%s_count%s %d" % (self.name, self._labels(key), count))
+		return res
+
+	def asDict( self ):
+		res = []
+		for key, (counts, total, count) in sorted(self._values.items()):
+			res.append((dict(zip(self.labels, key)), {
+				"buckets": dict(zip(map(_number, self.buckets + ("+Inf",)), counts)),
+				"sum"    : total,
+				"count"  : count,
+			}))
+		return res
+
+def _number( value ):
+	if type(value) is float: return repr(value)
+	return str(value)
+
+def _escape( value ):
+	return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+# -----------------------------------------------------------------------------
+#
+# REGISTRY
+#
+# -----------------------------------------------------------------------------
+
+class Registry:
+	"""A set of metrics, by name."""
+
+	def __init__( self ):
+		self.started  = time.time()
+		self._metrics = {}
+		self._order   = []
+		self._lock    = threading.Lock()
+
+	def counter( self, name, help="", labels=() ):
+		"""Returns the counter with the given name, creating it if
+		necessary."""
+		return self._get(Counter, name, help, labels)
+
+	def histogram( self, name, help="", labels=(), buckets=DEFAULT_BUCKETS ):
+		"""Returns the histogram with the given name, creating it if
+		necessary."""
+		return self._get(Histogram, name, help, labels, buckets)
+
+	def _get( self, metricClass, name, *args ):
+		with self._lock:
+			metric = self._metrics.get(name)
+			if metric is None:
+				metric = self._metrics[name] = metricClass(name, *args)
+				self._order.append(name)
+			elif not isinstance(metric, metricClass):
+				raise Exception("Metric %s is already registered as a %s" % (name, metric.TYPE))
+			return metric
+
+	def metrics( self ):
+		return list(self._metrics[name] for name in self._order)
+
+	def clear( self ):
+		"""Resets the values of all the metrics."""
+		for metric in self.metrics(): metric.clear()
+		self.started = time.time()
+
+	def asPrometheus( self ):
+		"""Returns the metrics in the Prometheus text exposition format."""
+		lines = []
+		for metric in self.metrics():
+			if metric.help: lines.append("# HELP %s %s" % (metric.name, metric.help))
+			lines.append("# TYPE %s %s" % (metric.name, metric.TYPE))
+			lines.extend(metric.asPrometheus())
+		return "\n".join(lines) + "\n"
+
+	def asDict( self ):
+		"""Returns the metrics as a (JSON-serializable) dictionary."""
+		res = {"started":self.started, "elapsed":time.time() - self.started, "metrics":{}}
+		for metric in self.metrics():
+			res["metrics"][metric.name] = {"type":metric.TYPE, "values":list(
+				{"labels":labels, "value":value} for labels, value in metric.asDict()
+			)}
+		return res
+
+	def asJSON( self ):
+		return json.dumps(self.asDict(), indent=1)
+
+	def save( self, path, format=None ):
+		"""Saves the metrics to the given file, as JSON if the path ends with
+		'.json' (or if 'format' is "json"), and in the Prometheus format
+		otherwise. The file is written atomically, so that it can be
+		collected at any time (for instance by the node exporter)."""
+		if format is None: format = path.endswith(".json") and "json" or "prometheus"
+		if format == "json": data = self.asJSON()
+		else:                data = self.asPrometheus()
+		import os
+		with file(path + ".tmp", "wb") as f:
+			f.write(data)
+		os.rename(path + ".tmp", path)
+		return path
+
+# -----------------------------------------------------------------------------
+#
+# WWWCLIENT METRICS
+#
+# -----------------------------------------------------------------------------
+
+class Metrics:
+	"""Declares the WWWClient metrics in the given registry (a new one by
+	default). Sessions feed them once attached (see 'Session.setMetrics'),
+	and HTML parsing is measured once 'observeParsing' is called. Both
+	register callbacks in the 'hooks', which 'detach' unregisters."""
+
+	def __init__( self, registry=None ):
+		if registry is None: registry = Registry()
+		self.registry  = registry
+		self._hooks    = []
+		self._local    = threading.local()
+		self.requests  = registry.counter("wwwclient_requests_total",
+			"Requests by host, method and status", ("host", "method", "status"))
+		self.latency   = registry.histogram("wwwclient_request_duration_seconds",
+			"Duration of the requests by host", ("host",))
+		self.bytesIn   = registry.counter("wwwclient_received_bytes_total",
+			"Bytes received by host", ("host",))
+		self.bytesOut  = registry.counter("wwwclient_sent_bytes_total",
+			"Bytes sent by host", ("host",))
+		self.retries   = registry.counter("wwwclient_retries_total",
+			"Requests retried by host", ("host",))
+		self.cache     = registry.counter("wwwclient_cache_requests_total",
+			"Requests answered from the cache (hit) or not (miss)", ("result",))
+		self.parsing   = registry.histogram("wwwclient_parse_duration_seconds",
+			"Duration of the HTML parsing by operation", ("operation",),
+			(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0))
+
+	def transaction( self, transaction ):
+		"""Records the given (done) transaction."""
+		host    = uri.location(transaction.url())[1]
+		timings = transaction.timings()
+		self.requests.inc(host=host, method=transaction.method(), status=transaction.status())
+		if timings is None: return
+		if timings.cached:
+			self.cache.inc(result="hit")
+			return
+		self.cache.inc(result="miss")
+		self.latency.observe(timings.total(), host=host)
+		self.bytesIn.inc(timings.bytesIn, host=host)
+		self.bytesOut.inc(timings.bytesOut, host=host)
+
+	def retry( self, url ):
+		"""Records a retry of a request to the given URL."""
+		self.retries.inc(host=uri.location(url)[1])
+
+	def parse( self, operation, duration ):
+		"""Records the parsing of an HTML document."""
+		self.parsing.observe(duration, operation=operation)
+
+	# HOOKS
+	# ========================================================================
+
+	def observe( self ):
+		"""Registers the hooks that record the requests and retries of the
+		sessions these metrics are attached to."""
+		self._register(hooks.AFTER_REQUEST, self._onRequest)
+		self._register(hooks.ON_RETRY,      self._onRetry)
+		return self
+
+	def observeParsing( self ):
+		"""Registers the hooks that record the parsing times of the 'scrape'
+		module in these metrics."""
+		self._register(hooks.BEFORE_TOKENIZE, self._onTokenize)
+		self._register(hooks.AFTER_TOKENIZE,  self._onTokenized)
+		self._register(hooks.AFTER_TREE,      self._onTree)
+		return self
+
+	def detach( self ):
+		"""Unregisters the hooks of these metrics."""
+		for event, callback in self._hooks:
+			hooks.unregister(event, callback)
+		self._hooks = []
+
+	def _register( self, event, callback ):
+		if (event, callback) not in self._hooks:
+			self._hooks.append((event, callback))
+			hooks.register(event, callback)
+
+	def _onRequest( self, transaction ):
+		if transaction.session()._metrics is self: self.transaction(transaction)
+
+	def _onRetry( self, session, url, attempt, error ):
+		if session._metrics is self: self.retry(url)
+
+	def _onTokenize( self, scraper, html ):
+		self._local.started = time.time()
+
+	def _onTokenized( self, scraper, tagList ):
+		self._parsed("list")
+
+	def _onTree( self, scraper, tree ):
+		self._parsed("tree")
+
+	def _parsed( self, operation ):
+		# NOTE: Trees built from an already tokenized list (as
+		# 'Transaction.asTree' does) fire 'after_tree' alone, and are not
+		# recorded
+		started = getattr(self._local, "started", None)
+		if started is None: return
+		self._local.started = None
+		self.parse(operation, time.time() - started)
+
+	def snapshot( self ):
+		"""Returns a dictionary summarizing the metrics: requests and request
+		rate, status counts, bytes, retries, cache hit ratio and mean latency
+		and parse time."""
+		elapsed  = time.time() - self.registry.started
+		requests = self.requests.total()
+		statuses = {}
+		for labels, value in self.requests.asDict():
+			statuses[labels["status"]] = statuses.get(labels["status"], 0) + value
+		hits     = self.cache.get(result="hit")
+		lookups  = hits + self.cache.get(result="miss")
+		latency  = list(v for _, v in self.latency.asDict())
+		parsing  = list(v for _, v in self.parsing.asDict())
+		return {
+			"requests"    : requests,
+			"rate"        : elapsed and requests / elapsed or 0.0,
+			"statuses"    : statuses,
+			"bytesIn"     : self.bytesIn.total(),
+			"bytesOut"    : self.bytesOut.total(),
+			"retries"     : self.retries.total(),
+			"cacheHitRatio": lookups and float(hits) / lookups or 0.0,
+			"latency"     : _mean(latency),
+			"parseTime"   : _mean(parsing),
+		}
+
+def _mean( histograms ):
+	count = sum(h["count"] for h in histograms)
+	if not count: return None
+	return sum(h["sum"] for h in histograms) / count
+
+# EOF - vim: tw=80 ts=4 sw=4 noet
@@ -0,0 +1,161 @@
+#!/usr/bin/env python
+# Encoding: iso-8859-1
+# -----------------------------------------------------------------------------
+# Project   : WWWClient
+# -----------------------------------------------------------------------------
+# Author    : Sebastien Pierre                               <sebastien@ivy.fr>
+# -----------------------------------------------------------------------------
+# License   : GNU Lesser General Public License
+# Credits   : Xprima.com
+# -----------------------------------------------------------------------------
+# Creation  : 19-Oct-2026
+# Last mod  : 19-Oct-2026
+# -----------------------------------------------------------------------------
+
+import socket, time, threading, Queue
+import uri
+
+__doc__ = """\
+The 'resolver' module keeps a process-wide cache of host name resolutions, so
+that the sessions and HTTP clients do not query the system resolver for each
+request. Resolutions are kept for a given time ('ttl'), and failed resolutions
+are cached too (for 'negativeTTL'), so that unknown hosts found while crawling
+do not cost a resolver round-trip each time.
+
+The 'defaultclient' resolves its connections through 'RESOLVER'. The
+'curlclient' handles share their own DNS cache instead, with the same TTL.
+
+Host names can also be resolved ahead of time, which is useful when the next
+URLs to crawl are known:
+
+--
+	from wwwclient import resolver
+	resolver.RESOLVER.preresolve(urls, wait=False)
+--
+"""
+
+DEFAULT_TTL  = 300
+NEGATIVE_TTL = 30
+MAX_ENTRIES  = 4096
+
+class Resolver:
+	"""A thread-safe cache of 'socket.getaddrinfo' results. Entries do not
+	depend on the port, which is only set in the returned addresses."""
+
+	def __init__( self, ttl=DEFAULT_TTL, negativeTTL=NEGATIVE_TTL, maxEntries=MAX_ENTRIES ):
+		self.ttl         = ttl
+		self.negativeTTL = negativeTTL
+		self.maxEntries  = maxEntries
+		self.hits        = 0
+		self.misses      = 0
+		self._entries    = {}
+		self._lock       = threading.Lock()
+
+	def resolve( self, host, port, family=0, socktype=socket.SOCK_STREAM ):
+		"""Returns the list of '(family, socktype, proto, canonname,
+		sockaddr)' tuples for the given host and port, as 'socket.getaddrinfo'
+		does. A cached failure raises the same 'socket.gaierror' again."""
+		key   = (host, family, socktype)
+		entry = self._entries.get(key)
+		if entry and entry[0] > time.time():
+			self.hits += 1
+			if isinstance(entry[1], Exception): raise entry[1]
+			return _withPort(entry[1], port)
+		self.misses += 1
+		try:
+			res = socket.getaddrinfo(host, 0, family, socktype)
+		except socket.gaierror, e:
+			self._store(key, e, self.negativeTTL)
+			raise
+		self._store(key, res, self.ttl)
+		return _withPort(res, port)
+
+	def cached( self, host, port, family=0, socktype=socket.SOCK_STREAM ):
+		"""Returns the cached (and still valid) addresses for the given host and
+		port, or 'None'. This never queries the system resolver."""
+		entry = self._entries.get((host, family, socktype))
+		if entry and entry[0] > time.time() and not isinstance(entry[1], Exception):
+			return _withPort(entry[1], port)
+		return None
+
+	def invalidate( self, host=None ):
+		"""Removes the given host from the cache (for instance because the
+		connection to its address failed), or all hosts if none is given."""
+		self._lock.acquire()
+		try:
+			if host is None:
+				self._entries.clear()
+			else:
+				for key in self._entries.keys():
+					if key[0] == host: del self._entries[key]
+		finally:
+			self._lock.release()
+
+	def preresolve( self, locations, threads=4, wait=True ):
+		"""Resolves the given hosts (or URLs, which can be mixed) in the given
+		number of threads, so that they are cached when the requests are
+		sent. Failures are cached as well. Unless 'wait' is true, this
+		returns right away. Returns the number of hosts to resolve."""
+		queue = Queue.Queue()
+		seen  = {}
+		for location in locations:
+			if uri.isAbsolute(location): host = uri.location(location)[1]
+			else:                        host = location
+			if seen.has_key(host) or self.cached(host, 0): continue
+			seen[host] = True
+			queue.put(host)
+		def work():
+			while True:
+				try:
+					host = queue.get_nowait()
+				except Queue.Empty:
+					break
+				try:
+					self.resolve(host, 0)
+				except socket.error:
+					pass
+		workers = []
+		for i in range(min(threads, queue.qsize())):
+			worker = threading.Thread(target=work)
+			worker.daemon = True
+			worker.start()
+			workers.append(worker)
+		if wait:
+			for worker in workers: worker.join()
+		return len(seen)
+
+	def _store( self, key, value, ttl ):
+		if ttl <= 0: return
+		self._lock.acquire()
+		try:
+			if len(self._entries) >= self.maxEntries:
+				self._evict()
+			self._entries[key] = (time.time() + ttl, value)
+		finally:
+			self._lock.release()
+
+	def _evict( self ):
+		"""Removes the expired entries, or all of them if none expired (which
+		is simpler than keeping track of their use)."""
+		now     = time.time()
+		expired = list(key for key, entry in self._entries.items() if entry[0] <= now)
+		if expired:
+			for key in expired: del self._entries[key]
+		else:
+			self._entries.clear()
+
+def _withPort( addresses, port ):
+	"""Returns the given 'getaddrinfo' results with the given port."""
+	port = int(port or 0)
+	return list((family, socktype, proto, name, (address[0], port) + tuple(address[2:]))
+	for family, socktype, proto, name, address in addresses)
+
+# The resolver shared by the HTTP clients, which can be replaced by a
+# differently configured one
+RESOLVER = Resolver()
+
+def resolve( host, port, family=0, socktype=socket.SOCK_STREAM ):
+	"""Resolves the given host with the shared 'RESOLVER'."""
+	return RESOLVER.resolve(host, port, family, socktype)
+
+# EOF - vim: tw=80 ts=4 sw=4 noet
@@ -0,0 +1,255 @@
+#!/usr/bin/env python
+# Encoding: iso-8859-1
+# -----------------------------------------------------------------------------
+# Project   : WWWClient
+# -----------------------------------------------------------------------------
+# Author    : Sebastien Pierre                               <sebastien@ivy.fr>
+# -----------------------------------------------------------------------------
+# License   : GNU Lesser General Public License
+# Credits   : Xprima.com
+# -----------------------------------------------------------------------------
+# Creation  : 19-Oct-2026
+# Last mod  : 19-Oct-2026
+# -----------------------------------------------------------------------------
+
+import sys, time, random, errno, socket, httplib, threading, email.utils
+import uri
+
+__doc__ = """\
+The 'retries' module implements the retry logic used by the sessions: a retry
+'Policy' tells which errors and statuses are worth retrying (connection resets,
+timeouts, '429 Too Many Requests', '503 Service Unavailable', etc), how long to
+wait before each retry (exponential backoff with jitter, or an explicit list of
+delays, while honoring the 'Retry-After' header) and how many retries a host
+can take (see 'Budget').
+
+By default, policies only retry idempotent requests ('IDEMPOTENT_METHODS'): a
+timeout or a reset after a POST was sent does not tell whether the server
+processed it, so retrying it could submit it twice. Policies created with
+'methods=None' retry any request.
+
+Policies never sleep by themselves: 'Policy.start()' returns an 'Attempts'
+instance that tells how long to wait before the next attempt, leaving the
+waiting to the caller. This makes policies usable from event loops as well as
+from the blocking 'Policy.call()'.
+
+Example:
+
+--
+	from wwwclient import retries
+	policy   = retries.Policy(retries=3, base=0.5)
+	attempts = policy.start(url)
+	...
+	delay = attempts.failed(status=503, retryAfter="2")
+	if delay is None: giveUp()
+	else: reactor.callLater(delay, tryAgain)
+--
+"""
+
+RETRYABLE_STATUSES   = (429, 503)
+RETRYABLE_EXCEPTIONS = (httplib.IncompleteRead, httplib.BadStatusLine,
+socket.timeout)
+RETRYABLE_ERRNOS     = (errno.ECONNRESET, errno.ECONNABORTED, errno.EPIPE,
+errno.ETIMEDOUT)
+IDEMPOTENT_METHODS   = ("GET", "HEAD", "PUT", "DELETE", "OPTIONS", "TRACE")
+
+# -----------------------------------------------------------------------------
+#
+# BUDGET
+#
+# -----------------------------------------------------------------------------
+
+class Budget:
+	"""A retry budget limits the retries sent to each host, so that retries
+	do not pile up when a host is failing (which is when they are the most
+	harmful). Each host has a bucket of 'capacity' tokens: a retry takes one
+	token, and each successful request gives back 'ratio' token. In the long
+	run, retries are then limited to 'ratio' of the requests.
+
+	Budgets are thread-safe, and are meant to be shared by the sessions that
+	access the same hosts."""
+
+	def __init__( self, ratio=0.2, capacity=10 ):
+		self.ratio    = ratio
+		self.capacity = capacity
+		self._tokens  = {}
+		self._lock    = threading.Lock()
+
+	def withdraw( self, host ):
+		"""Takes a token for a retry to the given host, returning 'False' when
+		the budget of the host is exhausted."""
+		self._lock.acquire()
+		try:
+			tokens = self._tokens.get(host, self.capacity)
+			if tokens < 1: return False
+			self._tokens[host] = tokens - 1
+			return True
+		finally:
+			self._lock.release()
+
+	def deposit( self, host ):
+		"""Gives back tokens to the given host for a successful request."""
+		self._lock.acquire()
+		try:
+			tokens = self._tokens.get(host, self.capacity)
+			if tokens < self.capacity:
+				self._tokens[host] = min(self.capacity, tokens + self.ratio)
+		finally:
+			self._lock.release()
+
+	def tokens( self, host ):
+		"""Returns the number of tokens left for the given host."""
+		return self._tokens.get(host, self.capacity)
+
+# The budget shared by the sessions (see 'browse.Session.retryPolicy')
+BUDGET = Budget()
+
+# -----------------------------------------------------------------------------
+#
+# POLICY
+#
+# -----------------------------------------------------------------------------
+
+class Policy:
+	"""Tells which failures are retried, and how.
+
+	Keyword arguments::
+		'retries':    the maximum number of retries (not counting the first
+		              attempt)
+		'base':       the delay before the first retry, doubled ('factor')
+		              for each following retry
+		'maximum':    the maximum delay, a 'Retry-After' longer than this
+		              makes the policy give up
+		'jitter':     the ratio of the delay that is randomized (0 for none,
+		              1 for a delay between 0 and the computed delay)
+		'delays':     an explicit list of delays (the last one being repeated)
+		              to use instead of the exponential backoff
+		'statuses':   the response statuses that are retried
+		'exceptions': the exception classes that are retried (in addition to the
+		              'socket.error' with a 'RETRYABLE_ERRNOS' errno)
+		'budget':     the 'Budget' limiting the retries per host, or 'None'
+		'methods':    the methods of the requests that are retried, or 'None'
+		              to retry any request"""
+
+	def __init__( self, retries=5, base=0.25, factor=2.0, maximum=30.0,
+	jitter=0.5, delays=None, statuses=RETRYABLE_STATUSES,
+	exceptions=RETRYABLE_EXCEPTIONS, budget=None, seed=None,
+	methods=IDEMPOTENT_METHODS ):
+		self.retries    = retries
+		self.base       = base
+		self.factor     = factor
+		self.maximum    = maximum
+		self.jitter     = jitter
+		self.delays     = delays and tuple(delays) or None
+		self.statuses   = tuple(statuses or ())
+		if exceptions and type(exceptions) not in (tuple, list): exceptions = (exceptions,)
+		self.exceptions = tuple(exceptions or ())
+		self.budget     = budget
+		self.methods    = methods and tuple(m.upper() for m in methods) or None
+		self._random    = random.Random(seed)
+
+	def isRetryable( self, error=None, status=None ):
+		"""Tells if the given exception or status denotes a failure that is
+		worth retrying."""
+		if error is not None:
+			if isinstance(error, self.exceptions): return True
+			if isinstance(error, socket.error) and not isinstance(error, socket.timeout):
+				return error.args and error.args[0] in RETRYABLE_ERRNOS or False
+			return False
+		if status is not None:
+			try:
+				return int(status) in self.statuses
+			except ValueError:
+				return False
+		return False
+
+	def delay( self, attempt ):
+		"""Returns the delay (in seconds) to wait before the given retry
+		(starting at 1)."""
+		if self.delays:
+			delay = self.delays[min(attempt, len(self.delays)) - 1]
+		else:
+			delay = self.base * (self.factor ** (attempt - 1))
+		delay = min(delay, self.maximum)
+		if self.jitter:
+			delay -= delay * self.jitter * self._random.random()
+		return delay
+
+	def allows( self, method=None ):
+		"""Tells if requests with the given method can be retried (requests
+		with no given method always can)."""
+		return not (method and self.methods) or method.upper() in self.methods
+
+	def start( self, url=None, method=None ):
+		"""Returns the 'Attempts' of a new request to the given URL, with the
+		given method."""
+		return Attempts(self, url and uri.location(url)[1] or None, method)
+
+	def call( self, function, url=None ):
+		"""Calls the given function until it succeeds or its failures are not
+		to be retried any more, sleeping between attempts. The result of the
+		function is returned, or the last exception raised."""
+		attempts = self.start(url)
+		while True:
+			try:
+				res = function()
+			except Exception, e:
+				error = sys.exc_info()
+				delay = attempts.failed(e)
+				if delay is None: raise error[0], error[1], error[2]
+				time.sleep(delay)
+			else:
+				attempts.succeeded()
+				return res
+
+def parseRetryAfter( value ):
+	"""Returns the number of seconds given by the value of a 'Retry-After'
+	header, which is either a number of seconds or an HTTP date, or 'None' if
+	it cannot be parsed."""
+	if value is None: return None
+	value = value.strip()
+	if value.isdigit(): return int(value)
+	date = email.utils.parsedate_tz(value)
+	if date is None: return None
+	return max(0, email.utils.mktime_tz(date) - time.time())
+
+# -----------------------------------------------------------------------------
+#
+# ATTEMPTS
+#
+# -----------------------------------------------------------------------------
+
+class Attempts:
+	"""The state of the retries of a single request, as returned by
+	'Policy.start'. The caller reports each failure to 'failed', which tells
+	how long to wait before the next attempt."""
+
+	def __init__( self, policy, host=None, method=None ):
+		self.policy = policy
+		self.host   = host
+		self.method = method
+		self.count  = 0
+
+	def failed( self, error=None, status=None, retryAfter=None ):
+		"""Reports that the last attempt failed with the given exception or
+		status (and 'Retry-After' header value). Returns the delay to wait
+		before the next attempt, or 'None' if the request should not be retried
+		(because the failure is not retryable, or because there were too many
+		retries, or because the method is not retried by the policy)."""
+		policy = self.policy
+		if not policy.allows(self.method): return None
+		if not policy.isRetryable(error, status): return None
+		if self.count >= policy.retries: return None
+		wait = parseRetryAfter(retryAfter)
+		if wait is not None and wait > policy.maximum: return None
+		if policy.budget and not policy.budget.withdraw(self.host): return None
+		self.count += 1
+		delay = policy.delay(self.count)
+		if wait is not None: delay = max(delay, wait)
+		return delay
+
+	def succeeded( self ):
+		"""Reports that the last attempt succeeded."""
+		if self.policy.budget: self.policy.budget.deposit(self.host)
+
+# EOF - vim: tw=80 ts=4 sw=4 noet
@@ -17,7 +17,7 @@
 # kept to allow easy subset extraction (currently, the data is recreated)
 
 import re, string, htmlentitydefs
-import form
+import form, uri, hooks
 
 __doc__ = """\
 The scraping module gives a set of functionalities to manipulate HTML data. All
@@ -30,6 +30,7 @@ RE_SPACES    = re.compile("\s+")
 RE_HTMLSTART = re.compile("</?(\w+)",      re.I)
 RE_HTMLEND   = re.compile("/?>")
 RE_HTMLLINK  = re.compile("<[^<]+(href|src|url)\s*=\s*('[^']*'|\"[^\"]*\"|[^ >]*)", re.I)
+RE_LINKATTR  = re.compile("(href|src|url)\s*=", re.I)
 
 RE_HTMLCLASS = re.compile("class\s*=\s*['\"]?([\w\-_\d]+)", re.I)
 RE_HTMLID    = re.compile("id\s*=\s*['\"]?([\w\-_\d]+)", re.I)
@@ -49,22 +50,20 @@ KEEP_BELOW    = "-"
 # -----------------------------------------------------------------------------
 
 class URL:
+	"""Helpers to make the URLs found in a page absolute. See the 'uri' module
+	for the actual implementation."""
 
 	@classmethod
 	def Base( self, url ):
-		base_url = url
-		if not url.endswith("/"):
-			i = base_url.rfind("/")
-			if i > 0:
-				base_url = base_url[:i + 1]
-		return base_url
+		"""Returns the base of the given URL (everything up to the last slash
+		of the path)."""
+		return uri.base(url)
 
 	@classmethod
 	def Absolute( self, url, siteURL ):
-		base_url = self.Base(siteURL)
-		if url.find("http") != 0:
-			url = base_url + url
-		return url
+		"""Resolves the given (possibly relative) URL against the given site
+		URL."""
+		return uri.resolve(siteURL, url)
 
 # -----------------------------------------------------------------------------
 #
@@ -95,6 +94,11 @@ class Tag:
 		"""Returns the HTML representation of this tag."""
 		return self._html[self.start:self.end]
 
+	def source( self ):
+		"""Returns the whole HTML string in which this tag was identified,
+		'start' and 'end' being offsets in it."""
+		return self._html
+
 	def __repr__( self ):
 		return repr(self._html[self.start:self.end])
 
@@ -184,7 +188,11 @@ class TextTag(Tag):
 		return False
 
 	def text(self, encoding=DEFAULT_ENCODING):
-		return self._html[self.start:self.end].decode(encoding)
+		text = self._html[self.start:self.end]
+		# NOTE: Decoded HTML (see 'browse.Transaction.text') is not decoded
+		# again, only byte strings are
+		if isinstance(text, unicode): return text
+		return text.decode(encoding)
 
 	def name(self):
 		return "#text"
@@ -678,15 +686,20 @@ class HTMLTools:
 		return self.tree(html)
 	
 	def tree( self, html, asXML=False ):
+		if hooks.ACTIVE: hooks.fire(hooks.BEFORE_TOKENIZE, self, html)
 		tag_list = TagList()
 		tag_list.fromHTML(html, scraper=self)
-		return tag_list.tagtree(asXML)
+		res = tag_list.tagtree(asXML)
+		if hooks.ACTIVE: hooks.fire(hooks.AFTER_TREE, self, res)
+		return res
 
 	def list( self, data ):
 		"""Converts the given text or tagtree into a taglist."""
 		if type(data) in (str, unicode):
+			if hooks.ACTIVE: hooks.fire(hooks.BEFORE_TOKENIZE, self, data)
 			tag_list = TagList()
 			tag_list.fromHTML(data, scraper=self)
+			if hooks.ACTIVE: hooks.fire(hooks.AFTER_TOKENIZE, self, tag_list)
 			return tag_list
 		elif isinstance(data, TagList):
 			return data
@@ -795,7 +808,9 @@ class HTMLTools:
 	# ========================================================================
 
 	def forms( self, html ):
-		return form.parseForms(self, self.html(html))
+		"""Returns a dictionary of the forms (see 'form.Form') found in the
+		given HTML string, tag list or tree."""
+		return form.parseForms(self, html)
 
 	def images( self, html, like=None ):
 		"""Iterates through the links found in this document. This yields the
@@ -806,8 +821,22 @@ class HTMLTools:
 
 	def links( self, html, like=None ):
 		"""Iterates through the links found in this document. This yields the
-		tag name and the href value."""
-		if html:
+		tag name and the href value. When the document is given as a tag list
+		(or tree), the links are read from the attributes of its tags rather
+		than searched in its HTML."""
+		if isinstance(html, TagTree): html = html.list()
+		if isinstance(html, TagList):
+			if like != None:
+				if type(like) in (str,unicode): like = re.compile(like)
+			for tag in html.content:
+				if not tag.isElement() or tag.type == Tag.CLOSE: continue
+				# Only the tags that have a link attribute are parsed
+				match = RE_LINKATTR.search(tag._html, tag.astart, tag.aend)
+				if not match: continue
+				href  = tag.get(match.group(1).lower())
+				if href is not None and (not like or like.match(href)):
+					yield tag.name(), href
+		elif html:
 			html = self.html(html)
 			if like != None:
 				if type(like) in (str,unicode): like = re.compile(like)
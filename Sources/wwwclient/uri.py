@@ -0,0 +1,223 @@
+#!/usr/bin/env python
+# Encoding: iso-8859-1
+# -----------------------------------------------------------------------------
+# Project   : WWWClient
+# -----------------------------------------------------------------------------
+# Author    : Sebastien Pierre                               <sebastien@ivy.fr>
+# -----------------------------------------------------------------------------
+# License   : GNU Lesser General Public License
+# Credits   : Xprima.com
+# -----------------------------------------------------------------------------
+# Creation  : 19-Oct-2026
+# Last mod  : 19-Oct-2026
+# -----------------------------------------------------------------------------
+
+import re, string, urlparse
+
+__doc__ = """\
+The 'uri' module centralizes URL manipulation for the other WWWClient modules.
+It implements reference resolution as described in RFC 3986 (section 5), as
+well as the syntax-based normalization of section 6.2.2 (case, percent-encoding
+and dot-segments), extended with the removal of default ports.
+
+URLs are split using 'urlparse', but the result is memoized in a bounded cache,
+so that splitting the same URLs again and again (which is what happens when
+crawling) is a simple dictionary lookup.
+
+Example:
+
+--
+	from wwwclient import uri
+	uri.resolve("http://a/b/c/d;p?q", "../g")       # 'http://a/b/g'
+	uri.normalize("HTTP://Example.COM:80/a/./b/%7e") # 'http://example.com/a/b/~'
+	uri.canonical("http://example.com/a#top")        # 'http://example.com/a'
+--
+"""
+
+DEFAULT_PORTS = {"http":"80", "https":"443", "ftp":"21"}
+UNRESERVED    = string.ascii_letters + string.digits + "-._~"
+RE_PERCENT    = re.compile("%([0-9A-Fa-f]{2})")
+RE_SCHEME     = re.compile("^[A-Za-z][A-Za-z0-9+.\-]*:")
+MAX_CACHE     = 2048
+
+_CACHE        = {}
+
+# -----------------------------------------------------------------------------
+#
+# PARSING
+#
+# -----------------------------------------------------------------------------
+
+def split( url ):
+	"""Splits the given URL into a '(scheme, netloc, path, query, fragment)'
+	tuple. The query and fragment are 'None' when they are missing, and empty
+	when they are given empty (as in 'http://a/b?#'), as RFC 3986 tells them
+	apart. Results are memoized, the cache being cleared when it holds more
+	than 'MAX_CACHE' entries."""
+	res = _CACHE.get(url)
+	if res is None:
+		if len(_CACHE) >= MAX_CACHE: _CACHE.clear()
+		scheme, netloc, path, query, fragment = urlparse.urlsplit(url)
+		# NOTE: urlparse gives an empty string for both
+		sharp = url.find("#")
+		if sharp == -1:
+			fragment = None
+			sharp    = len(url)
+		if url.find("?", 0, sharp) == -1: query = None
+		res = _CACHE[url] = (scheme, netloc, path, query, fragment)
+	return res
+
+def unsplit( parts ):
+	"""Recomposes the URL from the given '(scheme, netloc, path, query,
+	fragment)' tuple, following RFC 3986 (section 5.3)."""
+	scheme, netloc, path, query, fragment = parts
+	res = ""
+	if scheme:   res += scheme + ":"
+	if netloc:   res += "//" + netloc
+	res += path
+	if query    is not None: res += "?" + query
+	if fragment is not None: res += "#" + fragment
+	return res
+
+def clearCache():
+	"""Clears the memoized parse cache."""
+	_CACHE.clear()
+
+def isAbsolute( url ):
+	"""Tells if the given URL has a scheme (ie. 'http://...')."""
+	return RE_SCHEME.match(url) is not None
+
+def location( url ):
+	"""Returns the '(scheme, host, port)' triple for the given URL. The host
+	is lowercased and the port is returned as a string, or 'None' if it is not
+	given or if it is the default port for the scheme."""
+	scheme, netloc, _, _, _ = split(url)
+	scheme = scheme.lower()
+	host, port = _splitNetloc(netloc)
+	if port == DEFAULT_PORTS.get(scheme): port = None
+	return scheme, host.lower(), port
+
+def base( url ):
+	"""Returns the "directory" of the given URL, that is everything up to the
+	last slash of its path (query and fragment excluded)."""
+	scheme, netloc, path, _, _ = split(url)
+	i = path.rfind("/")
+	if i == -1: path = "/"
+	else:       path = path[:i+1]
+	return unsplit((scheme, netloc, path, None, None))
+
+# -----------------------------------------------------------------------------
+#
+# RESOLUTION
+#
+# -----------------------------------------------------------------------------
+
+def removeDotSegments( path ):
+	"""Removes the '.' and '..' segments from the given path, as described in
+	RFC 3986 (section 5.2.4)."""
+	if path.find(".") == -1: return path
+	output = []
+	while path:
+		if   path.startswith("../"): path = path[3:]
+		elif path.startswith("./"):  path = path[2:]
+		elif path.startswith("/./"): path = path[2:]
+		elif path == "/.":           path = "/"
+		elif path.startswith("/../") or path == "/..":
+			path = "/" + path[4:]
+			if output: output.pop()
+		elif path in (".", ".."):    path = ""
+		else:
+			i = path.find("/", 1)
+			if i == -1: i = len(path)
+			output.append(path[:i])
+			path = path[i:]
+	return "".join(output)
+
+def resolve( base, reference ):
+	"""Resolves the given 'reference' (which may be relative, query-only,
+	scheme-relative, etc) against the given 'base' URL, returning the target
+	URL as described in RFC 3986 (section 5.2.2)."""
+	if reference is None: return None
+	if not base or isAbsolute(reference):
+		scheme, netloc, path, query, fragment = split(reference)
+		return unsplit((scheme, netloc, removeDotSegments(path), query, fragment))
+	b_scheme, b_netloc, b_path, b_query, _ = split(base)
+	_, netloc, path, query, fragment = split(reference)
+	if reference.startswith("//"):
+		path = removeDotSegments(path)
+	else:
+		netloc = b_netloc
+		if not path:
+			path = b_path
+			if query is None: query = b_query
+		elif path[0] == "/":
+			path = removeDotSegments(path)
+		else:
+			if b_netloc and not b_path:
+				path = "/" + path
+			else:
+				path = b_path[:b_path.rfind("/")+1] + path
+			path = removeDotSegments(path)
+	return unsplit((b_scheme, netloc, path, query, fragment))
+
+# -----------------------------------------------------------------------------
+#
+# NORMALIZATION
+#
+# -----------------------------------------------------------------------------
+
+def normalize( url, fragment=True ):
+	"""Returns the normalized version of the given URL: scheme and host are
+	lowercased, default ports are removed, percent-encodings of unreserved
+	characters are decoded (and the others uppercased), dot-segments are
+	removed and an empty path becomes '/'. The fragment is removed unless
+	'fragment' is true."""
+	scheme, netloc, path, query, frag = split(url)
+	scheme = scheme.lower()
+	if netloc:
+		userinfo = ""
+		i = netloc.rfind("@")
+		if i != -1:
+			userinfo = netloc[:i+1]
+			netloc   = netloc[i+1:]
+		host, port = _splitNetloc(netloc)
+		netloc = userinfo + host.lower()
+		if port and port != DEFAULT_PORTS.get(scheme): netloc += ":" + port
+	path  = removeDotSegments(_normalizePercent(path))
+	if not path and netloc: path = "/"
+	query = _normalizePercent(query)
+	if fragment: frag = _normalizePercent(frag)
+	else:        frag = None
+	return unsplit((scheme, netloc, path, query, frag))
+
+def canonical( url ):
+	"""Returns the canonical form of the given URL, which is its normalized
+	form without the fragment. Two URLs that denote the same resource will
+	have the same canonical form, which makes it suitable as a key to
+	de-duplicate URLs."""
+	return normalize(url, fragment=False)
+
+def _splitNetloc( netloc ):
+	"""Returns the '(host, port)' couple for the given network location, the
+	port being 'None' when not specified."""
+	i = netloc.rfind("@")
+	if i != -1: netloc = netloc[i+1:]
+	# IPv6 addresses are given between brackets
+	j = netloc.rfind("]")
+	i = netloc.rfind(":")
+	if i > j:
+		return netloc[:i], netloc[i+1:] or None
+	return netloc, None
+
+def _normalizePercent( text ):
+	"""Decodes the percent-encoded unreserved characters and uppercases the
+	remaining percent-encodings in the given text."""
+	if not text or text.find("%") == -1: return text
+	return RE_PERCENT.sub(_normalizeEscape, text)
+
+def _normalizeEscape( match ):
+	c = chr(int(match.group(1), 16))
+	if c in UNRESERVED: return c
+	return "%" + match.group(1).upper()
+
+# EOF - vim: tw=80 ts=4 sw=4 noet
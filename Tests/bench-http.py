@@ -0,0 +1,449 @@
+# Encoding: iso-8859-1
+# -----------------------------------------------------------------------------
+# Project   : WWWClient
+# -----------------------------------------------------------------------------
+# Author    : Sebastien Pierre                               <sebastien@ivy.fr>
+# -----------------------------------------------------------------------------
+# License   : GNU Lesser General Public License
+# -----------------------------------------------------------------------------
+# Creation  : 19-Oct-2026
+# Last mod  : 19-Oct-2026
+# -----------------------------------------------------------------------------
+
+from os.path import join, basename, dirname, abspath
+import sys ;sys.path.append(join(dirname(dirname(abspath(__file__))), "Sources"))
+
+import os, gc, time, json, gzip, shutil, socket, threading, subprocess
+import tempfile, optparse, StringIO, Queue, BaseHTTPServer, SocketServer, ssl
+from wwwclient import browse, defaultclient, contracts
+
+__doc__ = """\
+End-to-end benchmark of 'browse.Session' against a local stand-in server, so
+that transports can be compared and throughput regressions caught without
+touching real sites.
+
+The server runs in a separate process (so that it does not compete with the
+client for the interpreter lock) and its behavior is configurable: latency,
+response size, chunked transfer, gzip compression, redirects, cookies,
+keep-alive and HTTPS (using a self-signed certificate generated with
+'openssl'). The server can also be started alone with '--serve'.
+
+Each client ('default' for 'defaultclient', 'curl' for 'curlclient') is run at
+each of the given concurrency levels, every worker thread having its own
+session. The requests per second, the p50/p99 latencies (including redirects),
+the errors and the growth of the peak memory are reported, each run taking
+place in a forked child process (on systems with '/proc') so that its memory
+can be measured. Results can be saved as a baseline and compared against
+later, the script exiting with a non-zero status when the throughput dropped,
+or the memory grew, by more than the given threshold.
+
+Usage:
+
+--
+	python bench-http.py                              # default client, 1/4/16 threads
+	python bench-http.py -C default -C curl -c 8 -n 2000
+	python bench-http.py --latency 20 --size 65536 --gzip --chunked
+	python bench-http.py --redirects 2 --cookies 5 --no-keepalive --https
+	python bench-http.py --save baseline.json
+	python bench-http.py --compare baseline.json
+--
+"""
+
+CHUNK_SIZE = 4096
+
+# Memory growths (in kilobytes) below which memory changes are not regressions
+MEMORY_SLACK = 512
+
+try:
+	import resource
+except ImportError:
+	resource = None
+
+# -----------------------------------------------------------------------------
+#
+# SERVER
+#
+# -----------------------------------------------------------------------------
+
+def makeBody( size ):
+	"""Returns an HTML page of (about) the given size in bytes."""
+	head = "<html><head><title>Benchmark</title></head><body>"
+	tail = "</body></html>"
+	row  = "<p>Lorem ipsum dolor sit amet, <a href='/page/%d'>consectetur</a> &amp; adipiscing elit.</p>\n"
+	res  = []
+	left = size - len(head) - len(tail)
+	i    = 0
+	while left > 0:
+		line = row % (i)
+		res.append(line)
+		left -= len(line)
+		i    += 1
+	return head + "".join(res) + tail
+
+def compress( data ):
+	buffer = StringIO.StringIO()
+	f      = gzip.GzipFile(fileobj=buffer, mode="wb")
+	f.write(data)
+	f.close()
+	return buffer.getvalue()
+
+class Handler(BaseHTTPServer.BaseHTTPRequestHandler):
+	"""Serves '/page/N' with the behavior given by the 'options' of the
+	server. When redirects are enabled, '/page/N' redirects to '/hop/K/N',
+	which in turn redirects to '/hop/K-1/N' until 'K' is 0."""
+
+	protocol_version = "HTTP/1.1"
+	# NOTE: Headers and body are written separately, which would otherwise
+	# be delayed by Nagle's algorithm on persistent connections
+	disable_nagle_algorithm = True
+
+	def log_message( self, *args ):
+		pass
+
+	def do_GET( self ):
+		options = self.server.options
+		parts   = self.path.split("?")[0].split("/")
+		if options.latency: time.sleep(options.latency / 1000.0)
+		if parts[1] == "page" and options.redirects:
+			return self.sendRedirect("/hop/%d/%s" % (options.redirects - 1, parts[-1]))
+		if parts[1] == "hop" and int(parts[2]) > 0:
+			return self.sendRedirect("/hop/%d/%s" % (int(parts[2]) - 1, parts[-1]))
+		body = self.server.body
+		self.send_response(200)
+		self.send_header("Content-Type", "text/html; charset=utf-8")
+		self.sendCommonHeaders()
+		if options.gzip and "gzip" in (self.headers.get("Accept-Encoding") or ""):
+			body = self.server.compressed
+			self.send_header("Content-Encoding", "gzip")
+		if options.chunked:
+			self.send_header("Transfer-Encoding", "chunked")
+			self.end_headers()
+			for i in range(0, len(body), CHUNK_SIZE):
+				chunk = body[i:i+CHUNK_SIZE]
+				self.wfile.write("%x\r\n%s\r\n" % (len(chunk), chunk))
+			self.wfile.write("0\r\n\r\n")
+		else:
+			self.send_header("Content-Length", str(len(body)))
+			self.end_headers()
+			self.wfile.write(body)
+
+	def sendRedirect( self, location ):
+		self.send_response(302)
+		self.send_header("Location", location)
+		self.send_header("Content-Length", "0")
+		self.sendCommonHeaders()
+		self.end_headers()
+
+	def sendCommonHeaders( self ):
+		options = self.server.options
+		for i in range(options.cookies):
+			self.send_header("Set-Cookie", "c%d=%d; Path=/" % (i, int(time.time())))
+		if not options.keepalive:
+			self.send_header("Connection", "close")
+			self.close_connection = 1
+
+class Server(SocketServer.ThreadingMixIn, BaseHTTPServer.HTTPServer):
+
+	daemon_threads      = True
+	request_queue_size  = 128
+	allow_reuse_address = True
+
+	def __init__( self, options, port=0 ):
+		BaseHTTPServer.HTTPServer.__init__(self, ("127.0.0.1", port), Handler)
+		self.options    = options
+		self.body       = makeBody(options.size)
+		self.compressed = compress(self.body)
+
+	def finish_request( self, request, address ):
+		# NOTE: The TLS handshake is done here rather than in 'get_request',
+		# so that it happens in the request thread
+		if self.options.certificate:
+			request = ssl.wrap_socket(request, certfile=self.options.certificate, server_side=True)
+		BaseHTTPServer.HTTPServer.finish_request(self, request, address)
+
+	def handle_error( self, request, address ):
+		# NOTE: Clients closing their connections (which they do without a TLS
+		# close notification) are not errors here
+		if not isinstance(sys.exc_info()[1], (socket.error, ssl.SSLError)):
+			BaseHTTPServer.HTTPServer.handle_error(self, request, address)
+
+def makeCertificate( directory ):
+	"""Generates a self-signed certificate (and its key) for 'localhost' in
+	the given directory, returning the path to the PEM file."""
+	key  = join(directory, "key.pem")
+	cert = join(directory, "cert.pem")
+	null = open(os.devnull, "wb")
+	subprocess.check_call(["openssl", "req", "-x509", "-newkey", "rsa:2048",
+	"-nodes", "-days", "1", "-subj", "/CN=localhost", "-keyout", key, "-out",
+	cert], stdout=null, stderr=null)
+	null.close()
+	path = join(directory, "server.pem")
+	f    = open(path, "wb")
+	f.write(open(key, "rb").read() + open(cert, "rb").read())
+	f.close()
+	return path
+
+def serve( options ):
+	"""Runs the server until it is interrupted, writing its port on the
+	standard output once it is ready. With '--https' and no '--certificate',
+	a self-signed certificate is generated for the time the server runs."""
+	directory = None
+	if options.https and not options.certificate:
+		directory = tempfile.mkdtemp()
+		options.certificate = makeCertificate(directory)
+	try:
+		server = Server(options, options.port)
+		sys.stdout.write("%d\n" % (server.server_address[1]))
+		sys.stdout.flush()
+		try:
+			server.serve_forever()
+		except KeyboardInterrupt:
+			pass
+	finally:
+		if directory: shutil.rmtree(directory, True)
+
+def spawn( args ):
+	"""Starts the server in a new process with the given command line
+	arguments, returning '(process, port)'."""
+	process = subprocess.Popen([sys.executable, abspath(__file__), "--serve", "--port", "0"] + args, stdout=subprocess.PIPE)
+	port    = int(process.stdout.readline())
+	return process, port
+
+# -----------------------------------------------------------------------------
+#
+# CLIENTS
+#
+# -----------------------------------------------------------------------------
+
+def clientClass( name, insecure=False ):
+	"""Returns the 'client.HTTPClient' class for the given client name. When
+	'insecure' is true, certificates are not verified (the server certificate
+	being self-signed)."""
+	if name == "default":
+		if insecure:
+			ssl._create_default_https_context = ssl._create_unverified_context
+		return defaultclient.HTTPClient
+	elif name == "curl":
+		import pycurl
+		from wwwclient import curlclient
+		if not insecure: return curlclient.HTTPClient
+		class HTTPClient(curlclient.HTTPClient):
+			def _prepareRequest( self, url, headers=None ):
+				res = curlclient.HTTPClient._prepareRequest(self, url, headers)
+				res[0].setopt(pycurl.SSL_VERIFYPEER, 0)
+				res[0].setopt(pycurl.SSL_VERIFYHOST, 0)
+				return res
+		return HTTPClient
+	else:
+		raise Exception("Unknown client: %s" % (name))
+
+# -----------------------------------------------------------------------------
+#
+# MEASUREMENT
+#
+# -----------------------------------------------------------------------------
+
+def currentMemory():
+	"""Returns the current resident memory of this process in kilobytes (read
+	from '/proc'), or 'None' when it is not available."""
+	try:
+		f = open("/proc/self/statm")
+		try:
+			pages = int(f.read().split()[1])
+		finally:
+			f.close()
+	except (IOError, ValueError, IndexError):
+		return None
+	return pages * (os.sysconf("SC_PAGE_SIZE") / 1024)
+
+def peakMemory():
+	"""Returns the peak resident memory of this process in kilobytes, or 0
+	when it is not available."""
+	if resource is None: return 0
+	res = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+	# NOTE: Mac OS X gives bytes where Linux gives kilobytes
+	if sys.platform == "darwin": res = res / 1024
+	return res
+
+def memoryGrowth( before ):
+	"""Returns the growth of the peak memory (in kilobytes) since the given
+	'currentMemory()' reading, or 'None' when it is not available.
+
+	NOTE: The peak memory of a process never goes down, so this is only
+	meaningful in a fresh process (see 'forked'): in a process that already
+	grew, only the operations that grow it further would show."""
+	if before is None: return None
+	return max(0, max(peakMemory(), currentMemory()) - before)
+
+def forked( function ):
+	"""Calls the given function in a forked child process and returns its
+	(JSON-serializable) result, so that each measure starts from the memory
+	of this process, and not from the peak reached by the previous ones. The
+	function is simply called when 'fork' is not available."""
+	if not hasattr(os, "fork"): return function()
+	read, write = os.pipe()
+	pid = os.fork()
+	if pid == 0:
+		try:
+			os.close(read)
+			data = json.dumps(function())
+			while data: data = data[os.write(write, data):]
+		finally:
+			os._exit(0)
+	os.close(write)
+	chunks = []
+	while True:
+		chunk = os.read(read, 65536)
+		if not chunk: break
+		chunks.append(chunk)
+	os.close(read)
+	os.waitpid(pid, 0)
+	if not chunks: raise Exception("The measure failed in the child process")
+	return json.loads("".join(chunks))
+
+def run( url, httpClient, requests, concurrency, headers=None ):
+	"""Sends the given number of requests to the server at the given URL,
+	using 'concurrency' threads with a session each. Returns a dictionary with
+	the throughput, latencies (in seconds), errors and peak memory growth (in
+	kilobytes), which is only meaningful when run in a fresh process (see
+	'forked')."""
+	queue     = Queue.Queue()
+	latencies = []
+	errors    = []
+	lock      = threading.Lock()
+	for i in range(requests): queue.put(i)
+	def work():
+		session = browse.Session(url, personality=None, httpClient=httpClient, history=browse.History(1))
+		while True:
+			try:
+				i = queue.get_nowait()
+			except Queue.Empty:
+				break
+			started = time.time()
+			try:
+				session.get("/page/%d" % (i), headers=headers, retry=[0])
+				duration = time.time() - started
+				lock.acquire()
+				try:
+					latencies.append(duration)
+				finally:
+					lock.release()
+			except Exception, e:
+				errors.append(str(e))
+	gc.collect()
+	memory  = currentMemory()
+	threads = [threading.Thread(target=work) for _ in range(concurrency)]
+	started = time.time()
+	for thread in threads: thread.start()
+	for thread in threads: thread.join()
+	elapsed = time.time() - started
+	return {
+		"requests"   : len(latencies),
+		"errors"     : len(errors),
+		"error"      : errors and errors[0] or None,
+		"elapsed"    : elapsed,
+		"throughput" : len(latencies) / elapsed,
+		"p50"        : contracts.percentile(latencies, 50),
+		"p99"        : contracts.percentile(latencies, 99),
+		"memory"     : memoryGrowth(memory),
+	}
+
+def compare( results, baseline, threshold=0.15, out=sys.stdout ):
+	"""Compares the throughput and the memory growth of the given results
+	against the baseline. Returns the list of keys for which the throughput
+	decreased, or the memory increased, by more than the given threshold (as a
+	ratio). Memory increases below 'MEMORY_SLACK' are ignored, as they are
+	within the noise of the measure."""
+	regressions = []
+	out.write("\n%-16s %10s %10s %8s %10s %10s\n" % ("benchmark", "base req/s", "now req/s", "change", "base kb", "now kb"))
+	for key in sorted(results):
+		if key not in baseline: continue
+		before = baseline[key]["throughput"]
+		after  = results[key]["throughput"]
+		change = before and (after - before) / before or 0
+		memory = (baseline[key].get("memory"), results[key].get("memory"))
+		flag   = ""
+		if change < -threshold:
+			flag = " REGRESSION"
+		if None not in memory and memory[1] - memory[0] > max(MEMORY_SLACK, memory[0] * threshold):
+			flag = " REGRESSION (memory)"
+		if flag: regressions.append(key)
+		out.write("%-16s %10.1f %10.1f %+7.1f%% %10d %10d%s\n" % (key, before, after,
+		change * 100, memory[0] or 0, memory[1] or 0, flag))
+	return regressions
+
+# -----------------------------------------------------------------------------
+#
+# MAIN
+#
+# -----------------------------------------------------------------------------
+
+def main( args ):
+	parser = optparse.OptionParser(usage="%prog [options]", description=__doc__.split("\n\n")[0])
+	parser.add_option("-C", "--client",      action="append", default=[], help="Client to benchmark: 'default' or 'curl' (repeatable)")
+	parser.add_option("-c", "--concurrency", action="append", type="int", default=[], help="Number of threads (repeatable, default: 1, 4 and 16)")
+	parser.add_option("-n", "--requests",    type="int",   default=500,   help="Requests per run (default: 500)")
+	parser.add_option("--latency",           type="float", default=0,     help="Server latency in milliseconds")
+	parser.add_option("--size",              type="int",   default=16384, help="Response size in bytes (default: 16384)")
+	parser.add_option("--chunked",           action="store_true", default=False, help="Uses chunked transfer encoding")
+	parser.add_option("--gzip",              action="store_true", default=False, help="Compresses responses (the clients ask for it)")
+	parser.add_option("--redirects",         type="int",   default=0,     help="Number of redirects before each page")
+	parser.add_option("--cookies",           type="int",   default=0,     help="Number of cookies set by each response")
+	parser.add_option("--no-keepalive",      action="store_false", dest="keepalive", default=True, help="Closes the connection after each response")
+	parser.add_option("--https",             action="store_true", default=False, help="Serves over HTTPS with a self-signed certificate")
+	parser.add_option("--save",              default=None,  help="Saves the results as a JSON baseline")
+	parser.add_option("--compare",           default=None,  help="Compares the results with the given JSON baseline")
+	parser.add_option("--threshold",         type="float", default=0.15,  help="Throughput drop (or memory growth) ratio reported as a regression (default: 0.15)")
+	parser.add_option("--serve",             action="store_true", default=False, help="Only runs the server")
+	parser.add_option("--port",              type="int",   default=8000,  help="Port of the server (with --serve)")
+	parser.add_option("--certificate",       default=None,  help="PEM certificate and key of the server (with --serve)")
+	options, _ = parser.parse_args(args)
+	if options.serve:
+		return serve(options)
+	directory = tempfile.mkdtemp()
+	server    = None
+	try:
+		server_args = ["--latency", str(options.latency), "--size", str(options.size),
+		"--redirects", str(options.redirects), "--cookies", str(options.cookies)]
+		for flag in ("chunked", "gzip"):
+			if getattr(options, flag): server_args.append("--" + flag)
+		if not options.keepalive: server_args.append("--no-keepalive")
+		if options.https: server_args += ["--certificate", makeCertificate(directory)]
+		server, port = spawn(server_args)
+		url     = "%s://localhost:%d/" % (options.https and "https" or "http", port)
+		headers = None
+		if options.gzip: headers = [("Accept-Encoding", "gzip")]
+		results = {}
+		sys.stdout.write("%-16s %8s %8s %10s %9s %9s %8s\n" % ("benchmark", "requests", "errors", "req/s", "p50 ms", "p99 ms", "mem kb"))
+		for name in options.client or ["default"]:
+			try:
+				httpClient = clientClass(name, options.https)
+			except ImportError, e:
+				sys.stdout.write("%-16s skipped: %s\n" % (name, e))
+				continue
+			for concurrency in options.concurrency or [1, 4, 16]:
+				key = "%s/%d" % (name, concurrency)
+				res = results[key] = forked(lambda: run(url, httpClient, options.requests, concurrency, headers))
+				sys.stdout.write("%-16s %8d %8d %10.1f %9.2f %9.2f %8d\n" % (key,
+				res["requests"], res["errors"], res["throughput"],
+				(res["p50"] or 0) * 1000, (res["p99"] or 0) * 1000, res["memory"] or 0))
+				if res["error"]: sys.stdout.write("  first error: %s\n" % (res["error"]))
+				sys.stdout.flush()
+	finally:
+		if server: server.terminate()
+		shutil.rmtree(directory, True)
+	if options.save:
+		f = open(options.save, "wb")
+		f.write(json.dumps(results, indent=1, sort_keys=True))
+		f.close()
+	if options.compare:
+		f = open(options.compare, "rb")
+		baseline = json.loads(f.read())
+		f.close()
+		if compare(results, baseline, options.threshold): return 1
+	return 0
+
+if __name__ == "__main__":
+	sys.exit(main(sys.argv[1:]))
+
+# EOF - vim: tw=80 ts=4 sw=4 noet
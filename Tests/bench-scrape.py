@@ -0,0 +1,368 @@
+# Encoding: iso-8859-1
+# -----------------------------------------------------------------------------
+# Project   : WWWClient
+# -----------------------------------------------------------------------------
+# Author    : Sebastien Pierre                               <sebastien@ivy.fr>
+# -----------------------------------------------------------------------------
+# License   : GNU Lesser General Public License
+# -----------------------------------------------------------------------------
+# Creation  : 19-Oct-2026
+# Last mod  : 19-Oct-2026
+# -----------------------------------------------------------------------------
+
+from os.path import join, basename, dirname, abspath
+import sys ;sys.path.append(join(dirname(dirname(abspath(__file__))), "Sources"))
+
+import os, gc, time, random, json, optparse
+from wwwclient import scrape, form
+
+__doc__ = """\
+Offline benchmark of the scraping and form parsing hot paths. Unlike the other
+scripts in this directory, it does not touch the network: documents are either
+generated (with a fixed seed, so that runs are comparable) or loaded from a
+directory of recorded '.html' files.
+
+Each operation is run a number of times and the best and median times are
+reported, along with the peak memory growth and the number of objects allocated
+by the operation. The memory is measured in a forked child process for each
+operation (on systems with '/proc'). Results can be saved as a baseline and
+compared against later, the script exiting with a non-zero status when an
+operation got slower, or used more memory, than the given threshold.
+
+Usage:
+
+--
+	python bench-scrape.py                          # runs the benchmark
+	python bench-scrape.py --save baseline.json     # saves a baseline
+	python bench-scrape.py --compare baseline.json  # compares against it
+	python bench-scrape.py --corpus pages/ --only forms
+--
+"""
+
+try:
+	import resource
+except ImportError:
+	resource = None
+
+# -----------------------------------------------------------------------------
+#
+# CORPORA
+#
+# -----------------------------------------------------------------------------
+
+WORDS = "lorem ipsum dolor sit amet consectetur adipiscing elit sed do eiusmod \
+tempor incididunt ut labore et dolore magna aliqua".split()
+
+# Memory growths (in kilobytes) below which memory changes are not regressions
+MEMORY_SLACK = 512
+
+ENTITIES = ("&amp;", "&lt;", "&gt;", "&eacute;", "&#233;", "&#x20AC;", "&nbsp;")
+
+def words( rng, count ):
+	return " ".join(rng.choice(WORDS) for _ in range(count))
+
+def page( title, body ):
+	return "<html><head><title>%s</title></head><body>%s</body></html>" % (title, body)
+
+def makeTables( rng, scale=1.0, rows=100, cols=6 ):
+	"""Large data tables, with links and entities in the cells."""
+	res = []
+	for t in range(int(5 * scale) or 1):
+		res.append("<table class='data' id='t%d'><tr>" % (t))
+		for c in range(cols):
+			res.append("<th>%s</th>" % (words(rng, 2)))
+		res.append("</tr>")
+		for r in range(rows):
+			res.append("<tr class='%s'>" % (r % 2 and "odd" or "even"))
+			for c in range(cols):
+				if c == 0:
+					res.append("<td><a href='/item/%d/%d'>%s</a></td>" % (t, r, words(rng, 2)))
+				else:
+					res.append("<td>%s %s</td>" % (words(rng, 3), rng.choice(ENTITIES)))
+			res.append("</tr>")
+		res.append("</table>")
+	return page("Tables", "".join(res))
+
+def makeNested( rng, scale=1.0, depth=60 ):
+	"""Deeply nested blocks, as generated by layout-heavy sites."""
+	res = []
+	for b in range(int(10 * scale) or 1):
+		for d in range(depth):
+			res.append("<div class='level%d'><span>%s</span>" % (d, words(rng, 3)))
+		res.append("<a href='/deep/%d'>%s</a>" % (b, words(rng, 2)))
+		res.append("</div>" * depth)
+	return page("Nested", "".join(res))
+
+def makeMalformed( rng, scale=1.0 ):
+	"""Tag soup: unclosed and stray tags, unquoted attributes, comments,
+	scripts and implicit paragraph closing. The snippets are chosen so that
+	unclosed elements are eventually closed by their parents, as otherwise the
+	resulting tree gets deeper than the recursion limit."""
+	snippets = (
+		lambda: "<p>%s" % (words(rng, 8)),
+		lambda: "<table><tr><td width=10 nowrap>%s<td>%s</table>" % (words(rng, 3), words(rng, 1)),
+		lambda: "</span></b>%s" % (words(rng, 4)),
+		lambda: "<a href=/x/%d>%s</a>" % (rng.randint(0, 1000), words(rng, 2)),
+		lambda: "<img src=/i/%d.gif><br>" % (rng.randint(0, 1000)),
+		lambda: "<!-- %s -->" % (words(rng, 5)),
+		lambda: "<script>if (a < b && c > d) { x = '<b>'; }</script>",
+		lambda: "<ul><li>%s<li>%s</ul>" % (words(rng, 2), words(rng, 2)),
+		lambda: "<font color=red size=+1>%s</FONT>" % (words(rng, 3)),
+		lambda: "<div class='a b'  id = \"m%d\" >%s</DIV>" % (rng.randint(0, 1000), words(rng, 2)),
+	)
+	return page("Malformed", "".join(rng.choice(snippets)() for _ in range(int(1500 * scale))))
+
+def makeForms( rng, scale=1.0, fields=25 ):
+	"""Form-heavy pages, with every kind of field and a few orphan inputs."""
+	res = []
+	for f in range(int(40 * scale) or 1):
+		res.append("<form name='f%d' method='post' action='/submit/%d'>" % (f, f))
+		for i in range(fields):
+			kind = i % 6
+			if kind == 0:
+				res.append("<input type='text' name='text%d' value='%s'>" % (i, words(rng, 2)))
+			elif kind == 1:
+				res.append("<input type='checkbox' name='check' value='%d'%s>" % (i, i % 4 and " checked" or ""))
+			elif kind == 2:
+				res.append("<input type='radio' name='radio%d' value='a' checked><input type='radio' name='radio%d' value='b'>" % (i, i))
+			elif kind == 3:
+				res.append("<select name='select%d'>" % (i))
+				for o in range(10):
+					res.append("<option value='%d'%s>%s" % (o, o == 3 and " selected" or "", words(rng, 1)))
+				res.append("</select>")
+			elif kind == 4:
+				res.append("<textarea name='area%d'>%s</textarea>" % (i, words(rng, 20)))
+			else:
+				res.append("<input type='hidden' name='hidden%d' value='%d'>" % (i, rng.randint(0, 1 << 30)))
+		res.append("<input type='submit' name='go' value='Go'><button type='submit' name='alt'>Alt</button></form>")
+		res.append("<p>%s</p><input type='text' name='orphan%d'>" % (words(rng, 10), f))
+	return page("Forms", "".join(res))
+
+GENERATORS = (
+	("tables",    makeTables),
+	("nested",    makeNested),
+	("malformed", makeMalformed),
+	("forms",     makeForms),
+)
+
+def corpora( seed=0, scale=1.0, directory=None ):
+	"""Returns a list of '(name, html)' couples, made of the synthetic documents
+	(whose size is multiplied by 'scale') and of the documents found in the
+	given directory (if any)."""
+	res = []
+	for name, generator in GENERATORS:
+		res.append((name, generator(random.Random(seed), scale)))
+	if directory:
+		for path in sorted(os.listdir(directory)):
+			if not path.endswith(".html") and not path.endswith(".htm"): continue
+			f = open(join(directory, path), "rb")
+			res.append((os.path.splitext(path)[0], f.read()))
+			f.close()
+	return res
+
+# -----------------------------------------------------------------------------
+#
+# OPERATIONS
+#
+# -----------------------------------------------------------------------------
+
+def operations( html ):
+	"""Returns a list of '(name, function)' couples for the benchmarked
+	operations on the given document. Each operation works on the output of
+	the previous stage (computed once, here), so that only the operation itself
+	is measured."""
+	tags = scrape.TagList()
+	tags.fromHTML(html)
+	tree = tags.tagtree()
+	text = scrape.HTML.text(tree)
+	return (
+		("fromHTML",   lambda: scrape.TagList().fromHTML(html)),
+		("tagtree",    lambda: tags.tagtree()),
+		("query",      lambda: (tree.query("a"), tree.query("table tr td"), tree.query("div span"))),
+		("links",      lambda: list(scrape.HTML.links(html))),
+		("text",       lambda: scrape.HTML.text(tree)),
+		("expand",     lambda: scrape.HTML.expand(text)),
+		("parseForms", lambda: form.parseForms(scrape.HTML, tags)),
+	)
+
+# -----------------------------------------------------------------------------
+#
+# MEASUREMENT
+#
+# -----------------------------------------------------------------------------
+
+def currentMemory():
+	"""Returns the current resident memory of this process in kilobytes (read
+	from '/proc'), or 'None' when it is not available."""
+	try:
+		f = open("/proc/self/statm")
+		try:
+			pages = int(f.read().split()[1])
+		finally:
+			f.close()
+	except (IOError, ValueError, IndexError):
+		return None
+	return pages * (os.sysconf("SC_PAGE_SIZE") / 1024)
+
+def peakMemory():
+	"""Returns the peak resident memory of this process in kilobytes, or 0
+	when it is not available."""
+	if resource is None: return 0
+	res = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+	# NOTE: Mac OS X gives bytes where Linux gives kilobytes
+	if sys.platform == "darwin": res = res / 1024
+	return res
+
+def memoryGrowth( before ):
+	"""Returns the growth of the peak memory (in kilobytes) since the given
+	'currentMemory()' reading, or 'None' when it is not available.
+
+	NOTE: The peak memory of a process never goes down, so this is only
+	meaningful in a fresh process (see 'forked'): in a process that already
+	grew, only the operations that grow it further would show."""
+	if before is None: return None
+	return max(0, max(peakMemory(), currentMemory()) - before)
+
+def forked( function ):
+	"""Calls the given function in a forked child process and returns its
+	(JSON-serializable) result, so that each measure starts from the memory
+	of this process, and not from the peak reached by the previous ones. The
+	function is simply called when 'fork' is not available."""
+	if not hasattr(os, "fork"): return function()
+	read, write = os.pipe()
+	pid = os.fork()
+	if pid == 0:
+		try:
+			os.close(read)
+			data = json.dumps(function())
+			while data: data = data[os.write(write, data):]
+		finally:
+			os._exit(0)
+	os.close(write)
+	chunks = []
+	while True:
+		chunk = os.read(read, 65536)
+		if not chunk: break
+		chunks.append(chunk)
+	os.close(read)
+	os.waitpid(pid, 0)
+	if not chunks: raise Exception("The measure failed in the child process")
+	return json.loads("".join(chunks))
+
+def measureMemory( function ):
+	"""Returns the peak memory growth (in kilobytes) of a run of the given
+	function, which is expected to run in a fresh process (see 'forked')."""
+	gc.collect()
+	before = currentMemory()
+	result = function()
+	return memoryGrowth(before)
+
+def measure( function, repeat=5, memory=None ):
+	"""Runs the given function 'repeat' times and returns a dictionary with the
+	best and median times (in seconds), the number of objects allocated by a
+	single run and the given growth of the peak memory (see 'measureMemory')."""
+	times  = []
+	gc.collect()
+	objects = len(gc.get_objects())
+	result  = function()
+	objects = len(gc.get_objects()) - objects
+	del result
+	for i in range(repeat):
+		gc.collect()
+		# NOTE: The collector is disabled so that its pauses do not end up in
+		# the timings
+		gc.disable()
+		try:
+			started = time.time()
+			function()
+			times.append(time.time() - started)
+		finally:
+			gc.enable()
+	times.sort()
+	return {
+		"best"    : times[0],
+		"median"  : times[len(times) / 2],
+		"objects" : max(0, objects),
+		"memory"  : memory,
+	}
+
+def run( documents, only=None, repeat=5, out=sys.stdout ):
+	"""Runs the benchmark on the given documents, printing the results as they
+	come, and returns a dictionary mapping 'corpus/operation' keys to the
+	measures."""
+	results    = {}
+	benchmarks = []
+	for name, html in documents:
+		for operation, function in operations(html):
+			if only and operation not in only and name not in only: continue
+			benchmarks.append((name + "/" + operation, html, function))
+	# NOTE: The memory is measured before the timings, as the memory that the
+	# runs free is kept by this process, and would be reused by the children
+	# without growing them
+	memory = dict((key, forked(lambda: measureMemory(function))) for key, html, function in benchmarks)
+	out.write("%-24s %8s %10s %10s %10s %8s\n" % ("benchmark", "size", "best ms", "median ms", "objects", "mem kb"))
+	for key, html, function in benchmarks:
+		res = results[key] = measure(function, repeat, memory[key])
+		res["size"] = len(html)
+		out.write("%-24s %8d %10.2f %10.2f %10d %8d\n" % (key, len(html) / 1024,
+		res["best"] * 1000, res["median"] * 1000, res["objects"], res["memory"] or 0))
+		out.flush()
+	return results
+
+def compare( results, baseline, threshold=0.15, out=sys.stdout ):
+	"""Compares the given results against the baseline, using the best times
+	and the memory growth. Returns the list of keys for which the time or the
+	memory increased by more than the given threshold (as a ratio). Memory
+	increases below 'MEMORY_SLACK' are ignored, as they are within the noise
+	of the measure."""
+	regressions = []
+	out.write("\n%-24s %10s %10s %8s %10s %10s\n" % ("benchmark", "base ms", "now ms", "change", "base kb", "now kb"))
+	for key in sorted(results):
+		if key not in baseline: continue
+		before = baseline[key]["best"]
+		after  = results[key]["best"]
+		change = before and (after - before) / before or 0
+		memory = (baseline[key].get("memory"), results[key].get("memory"))
+		flag   = ""
+		if change > threshold:
+			flag = " REGRESSION"
+		if None not in memory and memory[1] - memory[0] > max(MEMORY_SLACK, memory[0] * threshold):
+			flag = " REGRESSION (memory)"
+		if flag: regressions.append(key)
+		out.write("%-24s %10.2f %10.2f %+7.1f%% %10d %10d%s\n" % (key, before * 1000, after * 1000,
+		change * 100, memory[0] or 0, memory[1] or 0, flag))
+	return regressions
+
+# -----------------------------------------------------------------------------
+#
+# MAIN
+#
+# -----------------------------------------------------------------------------
+
+def main( args ):
+	parser = optparse.OptionParser(usage="%prog [options]", description=__doc__.split("\n\n")[0])
+	parser.add_option("-r", "--repeat",    type="int",   default=5,    help="Runs per operation (default: 5)")
+	parser.add_option("-s", "--seed",      type="int",   default=0,    help="Seed for the synthetic corpora")
+	parser.add_option("-x", "--scale",     type="float", default=1.0,  help="Size factor for the synthetic corpora")
+	parser.add_option("-c", "--corpus",    default=None, help="Directory of recorded .html documents")
+	parser.add_option("-o", "--only",      action="append", default=[], help="Restricts to the given corpus or operation")
+	parser.add_option("--save",            default=None, help="Saves the results as a JSON baseline")
+	parser.add_option("--compare",         default=None, help="Compares the results with the given JSON baseline")
+	parser.add_option("--threshold",       type="float", default=0.15, help="Slowdown (or memory growth) ratio reported as a regression (default: 0.15)")
+	options, _ = parser.parse_args(args)
+	results = run(corpora(options.seed, options.scale, options.corpus), options.only, options.repeat)
+	if options.save:
+		f = open(options.save, "wb")
+		f.write(json.dumps(results, indent=1, sort_keys=True))
+		f.close()
+	if options.compare:
+		f = open(options.compare, "rb")
+		baseline = json.loads(f.read())
+		f.close()
+		if compare(results, baseline, options.threshold): return 1
+	return 0
+
+if __name__ == "__main__":
+	sys.exit(main(sys.argv[1:]))
+
+# EOF - vim: tw=80 ts=4 sw=4 noet
@@ -0,0 +1,223 @@
+# Encoding: iso-8859-1
+# -----------------------------------------------------------------------------
+# Project   : WWWClient
+# -----------------------------------------------------------------------------
+# Author    : Sebastien Pierre                               <sebastien@ivy.fr>
+# -----------------------------------------------------------------------------
+# License   : GNU Lesser General Public License
+# -----------------------------------------------------------------------------
+# Creation  : 19-Oct-2026
+# Last mod  : 19-Oct-2026
+# -----------------------------------------------------------------------------
+
+from os.path import join, basename, dirname, abspath
+import sys ;sys.path.append(join(dirname(dirname(abspath(__file__))), "Sources"))
+
+import time, threading, subprocess, optparse
+from wwwclient import browse, defaultclient
+
+__doc__ = """\
+Exercises 'browse.SessionPool' the way multithreaded crawlers use it: many
+worker threads (64 by default) running 'SessionPool.map' against a local
+server, with sessions recycled after a number of requests. The checks also
+cover the paths that a crawl rarely takes: the 'acquire' timeout, the
+sessions discarded after an error, the isolation of the cookies of the pooled
+sessions from the seed, and 'close'.
+
+The server is the one of 'bench-http.py', started in a separate process. The
+script prints one line per check and exits with a non-zero status when one of
+them failed.
+
+Usage:
+
+--
+	python session-pool.py                     # default client, 64 threads
+	python session-pool.py -C curl -c 64 -n 5000 --max-requests 20
+	python session-pool.py --latency 10
+--
+"""
+
+# -----------------------------------------------------------------------------
+#
+# SERVER
+#
+# -----------------------------------------------------------------------------
+
+def spawn( args ):
+	"""Starts the 'bench-http.py' server in a new process with the given
+	command line arguments, returning '(process, port)'."""
+	script  = join(dirname(abspath(__file__)), "bench-http.py")
+	process = subprocess.Popen([sys.executable, script, "--serve", "--port", "0"] + args, stdout=subprocess.PIPE)
+	port    = int(process.stdout.readline())
+	return process, port
+
+def clientClass( name ):
+	if name == "default":
+		return defaultclient.HTTPClient
+	elif name == "curl":
+		from wwwclient import curlclient
+		return curlclient.HTTPClient
+	else:
+		raise Exception("Unknown client: %s" % (name))
+
+# -----------------------------------------------------------------------------
+#
+# CHECKS
+#
+# -----------------------------------------------------------------------------
+
+class Checks:
+	"""Records and prints the result of each check."""
+
+	def __init__( self, out=sys.stdout ):
+		self.out    = out
+		self.failed = 0
+
+	def check( self, name, condition, details="" ):
+		if not condition: self.failed += 1
+		self.out.write("%-4s %-36s %s\n" % (condition and "ok" or "FAIL", name, details))
+		self.out.flush()
+		return condition
+
+def checkMap( checks, url, httpClient, threads, requests, maxRequests ):
+	"""Runs 'requests' GETs with 'map' in the given number of threads, and
+	checks the results, the number of sessions used at the same time, and
+	their recycling."""
+	seed   = browse.Session(url, personality=None, httpClient=httpClient)
+	pool   = browse.SessionPool(seed, maxSessions=threads, maxRequests=maxRequests)
+	lock   = threading.Lock()
+	state  = {"busy":0, "maxBusy":0}
+	def fetch( session, i ):
+		with lock:
+			state["busy"]   += 1
+			state["maxBusy"] = max(state["maxBusy"], state["busy"])
+		try:
+			transaction = session.get("/page/%d" % (i))
+			return str(transaction.status()) == "200" and len(transaction.data() or "")
+		finally:
+			with lock: state["busy"] -= 1
+	started = time.time()
+	results = pool.map(fetch, range(requests), threads=threads)
+	elapsed = time.time() - started
+	checks.check("map: all requests succeeded", len(results) == requests and all(results),
+	"%d requests in %.2fs (%.1f req/s)" % (requests, elapsed, requests / elapsed))
+	checks.check("map: sessions in use <= maxSessions", state["maxBusy"] <= threads,
+	"%d at most" % (state["maxBusy"]))
+	checks.check("map: pool size <= maxSessions", pool.size() <= threads,
+	"%d sessions" % (pool.size()))
+	# Each session makes at most 'maxRequests' requests, so at least that many
+	# sessions were created
+	expected = (requests + maxRequests - 1) / maxRequests
+	checks.check("map: sessions recycled", pool.recycled > 0 and pool.created >= expected,
+	"%d created, %d recycled" % (pool.created, pool.recycled))
+	checks.check("map: seed left untouched", len(seed.history()) == 1,
+	"%d transaction(s)" % (len(seed.history())))
+	pool.close()
+	return pool
+
+def checkTimeout( checks, url, httpClient ):
+	pool    = browse.SessionPool(browse.Session(personality=None, httpClient=httpClient), maxSessions=1)
+	session = pool.acquire()
+	started = time.time()
+	try:
+		pool.acquire(timeout=0.2)
+		raised = False
+	except browse.SessionException:
+		raised = True
+	waited  = time.time() - started
+	checks.check("acquire: times out when exhausted", raised and waited >= 0.2, "after %.2fs" % (waited))
+	# A thread waiting for a session gets the released one
+	got = []
+	def wait(): got.append(pool.acquire(timeout=5))
+	thread = threading.Thread(target=wait)
+	thread.start()
+	time.sleep(0.1)
+	pool.release(session)
+	thread.join()
+	checks.check("acquire: waiter gets the released session", got == [session])
+	pool.release(session)
+	pool.close()
+
+def checkDiscard( checks, url, httpClient ):
+	pool = browse.SessionPool(browse.Session(url, personality=None, httpClient=httpClient), maxSessions=4)
+	def fail( session, i ):
+		if i == 3: raise ValueError("failure %d" % (i))
+		return session.get("/page/%d" % (i)).status()
+	try:
+		pool.map(fail, range(8), threads=4)
+		raised = None
+	except ValueError, e:
+		raised = e
+	checks.check("map: raises the first error", raised is not None, str(raised))
+	idle = list(pool._idle)
+	checks.check("discard: failed session not reused", pool.size() == len(idle) and len(idle) < pool.created,
+	"%d created, %d idle" % (pool.created, len(idle)))
+	with pool.session() as session:
+		checks.check("session(): checks a session out", pool._busy == 1)
+	checks.check("session(): releases it", pool._busy == 0 and session in pool._idle)
+	pool.close()
+
+def checkCookies( checks, url, httpClient ):
+	seed = browse.Session(url, personality=None, httpClient=httpClient)
+	seed.cookies().set("seed", "1", "localhost")
+	pool = browse.SessionPool(seed, maxSessions=2)
+	with pool.session() as session:
+		inherited = session.cookies().get("seed") == "1"
+		session.cookies().set("pooled", "1", "localhost")
+	checks.check("cookies: inherited from the seed", inherited)
+	checks.check("cookies: not leaked to the seed", not seed.cookies().has("pooled"))
+	pool.close()
+
+def checkClose( checks, url, httpClient ):
+	pool   = browse.SessionPool(browse.Session(url, personality=None, httpClient=httpClient), maxSessions=2)
+	first  = pool.acquire()
+	second = pool.acquire()
+	pool.release(first)
+	pool.close()
+	try:
+		pool.acquire(timeout=0.1)
+		raised = False
+	except browse.SessionException:
+		raised = True
+	checks.check("close: no more sessions acquired", raised)
+	pool.release(second)
+	checks.check("close: released sessions not kept", pool.size() == 0, "%d sessions" % (pool.size()))
+
+# -----------------------------------------------------------------------------
+#
+# MAIN
+#
+# -----------------------------------------------------------------------------
+
+def main( args ):
+	parser = optparse.OptionParser(usage="%prog [options]", description=__doc__.split("\n\n")[0])
+	parser.add_option("-C", "--client",   action="append", default=[], help="Client to use: 'default' or 'curl' (repeatable)")
+	parser.add_option("-c", "--threads",  type="int",   default=64,   help="Number of threads, and of sessions (default: 64)")
+	parser.add_option("-n", "--requests", type="int",   default=2000, help="Requests made with map (default: 2000)")
+	parser.add_option("--max-requests",   type="int",   default=10,   help="Requests after which sessions are recycled (default: 10)")
+	parser.add_option("--latency",        type="float", default=0,    help="Server latency in milliseconds")
+	options, _ = parser.parse_args(args)
+	server, port = spawn(["--latency", str(options.latency), "--size", "2048", "--cookies", "1"])
+	checks = Checks()
+	try:
+		url = "http://localhost:%d/" % (port)
+		for name in options.client or ["default"]:
+			try:
+				httpClient = clientClass(name)
+			except ImportError, e:
+				sys.stdout.write("%s: skipped: %s\n" % (name, e))
+				continue
+			sys.stdout.write("%s client, %d threads\n" % (name, options.threads))
+			checkMap(checks, url, httpClient, options.threads, options.requests, options.max_requests)
+			checkTimeout(checks, url, httpClient)
+			checkDiscard(checks, url, httpClient)
+			checkCookies(checks, url, httpClient)
+			checkClose(checks, url, httpClient)
+	finally:
+		server.terminate()
+	return checks.failed and 1 or 0
+
+if __name__ == "__main__":
+	sys.exit(main(sys.argv[1:]))
+
+# EOF - vim: tw=80 ts=4 sw=4 noet